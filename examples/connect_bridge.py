@@ -6,13 +6,17 @@ This is a good first script to run when setting up phue.
 
 import json
 import logging
-import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
 from phue2 import Bridge, Light, PhueRegistrationException, console
 
 logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
 
+# Upper bound on saved bridges probed at the same time
+MAX_PARALLEL_CONNECTS = 4
+
 
 def light_formatter(light: Light) -> str:
     """Format a light for display in a table."""
@@ -20,35 +24,60 @@ def light_formatter(light: Light) -> str:
     return f"{light.name:<25} - Status: {status}"
 
 
+def try_bridge(ip_address: str, username: str) -> tuple[Bridge, list[Light]]:
+    """Connect to a saved bridge and fetch its lights to prove it answers."""
+    bridge = Bridge(ip=ip_address, username=username)
+    return bridge, bridge.lights
+
+
 def main():
     """Connect to the Hue bridge and save credentials."""
     console.header("Philips Hue Bridge Setup")
 
-    config_path = os.path.expanduser("~/.python_hue")
-
-    if os.path.exists(config_path):
-        try:
-            with open(config_path) as f:
-                config = json.loads(f.read())
-                if config:
-                    console.info("Found existing Hue bridge configuration.")
-
-                    for ip_address in config:
-                        if "username" in config[ip_address]:
-                            console.info(f"Trying saved bridge at {ip_address}...")
-                            try:
-                                bridge = Bridge(ip=ip_address)
-                                lights = bridge.lights
-                                console.success(f"Connected to bridge at {ip_address}")
-                                console.table(lights, light_formatter)
-                                return
-                            except Exception as e:
-                                console.error(f"Couldn't connect to {ip_address}")
-                                console.info(f"Error details: {e}")
-
-                    console.warning("Couldn't connect with any saved bridges.")
-        except (json.JSONDecodeError, FileNotFoundError):
-            console.error("Config file exists but is invalid.")
+    config_path = Path("~/.python_hue").expanduser()
+
+    try:
+        config = json.loads(config_path.read_text())
+    except FileNotFoundError:
+        config = None
+    except json.JSONDecodeError:
+        console.error("Config file exists but is invalid.")
+        config = None
+
+    if config:
+        console.info("Found existing Hue bridge configuration.")
+
+        saved = {
+            ip: info["username"] for ip, info in config.items() if "username" in info
+        }
+        if saved:
+            # Probe every saved bridge at once and keep the first that answers,
+            # so unreachable ones don't each cost a full connect timeout
+            console.info(f"Trying saved bridges at {', '.join(saved)}...")
+            executor = ThreadPoolExecutor(
+                max_workers=min(len(saved), MAX_PARALLEL_CONNECTS)
+            )
+            futures = {
+                executor.submit(try_bridge, ip, username): ip
+                for ip, username in saved.items()
+            }
+            try:
+                for future in as_completed(futures):
+                    ip_address = futures[future]
+                    try:
+                        _, lights = future.result()
+                    except Exception as e:
+                        console.error(f"Couldn't connect to {ip_address}")
+                        console.info(f"Error details: {e}")
+                        continue
+                    console.success(f"Connected to bridge at {ip_address}")
+                    console.table(lights, light_formatter)
+                    return
+            finally:
+                # Don't wait on the remaining attempts once one has succeeded
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        console.warning("Couldn't connect with any saved bridges.")
 
     console.section("Bridge Connection Setup")
     console.info("You'll need to provide your bridge IP address.")
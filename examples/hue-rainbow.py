@@ -9,10 +9,11 @@ from time import sleep
 
 from phue2 import Bridge, Light
 
-b = Bridge()  # Enter bridge IP here.
+b = Bridge(rate_limit=True)  # Enter bridge IP here.
 
 # Get all the lights as a dictionary by ID
 lights: dict[int, Light] = b.get_light_objects("id")
+light_ids = list(lights)
 
 totalTime = 30  # in seconds
 transitionTime = 1  # in seconds
@@ -20,20 +21,25 @@ transitionTime = 1  # in seconds
 maxHue = 65535  # Maximum value for hue
 hueIncrement = int(maxHue / totalTime)
 
-# Configure initial light settings
-for light_id, light in lights.items():
-    light.transitiontime = int(
-        transitionTime * 10
-    )  # Convert to deciseconds and ensure int
-    light.brightness = 254
-    light.saturation = 254
-    # light.on = True  # Uncomment to turn all lights on
+# Configure initial light settings with a single batched command
+b.set_light(
+    light_ids,
+    {
+        "bri": 254,
+        "sat": 254,
+        "transitiontime": int(transitionTime * 10),  # Convert to deciseconds
+        # "on": True,  # Uncomment to turn all lights on
+    },
+)
 
 # Main loop to cycle through colors
 hue = 0
 while True:
-    for light_id, light in lights.items():
-        light.hue = int(hue)  # Ensure hue is always an integer
+    # One set_light call per tick instead of one property write per light
+    b.set_light(
+        light_ids,
+        {"hue": int(hue), "transitiontime": int(transitionTime * 10)},
+    )
 
     hue = (hue + hueIncrement) % maxHue
 
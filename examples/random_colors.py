@@ -11,8 +11,6 @@ from phue2 import Bridge
 b = Bridge()
 
 if __name__ == "__main__":
-    lights = b.get_light_objects()
-
-    for light in lights:
-        light.brightness = 254
-        light.xy = (random.random(), random.random())
+    # Group 0 contains every light, so one request sets them all.
+    # AllLights(b) from phue2 wraps the same group as an object.
+    b.set_group(0, {"bri": 254, "xy": [random.random(), random.random()]})
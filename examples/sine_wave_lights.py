@@ -17,6 +17,26 @@ BRIGHTNESS_FREQUENCY = 0.2  # Controls how fast the brightness pulses (lower is
 SATURATION = 254  # Max saturation (0-254)
 TRANSITION_TIME = int(UPDATE_INTERVAL * 10)  # Transition time in deciseconds
 
+# Angular frequencies and phase, computed once instead of on every tick
+HUE_OMEGA = 2 * math.pi * HUE_FREQUENCY
+BRI_OMEGA = 2 * math.pi * BRIGHTNESS_FREQUENCY
+BRI_PHASE = math.pi / 4  # Offset brightness relative to hue
+
+# The waves repeat every 1 / (frequency * interval) ticks, so compute one full
+# period of each up front and just index into it while running
+HUE_PERIOD = max(1, round(1 / (HUE_FREQUENCY * UPDATE_INTERVAL)))
+BRI_PERIOD = max(1, round(1 / (BRIGHTNESS_FREQUENCY * UPDATE_INTERVAL)))
+# math.sin ranges from -1 to 1, shifted and scaled to 0-65535 for hue
+HUES = [
+    int((math.sin(tick * UPDATE_INTERVAL * HUE_OMEGA) + 1) * 32767.5)
+    for tick in range(HUE_PERIOD)
+]
+# ...and to 1-254 for brightness
+BRIGHTNESSES = [
+    1 + int((math.sin(tick * UPDATE_INTERVAL * BRI_OMEGA + BRI_PHASE) + 1) * 126.5)
+    for tick in range(BRI_PERIOD)
+]
+
 
 # --- Helper Function ---
 def select_light(bridge: Bridge) -> tuple[int, str]:
@@ -61,7 +81,7 @@ def select_light(bridge: Bridge) -> tuple[int, str]:
 
 # --- Main Script ---
 try:
-    b = Bridge(BRIDGE_IP)
+    b = Bridge(BRIDGE_IP, rate_limit=True)
 except Exception as e:
     print(f"Error connecting to bridge at {BRIDGE_IP}: {e}")
     print(
@@ -78,35 +98,28 @@ light_id, light_name = select_light(b)
 print(f"Connected to bridge. Controlling light: {light_name} (ID: {light_id})")
 print("Press Ctrl+C to exit.")
 
-# Ensure the light is on initially
-b.set_light(light_id, "on", True)
-# Set constant saturation
-b.set_light(light_id, {"sat": SATURATION})
+# Turn the light on and set constant saturation in a single request
+b.set_light(light_id, {"on": True, "sat": SATURATION, "transitiontime": 0})
 
 
 start_time = time.time()
+tick = 0
 
 while True:
     try:
-        current_time = time.time()
-        elapsed_time = current_time - start_time
-
-        # Calculate hue (0-65535) using a sine wave
-        # math.sin ranges from -1 to 1. We shift and scale it.
-        hue_raw = math.sin(elapsed_time * 2 * math.pi * HUE_FREQUENCY)  # -1 to 1
-        hue = int(((hue_raw + 1) / 2) * 65535)  # Scale to 0-65535
+        elapsed_time = time.time() - start_time
 
-        # Calculate brightness (1-254) using a sine wave
-        # We add a small offset phase to brightness relative to hue
-        brightness_raw = math.sin(
-            elapsed_time * 2 * math.pi * BRIGHTNESS_FREQUENCY + math.pi / 4
-        )  # -1 to 1
-        brightness = 1 + int(((brightness_raw + 1) / 2) * 253)  # Scale to 1-254
+        # Look up this tick's hue and brightness in the precomputed waves
+        hue = HUES[tick % HUE_PERIOD]
+        brightness = BRIGHTNESSES[tick % BRI_PERIOD]
+        tick += 1
 
         # Create command dictionary
+        # Saturation rides along so the light can't drift if changed elsewhere
         command = {
             "hue": hue,
             "bri": brightness,
+            "sat": SATURATION,
             "transitiontime": TRANSITION_TIME,
         }
 
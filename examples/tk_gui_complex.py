@@ -16,12 +16,25 @@ from tkinter import (
     Scale,
     Tk,
 )
+from typing import Any
 
 from phue2 import Bridge
 
+# Coalesce slider drags: each light only gets the latest brightness once
+# its slider has been still for this long.
+DEBOUNCE_MS = 100
+pending_sends: dict[int, str] = {}
+
+
+def send_brightness(light_id: int, bri: int) -> None:
+    pending_sends.pop(light_id, None)
+    b.set_light(light_id, {"bri": bri, "transitiontime": 1})
+
 
 def scale_command(x: str, light_id: int) -> None:
-    b.set_light(light_id, {"bri": int(x), "transitiontime": 1})
+    if light_id in pending_sends:
+        root.after_cancel(pending_sends[light_id])
+    pending_sends[light_id] = root.after(DEBOUNCE_MS, send_brightness, light_id, int(x))
 
 
 def button_command(button_var: BooleanVar, light_id: int) -> None:
@@ -38,9 +51,12 @@ root = Tk()
 horizontal_frame = Frame(root)
 horizontal_frame.pack()
 
-lights = b.get_light_objects("id")
+# One GET returns every light's full state, so read it once up front
+# instead of asking the bridge for each widget's value separately.
+lights: dict[str, dict[str, Any]] = b.get_light()
 
-for light_id in lights:
+for key, light in sorted(lights.items(), key=lambda item: int(item[0])):
+    light_id = int(key)
     channel_frame = Frame(horizontal_frame)
     channel_frame.pack(side=LEFT)
 
@@ -52,11 +68,11 @@ for light_id in lights:
         length=200,
         showvalue=False,
     )
-    scale.set(b.get_light(light_id, "bri"))  # type: ignore
+    scale.set(light["state"]["bri"])
     scale.pack()
 
     button_var = BooleanVar()
-    button_var.set(b.get_light(light_id, "on"))
+    button_var.set(light["state"]["on"])
     button = Checkbutton(
         channel_frame,
         variable=button_var,
@@ -65,7 +81,7 @@ for light_id in lights:
     button.pack()
 
     label = Label(channel_frame)
-    label.config(text=b.get_light(light_id, "name"))
+    label.config(text=light["name"])
     label.pack()
 
 root.mainloop()
@@ -6,6 +6,8 @@ There is also a checkbox to toggle the light.
 WARNING: If you have not previously connected to the bridge, run connect_bridge.py first.
 """
 
+import queue
+import threading
 from functools import partial
 from tkinter import (
     LEFT,
@@ -16,6 +18,7 @@ from tkinter import (
     Scale,
     Tk,
 )
+from typing import Any
 
 from phue2 import Bridge
 
@@ -26,23 +29,65 @@ b = Bridge()  # Enter bridge IP here.
 
 root = Tk()
 
-lights = b.get_light_objects("id")
-light_selection: list[int] = []
+# Full state of every light from a single GET, indexed below per widget
+lights: dict[str, dict[str, Any]] = b.get_light()
+light_selection: set[int] = set()
+
+
+# Slider moves are merged into one hue/sat/bri command that is sent once
+# the sliders have been still for this long.
+DEBOUNCE_MS = 100
+pending_state: dict[str, int] = {}
+pending_send: str | None = None
+
+
+# Requests go out on a worker thread so the UI never waits on the bridge.
+# The queue holds a single command: a newer one absorbs any not yet sent.
+commands: queue.Queue[tuple[list[int], dict[str, int]]] = queue.Queue(maxsize=1)
+
+
+def command_worker() -> None:
+    while True:
+        light_ids, command = commands.get()
+        try:
+            b.set_light(light_ids, command)
+        except Exception as e:
+            print(f"Failed to update lights: {e}")
+
+
+def send_state() -> None:
+    global pending_send
+    pending_send = None
+    if light_selection and pending_state:
+        command = dict(pending_state)
+        try:
+            # Fold in a command the worker hasn't taken yet so no slider is lost
+            _, stale = commands.get_nowait()
+            command = {**stale, **command}
+        except queue.Empty:
+            pass
+        commands.put_nowait((sorted(light_selection), command))
+    pending_state.clear()
+
+
+def queue_state(key: str, value: int) -> None:
+    global pending_send
+    pending_state[key] = value
+    if pending_send is not None:
+        root.after_cancel(pending_send)
+    pending_send = root.after(DEBOUNCE_MS, send_state)
 
 
 def hue_command(x: str) -> None:
-    if len(light_selection) > 0:
-        b.set_light(light_selection, "hue", int(x))
+    queue_state("hue", int(x))
 
 
 def sat_command(x: str) -> None:
-    if len(light_selection) > 0:
-        b.set_light(light_selection, "sat", int(x))
+    queue_state("sat", int(x))
 
 
 def bri_command(x: str) -> None:
-    if len(light_selection) > 0:
-        b.set_light(light_selection, "bri", int(x))
+    queue_state("bri", int(x))
 
 
 def button_command(light_id: int, button_state: BooleanVar) -> None:
@@ -50,12 +95,11 @@ def button_command(light_id: int, button_state: BooleanVar) -> None:
 
 
 def select_button_command(light: int, button_state: BooleanVar) -> None:
-    global light_selection
     if button_state.get():
-        light_selection.append(light)
+        light_selection.add(light)
     else:
-        light_selection.remove(light)
-    print(light_selection)
+        light_selection.discard(light)
+    print(sorted(light_selection))
 
 
 slider_frame = Frame(root)
@@ -87,12 +131,12 @@ sat_slider.pack(side=LEFT)
 bri_slider.pack(side=LEFT)
 
 
-for light_id in lights:
+for light_id, light in sorted(lights.items(), key=lambda item: int(item[0])):
     channel_frame = Frame(channels_frame)
     channel_frame.pack(side=LEFT, padx=10)
 
     button_var = BooleanVar()
-    button_var.set(b.get_light(light_id, "on"))
+    button_var.set(light["state"]["on"])
     button = Checkbutton(
         channel_frame,
         variable=button_var,
@@ -113,7 +157,8 @@ for light_id in lights:
     select_button.pack()
 
     label = Label(channel_frame)
-    label.config(text=b.get_light(light_id, "name"))
+    label.config(text=light["name"])
     label.pack()
 
+threading.Thread(target=command_worker, daemon=True).start()
 root.mainloop()
@@ -5,6 +5,8 @@ brightness of the first 3 lights.
 WARNING: If you have not previously connected to the bridge, run connect_bridge.py first.
 """
 
+import queue
+import threading
 from tkinter import (
     CENTER,
     Scale,
@@ -20,9 +22,40 @@ b = Bridge()  # Enter bridge IP here.
 
 b.set_light([1, 2, 3], "on", True)
 
+# Dragging the slider fires a callback for every pixel of motion, so wait
+# until it has been still for this long and only send the latest value.
+DEBOUNCE_MS = 100
+pending_send: str | None = None
+
+# Requests go out on a worker thread so the UI never waits on the bridge.
+# The queue holds a single command: a newer one replaces any not yet sent.
+commands: queue.Queue[dict[str, int]] = queue.Queue(maxsize=1)
+
+
+def command_worker() -> None:
+    while True:
+        command = commands.get()
+        try:
+            b.set_light([1, 2, 3], command)
+        except Exception as e:
+            print(f"Failed to update lights: {e}")
+
+
+def send_brightness(bri: int) -> None:
+    global pending_send
+    pending_send = None
+    try:
+        commands.get_nowait()  # drop a stale command the worker hasn't taken
+    except queue.Empty:
+        pass
+    commands.put_nowait({"bri": bri, "transitiontime": 1})
+
 
 def sel(data: str) -> None:
-    b.set_light([1, 2, 3], {"bri": int(data), "transitiontime": 1})
+    global pending_send
+    if pending_send is not None:
+        root.after_cancel(pending_send)
+    pending_send = root.after(DEBOUNCE_MS, send_brightness, int(data))
 
 
 root = Tk()
@@ -30,4 +63,5 @@ scale = Scale(root, from_=254, to=0, command=sel, length=200)
 scale.set(b.get_light(1, "bri"))  # type: ignore
 scale.pack(anchor=CENTER)
 
+threading.Thread(target=command_worker, daemon=True).start()
 root.mainloop()
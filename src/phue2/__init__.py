@@ -11,18 +11,47 @@ Published under the MIT license
 from .exceptions import PhueException, PhueRegistrationException, PhueRequestTimeout
 from .light import Light
 from .sensor import Sensor, SensorState, SensorConfig
-from .group import Group, AllLights
-from .scene import Scene
-from .bridge import Bridge
-from ._internal.console import console
 
+import importlib
 import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .group import Group, AllLights
+    from .scene import Scene
+    from .bridge import Bridge
+    from .async_bridge import AsyncBridge
+    from ._internal.console import console
 
 logger = logging.getLogger("phue2")
 
+# Heavier pieces are imported on first access (PEP 562), so scripts that only
+# need Light or Sensor don't load httpx, the bridge or the console helpers
+_lazy = {
+    "Bridge": ".bridge",
+    "AsyncBridge": ".async_bridge",
+    "Group": ".group",
+    "AllLights": ".group",
+    "Scene": ".scene",
+    "console": "._internal.console",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy:
+        value = getattr(importlib.import_module(_lazy[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy))
+
 
 __all__ = [
     "Bridge",
+    "AsyncBridge",
     "PhueException",
     "PhueRegistrationException",
     "PhueRequestTimeout",
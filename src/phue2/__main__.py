@@ -1,32 +1,38 @@
 """Command-line interface for the phue library."""
 
-import argparse
-import json
-import logging
 import os
 import sys
+from typing import TYPE_CHECKING
 
-from phue2 import Bridge, PhueRegistrationException
-from phue2._internal.console import (
-    BLUE,
-    BOLD,
-    CYAN,
-    GREEN,
-    MAGENTA,
-    RED,
-    YELLOW,
-    console,
-    styled_text,
-)
+if TYPE_CHECKING:
+    import argparse
+
+    from phue2 import Bridge, Light
 
 DISABLE_STYLING = False
 
+# Set once main() has configured logging for the process
+_LOGGING_CONFIGURED = False
+
+
+def _load_bridge_cls() -> tuple[type["Bridge"], type[Exception]]:
+    """Import the bridge client only once a command actually needs it."""
+    from phue2 import Bridge, PhueRegistrationException
+
+    return Bridge, PhueRegistrationException
+
+
+def _identity(text: str, style: str) -> str:
+    return text
+
 
 def styled_for_cli(text: str, style: str) -> str:
     """Apply styling if enabled, otherwise return plain text.
 
     This helper makes tests less brittle by allowing them to match
-    on the plain text content.
+    on the plain text content. main() calls `configure_styling` before
+    any output, which replaces this with an implementation that skips
+    the per-call check.
 
     Args:
         text: Text to style
@@ -37,39 +43,34 @@ def styled_for_cli(text: str, style: str) -> str:
     """
     if DISABLE_STYLING:
         return text
+    from phue2._internal.console import styled_text
+
     return styled_text(text, style)
 
 
-def parse_args(
-    argv: list[str] | None = None,
-) -> tuple[argparse.ArgumentParser, argparse.Namespace]:
-    """Parse command line arguments.
+def configure_styling(disabled: bool) -> None:
+    """Enable or disable CLI styling.
 
-    Args:
-        argv: Command line arguments (defaults to sys.argv[1:])
+    Rebinds `styled_for_cli` so callers pay no per-call check for the flag.
 
-    Returns:
-        Tuple of (parser, parsed_args)
+    Args:
+        disabled: Whether to emit plain text instead of styled text
     """
-    # Set up argument parser
-    parser = argparse.ArgumentParser(
-        description="Control Philips Hue lights from the command line"
-    )
-    parser.add_argument(
-        "--host", help="IP address of the Hue bridge (auto-detected if not provided)"
-    )
-    parser.add_argument("--config-file-path", help="Path to the config file")
-    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
-    parser.add_argument(
-        "--no-save-config",
-        action="store_false",
-        dest="save_config",
-        help="Do not save connection details to the config file",
-    )
+    global DISABLE_STYLING, styled_for_cli
+    DISABLE_STYLING = disabled
+    if disabled:
+        styled_for_cli = _identity
+    else:
+        from phue2._internal.console import styled_text
 
-    # Command subparsers
-    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+        styled_for_cli = styled_text
+
+
+# Top-level options that consume the following token as their value
+_VALUE_OPTIONS = frozenset({"--host", "--config-file-path"})
 
+
+def _add_list_parser(subparsers: "argparse._SubParsersAction") -> None:
     # List command (with ls alias)
     list_parser = subparsers.add_parser(
         "list", aliases=["ls"], help="List available resources"
@@ -82,14 +83,16 @@ def parse_args(
         help="Resource type to list",
     )
 
-    # Get command
+
+def _add_get_parser(subparsers: "argparse._SubParsersAction") -> None:
     get_parser = subparsers.add_parser("get", help="Get resource details")
     get_parser.add_argument(
         "resource", choices=["light", "group", "scene"], help="Resource type"
     )
     get_parser.add_argument("name", help="Resource name or ID")
 
-    # Set command
+
+def _add_set_parser(subparsers: "argparse._SubParsersAction") -> None:
     set_parser = subparsers.add_parser("set", help="Set resource state")
     set_parser.add_argument(
         "resource", choices=["light", "group"], help="Resource type"
@@ -101,34 +104,151 @@ def parse_args(
     set_parser.add_argument("--hue", type=int, help="Set hue (0-65535)")
     set_parser.add_argument("--sat", type=int, help="Set saturation (0-254)")
 
-    # Parse arguments
-    return parser, parser.parse_args(argv)
 
+_SUBPARSER_BUILDERS = {
+    "list": _add_list_parser,
+    "ls": _add_list_parser,
+    "get": _add_get_parser,
+    "set": _add_set_parser,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Find the subcommand in argv without running the full parser.
+
+    Args:
+        argv: Command line arguments
+
+    Returns:
+        The first known command token, or None if there is none or top-level
+        help was requested before it
+    """
+    tokens = iter(argv)
+    for token in tokens:
+        if token in _SUBPARSER_BUILDERS:
+            return token
+        if token in ("-h", "--help"):
+            return None
+        if token in _VALUE_OPTIONS:
+            next(tokens, None)
+        elif not token.startswith("-"):
+            return None
+    return None
+
+
+def _build_parser(argv: list[str]) -> "argparse.ArgumentParser":
+    """Build the argument parser for argv.
+
+    Only the subparser for the command on the line is built; all of them are
+    built when there is none, so top-level help still lists every command.
+
+    Args:
+        argv: Command line arguments
+
+    Returns:
+        Parser ready to parse argv
+    """
+    import argparse
+
+    # Set up argument parser
+    parser = argparse.ArgumentParser(
+        prog="phue", description="Control Philips Hue lights from the command line"
+    )
+    parser.add_argument(
+        "--host", help="IP address of the Hue bridge (auto-detected if not provided)"
+    )
+    parser.add_argument("--config-file-path", help="Path to the config file")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument(
+        "--no-save-config",
+        action="store_false",
+        dest="save_config",
+        help="Do not save connection details to the config file",
+    )
+
+    # Command subparsers
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+
+    command = _sniff_subcommand(argv)
+    if command is not None:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for build in dict.fromkeys(_SUBPARSER_BUILDERS.values()):
+            build(subparsers)
+
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> "argparse.Namespace":
+    """Parse command line arguments.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Parsed arguments
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    return _build_parser(argv).parse_args(argv)
+
+
+def _print_help() -> None:
+    """Print top-level help listing every command."""
+    _build_parser([]).print_help()
+
+
+def _load_config(config_path: str) -> dict | None:
+    """Read a config file.
+
+    Args:
+        config_path: Path to the config file
+
+    Returns:
+        Parsed config, or None if the file does not exist
+    """
+    from phue2._internal.jsonlib import loads
 
-def get_bridge_from_config(config_path: str | None = None) -> Bridge | None:
+    try:
+        with open(config_path, "rb") as f:
+            return loads(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def get_bridge_from_config(
+    config_path: str | None = None, bridge_cls: type["Bridge"] | None = None
+) -> "Bridge | None":
     """Attempt to create a Bridge using existing config.
 
     Args:
         config_path: Path to config file (uses default if None)
+        bridge_cls: Bridge class to instantiate (imported lazily if None)
 
     Returns:
         Bridge instance if successful, None otherwise
     """
+    from phue2._internal.console import MAGENTA, YELLOW, console
+
     if not config_path:
         config_path = os.path.expanduser("~/.python_hue")
 
-    if not os.path.exists(config_path):
+    try:
+        config = _load_config(config_path)
+    except Exception:
+        config = None
+    if not config:
         return None
 
-    try:
-        with open(config_path) as f:
-            config = json.loads(f.read())
+    if bridge_cls is None:
+        bridge_cls, _ = _load_bridge_cls()
 
+    try:
         # Try each bridge in the config
-        for ip in config:
-            if "username" in config[ip]:
+        for ip, entry in config.items():
+            if "username" in entry:
                 try:
-                    bridge = Bridge(ip=ip, config_file_path=config_path)
+                    bridge = bridge_cls(ip=ip, config_file_path=config_path)
                     console.info(
                         f"{styled_for_cli('Using saved connection to bridge at', MAGENTA)} {styled_for_cli(ip, YELLOW)}"
                     )
@@ -141,6 +261,79 @@ def get_bridge_from_config(config_path: str | None = None) -> Bridge | None:
     return None
 
 
+# Registration attempts when stdin is not a terminal, waiting between them
+# with exponential backoff capped at _MAX_REGISTER_BACKOFF seconds
+_SCRIPTED_REGISTER_ATTEMPTS = 5
+_MAX_REGISTER_BACKOFF = 16.0
+
+
+def _register_attempts(interactive: bool) -> int:
+    """Number of times to try registering before giving up.
+
+    Args:
+        interactive: Whether the user can be prompted between attempts
+
+    Returns:
+        PHUE_MAX_REGISTER_ATTEMPTS (default 10) when interactive, otherwise
+        _SCRIPTED_REGISTER_ATTEMPTS
+    """
+    if not interactive:
+        return _SCRIPTED_REGISTER_ATTEMPTS
+    try:
+        return max(1, int(os.environ.get("PHUE_MAX_REGISTER_ATTEMPTS", "10")))
+    except ValueError:
+        return 10
+
+
+def _as_int_or_none(value: str) -> int | None:
+    """Parse value as an integer ID, or return None if it is not one."""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _resolve_light(bridge: "Bridge", name: str) -> "Light | None":
+    """Find a light by ID first, then by name.
+
+    Args:
+        bridge: Connected bridge
+        name: Light ID or name as typed on the command line
+
+    Returns:
+        The matching light, or None if there is none
+    """
+    lights_by_id = bridge.lights_by_id
+    if not lights_by_id:
+        # The lookup tables are only filled once light objects are loaded
+        bridge.get_light_objects()
+        lights_by_id = bridge.lights_by_id
+
+    light_id = _as_int_or_none(name)
+    light = lights_by_id.get(light_id) if light_id is not None else None
+    return light or bridge.lights_by_name.get(name)
+
+
+def _resolve_group_id(bridge: "Bridge", name: str) -> int | None:
+    """Find a group ID by name first, then by treating name as an ID.
+
+    Args:
+        bridge: Connected bridge
+        name: Group name or ID as typed on the command line
+
+    Returns:
+        The group ID, or None if name matches no group and is not numeric
+    """
+    group_id = None
+    try:
+        group_id = bridge.get_group_id_by_name(name)
+    except Exception:
+        pass
+    if group_id is None:
+        group_id = _as_int_or_none(name)
+    return group_id
+
+
 def main(argv: list[str] | None = None) -> int:
     """Run the phue command-line interface.
 
@@ -150,22 +343,50 @@ def main(argv: list[str] | None = None) -> int:
     Returns:
         Exit code
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
     # Parse arguments
-    parser, args = parse_args(argv)
+    args = parse_args(argv)
+
+    import logging
+
+    from phue2._internal.console import (
+        BLUE,
+        BOLD,
+        CYAN,
+        GREEN,
+        RED,
+        YELLOW,
+        console,
+    )
+
+    configure_styling(DISABLE_STYLING)
+
+    # Combined style for resource headings
+    header = YELLOW + BOLD
 
-    # Configure logging
-    log_level = logging.DEBUG if args.debug else logging.WARNING
-    logging.basicConfig(level=log_level)
+    # Configure logging; like basicConfig itself, only the first call counts
+    global _LOGGING_CONFIGURED
+    if not _LOGGING_CONFIGURED:
+        log_level = logging.DEBUG if args.debug else logging.WARNING
+        logging.basicConfig(level=log_level)
+        _LOGGING_CONFIGURED = True
 
     # Get bridge - first try config if no host specified
     bridge = None
     if not args.host:
-        bridge = get_bridge_from_config(args.config_file_path)
+        Bridge, _ = _load_bridge_cls()
+        bridge = get_bridge_from_config(args.config_file_path, Bridge)
 
     # If not connected and host provided, connect to specified host
     if not bridge and args.host:
         console.info(f"Connecting to bridge at {args.host}...")
-        while True:
+        Bridge, PhueRegistrationException = _load_bridge_cls()
+        interactive = sys.stdin.isatty()
+        attempts = _register_attempts(interactive)
+        backoff = 1.0
+        for attempt in range(1, attempts + 1):
             try:
                 bridge = Bridge(
                     args.host,
@@ -178,11 +399,25 @@ def main(argv: list[str] | None = None) -> int:
                 console.warning(
                     "Link button not pressed. Press the link button on your bridge."
                 )
-                input("Press Enter to try again...")
+                if attempt == attempts:
+                    break
+                if interactive:
+                    input("Press Enter to try again...")
+                else:
+                    import time
+
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, _MAX_REGISTER_BACKOFF)
             except Exception as e:
                 console.error(f"Failed to connect to the bridge: {e}")
                 return 1
 
+        if not bridge:
+            console.error(
+                f"Could not register with the bridge after {attempts} attempts"
+            )
+            return 1
+
     # If we still don't have a bridge but command specified, error out
     if not bridge and args.command:
         console.error(
@@ -195,10 +430,7 @@ def main(argv: list[str] | None = None) -> int:
         console.error(
             "No bridge connection available. Please specify --host or ensure config file exists."
         )
-        args_parser = argparse.ArgumentParser(
-            description="Control Philips Hue lights from the command line"
-        )
-        args_parser.print_help()
+        _print_help()
         return 1
 
     # If no command specified but we have a bridge, show command help
@@ -206,7 +438,7 @@ def main(argv: list[str] | None = None) -> int:
         console.info(
             f"{styled_for_cli('Connected to bridge.', GREEN)} {styled_for_cli('Use a command to continue.', CYAN)}"
         )
-        parser.print_help()
+        _print_help()
         return 0
 
     # Process commands
@@ -217,31 +449,33 @@ def main(argv: list[str] | None = None) -> int:
             console.error("No bridge connection available")
             return 1
 
+        # Build each listing as one buffer and emit it with a single call
+        style = styled_for_cli
         if args.resource == "lights":
             lights = bridge.lights
-            console.info(styled_for_cli(f"LIGHTS ({len(lights)}):", YELLOW + BOLD))
-            for light in lights:
-                status = "ON" if light.on else "OFF"
-                status_styled = styled_for_cli(status, GREEN if light.on else RED)
-                name = str(light.name)
-                name_styled = styled_for_cli(name, CYAN)
-                console.info(f"  {name_styled:<25} {status_styled}")
+            console.info(style(f"LIGHTS ({len(lights)}):", header))
+            lines = [
+                f"  {style(str(light.name), CYAN):<25} "
+                f"{style('ON', GREEN) if light.on else style('OFF', RED)}"
+                for light in lights
+            ]
 
         elif args.resource == "groups":
             groups = bridge.groups
-            console.info(styled_for_cli(f"GROUPS ({len(groups)}):", YELLOW + BOLD))
-            for group in groups:
-                name = str(group.name)
-                name_styled = styled_for_cli(name, CYAN)
-                console.info(f"  {name_styled}")
+            console.info(style(f"GROUPS ({len(groups)}):", header))
+            lines = [f"  {style(str(group.name), CYAN)}" for group in groups]
 
-        elif args.resource == "scenes":
+        else:
             scenes = bridge.scenes
-            console.info(styled_for_cli(f"SCENES ({len(scenes)}):", YELLOW + BOLD))
-            for scene in scenes:
-                name = str(scene.name)
-                name_styled = styled_for_cli(name, CYAN)
-                console.info(f"  {name_styled}")
+            console.info(style(f"SCENES ({len(scenes)}):", header))
+            lines = [f"  {style(str(scene.name), CYAN)}" for scene in scenes]
+
+        if lines and DISABLE_STYLING:
+            # Plain output skips the console's styling entirely
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+        elif lines:
+            console.info("\n".join(lines))
 
     # Handle get command
     elif args.command == "get":
@@ -253,22 +487,12 @@ def main(argv: list[str] | None = None) -> int:
         name = args.name
 
         if resource == "light":
-            # Try by ID first, then by name
-            light = None
-            try:
-                light_id = int(name)
-                light = bridge.lights_by_id.get(light_id)
-            except ValueError:
-                pass
-
-            if not light:
-                light = bridge.lights_by_name.get(name)
-
+            light = _resolve_light(bridge, name)
             if not light:
                 console.error(f"Light '{name}' not found")
                 return 1
 
-            console.info(styled_for_cli(f"LIGHT: {light.name}", YELLOW + BOLD))
+            console.info(styled_for_cli(f"LIGHT: {light.name}", header))
             console.info(
                 f"  {styled_for_cli('Status:', BLUE)}      {styled_for_cli('ON' if light.on else 'OFF', GREEN if light.on else RED)}"
             )
@@ -283,26 +507,14 @@ def main(argv: list[str] | None = None) -> int:
             console.info(f"  {styled_for_cli('Reachable:', BLUE)}   {light.reachable}")
 
         elif resource == "group":
-            # Try to find group by name
-            group_id = None
-            try:
-                group_id = bridge.get_group_id_by_name(name)
-            except Exception:
-                pass
-
-            if group_id is None:
-                try:
-                    group_id = int(name)
-                except ValueError:
-                    group_id = None
-
+            group_id = _resolve_group_id(bridge, name)
             if group_id is None:
                 console.error(f"Group '{name}' not found")
                 return 1
 
             group = bridge.get_group(group_id)
 
-            console.info(styled_for_cli(f"GROUP: {group['name']}", YELLOW + BOLD))
+            console.info(styled_for_cli(f"GROUP: {group['name']}", header))
             console.info(f"  {styled_for_cli('Type:', BLUE)}    {group['type']}")
             console.info(
                 f"  {styled_for_cli('Lights:', BLUE)}  {', '.join(group['lights'])}"
@@ -324,60 +536,43 @@ def main(argv: list[str] | None = None) -> int:
         changed = False
 
         if resource == "light":
-            # Try by ID first, then by name
-            light = None
-            try:
-                light_id = int(name)
-                light = bridge.lights_by_id.get(light_id)
-            except ValueError:
-                pass
-
-            if not light:
-                light = bridge.lights_by_name.get(name)
-
+            light = _resolve_light(bridge, name)
             if not light:
                 console.error(f"Light '{name}' not found")
                 return 1
 
-            # Apply state changes
-            if args.on:
-                light.on = True
-                changed = True
-            elif args.off:
-                light.on = False
-                changed = True
+            # Read the name up front: the write below invalidates the cached
+            # state, and reading it afterwards would cost another request
+            light_name = light.name
 
-            if args.bri is not None:
-                light.brightness = args.bri
-                changed = True
+            # Apply state changes, sent to the bridge as a single command
+            with light.batch():
+                if args.on:
+                    light.on = True
+                    changed = True
+                elif args.off:
+                    light.on = False
+                    changed = True
 
-            if args.hue is not None:
-                light.hue = args.hue
-                changed = True
+                if args.bri is not None:
+                    light.brightness = args.bri
+                    changed = True
 
-            if args.sat is not None:
-                light.saturation = args.sat
-                changed = True
+                if args.hue is not None:
+                    light.hue = args.hue
+                    changed = True
+
+                if args.sat is not None:
+                    light.saturation = args.sat
+                    changed = True
 
             if changed:
-                console.success(f"Updated light '{light.name}'")
+                console.success(f"Updated light '{light_name}'")
             else:
                 console.warning("No changes specified")
 
         elif resource == "group":
-            # Try to find group by name
-            group_id = None
-            try:
-                group_id = bridge.get_group_id_by_name(name)
-            except Exception:
-                pass
-
-            if group_id is None:
-                try:
-                    group_id = int(name)
-                except ValueError:
-                    group_id = None
-
+            group_id = _resolve_group_id(bridge, name)
             if group_id is None:
                 console.error(f"Group '{name}' not found")
                 return 1
@@ -0,0 +1,31 @@
+"""Helpers for sending several bridge requests at once."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def fan_out(fn: Callable[[T], R], items: Iterable[T], max_workers: int) -> list[R]:
+    """Call fn on every item from a thread pool and return results in order.
+
+    A single item is handled on the calling thread, so there's no pool
+    overhead for the common one-light case.
+
+    Args:
+        fn: The function to call for each item
+        items: The items to process
+        max_workers: Upper bound on concurrent calls
+
+    Returns:
+        The results of fn, in the same order as items
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(len(items), max_workers)) as pool:
+        return list(pool.map(fn, items))
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import platform
+import sys
 from collections.abc import Callable
 from typing import TypeVar
 
@@ -20,21 +21,53 @@ CYAN = "\033[36m"
 MAGENTA = "\033[35m"
 
 
-def styled_text(text: str, *styles: str) -> str:
-    """Apply ANSI styles to text if colors are enabled.
+# COLORS_ENABLED can't change after import, so pick the implementation once
+# rather than checking it on every call
+if COLORS_ENABLED:
 
-    Args:
-        text: The text to style
-        *styles: ANSI style codes to apply
+    def styled_text(text: str, *styles: str) -> str:
+        """Apply ANSI styles to text if colors are enabled.
 
-    Returns:
-        The styled text, or the original text if colors are disabled
-    """
-    if not COLORS_ENABLED or not styles:
+        Args:
+            text: The text to style
+            *styles: ANSI style codes to apply
+
+        Returns:
+            The styled text, or the original text if colors are disabled
+        """
+        if not styles:
+            return text
+        return f"{''.join(styles)}{text}{RESET}"
+
+else:
+
+    def styled_text(text: str, *styles: str) -> str:
+        """Apply ANSI styles to text if colors are enabled.
+
+        Args:
+            text: The text to style
+            *styles: ANSI style codes to apply
+
+        Returns:
+            The styled text, or the original text if colors are disabled
+        """
         return text
 
-    style = "".join(styles)
-    return f"{style}{text}{RESET}"
+
+# Style combinations and box-drawing rules used on every line of output,
+# built once instead of re-joined for each call
+_BLUE_BOLD = BLUE + BOLD
+_CYAN_BOLD = CYAN + BOLD
+_GREEN_BOLD = GREEN + BOLD
+_RED_BOLD = RED + BOLD
+_YELLOW_BOLD = YELLOW + BOLD
+
+_HEADER_WIDTH = 50
+_HEADER_TOP = styled_text("╔" + "═" * _HEADER_WIDTH + "╗", _BLUE_BOLD)
+_HEADER_SIDE = styled_text("║", _BLUE_BOLD)
+_HEADER_BOTTOM = styled_text("╚" + "═" * _HEADER_WIDTH + "╝", _BLUE_BOLD)
+_TABLE_TOP = "╭─ Items " + "─" * 40 + "╮"
+_TABLE_BOTTOM = "╰" + "─" * 48 + "╯"
 
 
 def create_printer(style: str) -> Callable[[str], None]:
@@ -53,11 +86,11 @@ def create_printer(style: str) -> Callable[[str], None]:
     return printer
 
 
-print_success = create_printer(f"{GREEN}{BOLD}")
+print_success = create_printer(_GREEN_BOLD)
 print_info = create_printer(CYAN)
-print_error = create_printer(f"{RED}{BOLD}")
-print_warning = create_printer(f"{YELLOW}{BOLD}")
-print_header = create_printer(f"{BLUE}{BOLD}")
+print_error = create_printer(_RED_BOLD)
+print_warning = create_printer(_YELLOW_BOLD)
+print_header = create_printer(_BLUE_BOLD)
 
 
 T = TypeVar("T")
@@ -73,11 +106,11 @@ class TerminalUI:
         Args:
             title: The title to display
         """
-        print(f"\n{styled_text('╔' + '═' * 50 + '╗', BLUE, BOLD)}")
+        print(f"\n{_HEADER_TOP}")
         print(
-            f"{styled_text('║', BLUE, BOLD)} {styled_text(title.center(48), CYAN, BOLD)} {styled_text('║', BLUE, BOLD)}"
+            f"{_HEADER_SIDE} {styled_text(title.center(_HEADER_WIDTH - 2), _CYAN_BOLD)} {_HEADER_SIDE}"
         )
-        print(f"{styled_text('╚' + '═' * 50 + '╝', BLUE, BOLD)}")
+        print(_HEADER_BOTTOM)
 
     @staticmethod
     def section(title: str) -> None:
@@ -86,7 +119,7 @@ class TerminalUI:
         Args:
             title: The title to display
         """
-        print(f"\n{styled_text(f'▓▒░ {title} ░▒▓', YELLOW, BOLD)}")
+        print(f"\n{styled_text(f'▓▒░ {title} ░▒▓', _YELLOW_BOLD)}")
 
     @staticmethod
     def success(message: str) -> None:
@@ -95,7 +128,7 @@ class TerminalUI:
         Args:
             message: The message to display
         """
-        print(f"{styled_text(f'✓ {message}', GREEN, BOLD)}")
+        print(styled_text(f"✓ {message}", _GREEN_BOLD))
 
     @staticmethod
     def info(message: str) -> None:
@@ -104,7 +137,7 @@ class TerminalUI:
         Args:
             message: The message to display
         """
-        print(f"{styled_text(message, CYAN)}")
+        print(styled_text(message, CYAN))
 
     @staticmethod
     def error(message: str) -> None:
@@ -113,7 +146,7 @@ class TerminalUI:
         Args:
             message: The message to display
         """
-        print(f"{styled_text(f'✗ {message}', RED, BOLD)}")
+        print(styled_text(f"✗ {message}", _RED_BOLD))
 
     @staticmethod
     def warning(message: str) -> None:
@@ -122,7 +155,7 @@ class TerminalUI:
         Args:
             message: The message to display
         """
-        print(f"{styled_text(f'⚠ {message}', YELLOW, BOLD)}")
+        print(styled_text(f"⚠ {message}", _YELLOW_BOLD))
 
     @staticmethod
     def box(title: str, messages: list[str], style: str = MAGENTA) -> None:
@@ -133,18 +166,22 @@ class TerminalUI:
             messages: The messages to display inside the box
             style: ANSI style code for the box
         """
-        # Find the longest message to size the box
-        width = max(len(title), max(len(m) for m in messages)) + 4
-
-        # Print the box
-        print(
-            f"{styled_text(f'┌─ {title} ' + '─' * (width - len(title) - 4) + '┐', style, BOLD)}"
+        # Measure each message once and size the box to the longest
+        lengths = [len(m) for m in messages]
+        title_length = len(title)
+        width = max(title_length, max(lengths, default=0)) + 4
+        box_style = style + BOLD
+
+        # Build the whole box and write it in one go
+        lines = [f"┌─ {title} " + "─" * (width - title_length - 4) + "┐"]
+        lines.extend(
+            f"│ {msg}" + " " * (width - length - 2) + "│"
+            for msg, length in zip(messages, lengths)
+        )
+        lines.append("└" + "─" * (width - 2) + "┘")
+        sys.stdout.write(
+            "\n".join(styled_text(line, box_style) for line in lines) + "\n"
         )
-        for msg in messages:
-            print(
-                f"{styled_text(f'│ {msg}' + ' ' * (width - len(msg) - 2) + '│', style, BOLD)}"
-            )
-        print(f"{styled_text('└' + '─' * (width - 2) + '┘', style, BOLD)}")
 
     @staticmethod
     def table(
@@ -161,15 +198,12 @@ class TerminalUI:
             print(styled_text("No items to display", CYAN))
             return
 
-        # Create header and footer
-        print(f"{styled_text('╭─ Items ' + '─' * 40 + '╮', border_style)}")
-
-        # Print each item
-        for item in items:
-            print(f"{styled_text('│', border_style)} {formatter(item)}")
-
-        # Footer
-        print(f"{styled_text('╰' + '─' * 48 + '╯', border_style)}")
+        # Build header, rows and footer, then write them in one go
+        side = styled_text("│", border_style)
+        lines = [styled_text(_TABLE_TOP, border_style)]
+        lines.extend(f"{side} {formatter(item)}" for item in items)
+        lines.append(styled_text(_TABLE_BOTTOM, border_style))
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 console = TerminalUI()
@@ -0,0 +1,55 @@
+"""JSON encoding and decoding that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    from json import loads as _loads
+
+    _dumps = _stdlib_dumps
+else:
+    from orjson import loads as _loads
+
+    def _dumps(obj: Any) -> bytes:
+        # Like json.dumps, encode non-str dict keys (e.g. ints) as strings
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Sent with every encoded request body
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document.
+
+    Both backends raise a `json.JSONDecodeError` subclass on invalid input,
+    so callers can catch that regardless of which one is in use.
+
+    Args:
+        data: Raw JSON, preferably bytes
+
+    Returns:
+        The decoded object
+    """
+    return _loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object as compact UTF-8 JSON.
+
+    Args:
+        obj: The object to encode; non-str dict keys are encoded as strings
+
+    Returns:
+        The encoded document
+    """
+    return _dumps(obj)
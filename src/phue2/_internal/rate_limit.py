@@ -0,0 +1,60 @@
+"""Client-side rate limiting for bridge commands."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """A thread-safe token bucket.
+
+    The Hue bridge silently drops commands sent faster than it can
+    process them (roughly 10 per second for lights, 1 per second for
+    groups), so callers take a token before each command and sleep
+    until one is available.
+
+    Args:
+        capacity: Maximum number of tokens that can accumulate
+        rate: Tokens added per second
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token without waiting for it.
+
+        Callers that can't block (such as asyncio code) reserve a token and
+        then wait out the returned delay themselves.
+
+        Returns:
+            The number of seconds until the reserved token is available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> float:
+        """Take a token, sleeping until one is available.
+
+        The token is reserved under the lock before sleeping, so
+        concurrent callers queue up behind each other instead of
+        racing for the same refill.
+
+        Returns:
+            The number of seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
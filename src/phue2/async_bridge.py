@@ -0,0 +1,380 @@
+"""Asyncio interface for sending many bridge requests concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+import httpx
+
+from phue2._internal.jsonlib import JSON_HEADERS, dumps, loads
+from phue2.bridge import (
+    _BODY_METHODS,
+    _BODYLESS_METHODS,
+    _CONNECT_RETRIES,
+    _POOL_LIMITS,
+    _SINGLE_ID,
+    _STALE_CONNECTION_ERRORS,
+    Bridge,
+    _command_data,
+    _group_command_data,
+    _match_scene,
+    _request_error,
+    _warn_on_error,
+)
+from phue2.light import _light_value
+
+logger = logging.getLogger("phue_modern")
+
+
+class AsyncBridge:
+    """Asyncio front end for a connected Bridge.
+
+    Registration, configuration and the light/sensor objects stay on the
+    wrapped Bridge; this class only replaces the transport, so independent
+    requests can be awaited together instead of one round trip at a time:
+
+        >>> async with AsyncBridge(Bridge("192.168.1.100")) as ab:
+        ...     await ab.set_light([1, 2, 3], "on", True)
+
+    The underlying httpx.AsyncClient belongs to the event loop it is first
+    used on, so use an AsyncBridge from a single loop and close it (or use
+    it as an async context manager) when done.
+
+    Args:
+        bridge: A connected Bridge whose username, timeout and caches are used
+    """
+
+    def __init__(self, bridge: Bridge):
+        self.bridge = bridge
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.bridge.timeout,
+                transport=httpx.AsyncHTTPTransport(
+                    limits=_POOL_LIMITS, retries=_CONNECT_RETRIES
+                ),
+                headers={"Connection": "keep-alive"},
+            )
+        return self._client
+
+    async def request(
+        self,
+        method: str = "GET",
+        address: str | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> Any:
+        """Async counterpart of Bridge.request.
+
+        Args:
+            method: HTTP method (GET, PUT, POST, DELETE)
+            address: API endpoint address
+            data: Optional data to send with the request
+
+        Returns:
+            The parsed JSON response from the API
+
+        Raises:
+            PhueRequestTimeout: If the request times out
+            PhueException: If the request fails
+        """
+        base_url = self.bridge._base_url
+        url = base_url + address if address else base_url
+        client = self._get_client()
+        if method != "GET":
+            self.bridge._reads.clear()
+            self.bridge._writes += 1
+
+        try:
+            if method == "GET":
+                try:
+                    response = await client.request(method, url)
+                except _STALE_CONNECTION_ERRORS as e:
+                    logger.debug("Retrying GET %s after %r", address, e)
+                    response = await client.request(method, url)
+            elif method in _BODYLESS_METHODS:
+                response = await client.request(method, url)
+            elif method in _BODY_METHODS:
+                response = await client.request(
+                    method,
+                    url,
+                    content=None if data is None else dumps(data),
+                    headers=JSON_HEADERS,
+                )
+            else:
+                raise ValueError(f"Unsupported method: {method}")
+
+            logger.debug("%s %s %s", method, address, data)
+            response.raise_for_status()
+            return loads(response.content)
+
+        except Exception as e:
+            raise _request_error(method, url, e)
+
+    async def get_light(
+        self, light_id: int | str | None = None, parameter: str | None = None
+    ) -> Any:
+        """Async counterpart of Bridge.get_light.
+
+        Args:
+            light_id: The ID of the light, or the name of the light, or None to get all lights
+            parameter: The parameter to get, or None to get all parameters
+
+        Returns:
+            The requested parameter value, or a dict of all parameters if parameter is None
+        """
+        bridge = self.bridge
+        if isinstance(light_id, str) and not light_id.isdigit():
+            light_id = (await self._light_ids_by_name()).get(light_id)
+
+        if light_id is None:
+            lights = await self.request("GET", f"{bridge._api_prefix}/lights/")
+            if isinstance(lights, dict):
+                for key, light in lights.items():
+                    bridge._remember_state(int(key), light)
+            return lights
+
+        state = await self.request("GET", f"{bridge._api_prefix}/lights/{light_id}")
+        if isinstance(state, dict):
+            bridge._remember_state(int(light_id), state)
+
+        if parameter is None:
+            return state
+        return _light_value(state, parameter, light_id)
+
+    async def get_all_lights(self) -> dict[str, Any]:
+        """Fetch every light in one request and prime the Light read caches.
+
+        Returns:
+            The full /lights document, keyed by light id
+        """
+        lights = await self.get_light()
+        self.bridge.prime_light_caches(lights)
+        return lights
+
+    async def _light_ids_by_name(self) -> dict[str, int]:
+        return await self._ids_by_name("lights", self.get_light)
+
+    async def _ids_by_name(
+        self, kind: str, fetch_all: Callable[[], Awaitable[Any]]
+    ) -> dict[str, int]:
+        # Shares the Bridge's short-lived name -> id maps
+        ids = self.bridge._ids_by_name.get(kind)
+        if ids is None:
+            docs = await fetch_all()
+            ids = {}
+            if isinstance(docs, dict):
+                for key, doc in docs.items():
+                    if isinstance(doc, dict) and "name" in doc:
+                        ids.setdefault(doc["name"], int(key))
+            self.bridge._ids_by_name.set(kind, ids)
+        return ids
+
+    async def set_light(
+        self,
+        light_id: int | str | list[int] | list[str],
+        parameter: str | dict[str, Any],
+        value: Any = None,
+        transitiontime: int | None = None,
+        force: bool = False,
+    ) -> list[dict[Hashable, Any]]:
+        """Async counterpart of Bridge.set_light.
+
+        The command is sent to every light at once rather than one after
+        another. Rate limiting and no-op skipping work as on the Bridge.
+
+        Args:
+            light_id: A single light ID/name or a list of light IDs/names
+            parameter: Either a parameter name or a dict of parameters to set
+            value: The value to set if parameter is a string
+            transitiontime: Time for this transition to take place (in deciseconds)
+            force: Send the command even if skip_unchanged would skip it
+
+        Returns:
+            A list of responses from the API, in the order the lights were
+            given. Commands skipped as unchanged have no response
+        """
+        bridge = self.bridge
+        data = _command_data(parameter, value, transitiontime)
+        lights: list[Any] = (
+            [light_id] if isinstance(light_id, _SINGLE_ID) else list(light_id)
+        )
+
+        ids_by_name: dict[str, int] = {}
+        if parameter != "name" and any(
+            isinstance(light, str) and not light.isdigit() for light in lights
+        ):
+            ids_by_name = await self._light_ids_by_name()
+
+        async def send(light: int | str) -> Any:
+            converted_light: int | str | None = light
+            if parameter != "name" and isinstance(light, str) and not light.isdigit():
+                converted_light = ids_by_name.get(light)
+                if converted_light is None:
+                    logger.warning("Could not find light with name: %s", light)
+                    return None
+            address, skip = bridge._light_command(
+                converted_light, parameter, data, force
+            )
+            if skip:
+                return None
+            bucket = bridge._lights_bucket
+            if bucket is not None:
+                wait = bucket.reserve()
+                if wait:
+                    await asyncio.sleep(wait)
+            response = await self.request("PUT", address, data)
+            bridge._record_light_response(
+                light, converted_light, parameter, data, response
+            )
+            return response
+
+        responses = await asyncio.gather(*(send(light) for light in lights))
+        result = [response for response in responses if response is not None]
+        logger.debug("%s", result)
+        return result
+
+    async def set_group(
+        self,
+        group_id: int | str | list[int | str],
+        parameter: str | dict[str, Any],
+        value: Any = None,
+        transitiontime: int | None = None,
+    ) -> list[Any]:
+        """Async counterpart of Bridge.set_group.
+
+        The command is sent to every group at once rather than one after
+        another. Group names are resolved with at most one request, and the
+        bridge's group rate limit still applies.
+
+        Args:
+            group_id: A single group ID/name or a list of group IDs/names
+            parameter: Either a parameter name or a dict of parameters to set
+            value: The value to set if parameter is a string
+            transitiontime: Time for this transition to take place (in deciseconds)
+
+        Returns:
+            A list of responses from the API, in the order the groups were given
+        """
+        bridge = self.bridge
+        data = _group_command_data(parameter, value, transitiontime)
+        groups: list[int | str] = (
+            [group_id] if isinstance(group_id, _SINGLE_ID) else list(group_id)
+        )
+
+        ids_by_name: dict[str, int] = {}
+        if any(isinstance(group, str) and not group.isdigit() for group in groups):
+            ids_by_name = await self._ids_by_name(
+                "groups",
+                lambda: self.request("GET", f"{bridge._api_prefix}/groups/"),
+            )
+
+        # Group commands change light state behind the per-light cache
+        bridge._last_state.clear()
+
+        async def send(group: int | str) -> Any:
+            converted_group: int | str | None = group
+            if isinstance(group, str) and not group.isdigit():
+                converted_group = ids_by_name.get(group)
+                if converted_group is None:
+                    logger.error("Group name does not exist")
+                    return None
+            address = bridge._group_command(converted_group, parameter)
+            bucket = bridge._groups_bucket
+            if bucket is not None:
+                wait = bucket.reserve()
+                if wait:
+                    await asyncio.sleep(wait)
+            response = await self.request("PUT", address, data)
+            _warn_on_error(response, f"group {group}")
+            return response
+
+        responses = await asyncio.gather(*(send(group) for group in groups))
+        result = [response for response in responses if response is not None]
+        logger.debug("%s", result)
+        return result
+
+    async def get_scene(self) -> dict[str, Any]:
+        """Async counterpart of Bridge.get_scene.
+
+        Returns:
+            A dictionary of scenes
+        """
+        return await self.request("GET", f"{self.bridge._api_prefix}/scenes")
+
+    async def activate_scene(
+        self, group_id: int, scene_id: str, transition_time: int = 4
+    ) -> Any:
+        """Async counterpart of Bridge.activate_scene.
+
+        Args:
+            group_id: The ID of the group
+            scene_id: The ID of the scene to activate
+            transition_time: Time for the transition to take place (in deciseconds)
+
+        Returns:
+            The response from the API
+        """
+        bridge = self.bridge
+        bridge._last_state.clear()
+        bucket = bridge._groups_bucket
+        if bucket is not None:
+            wait = bucket.reserve()
+            if wait:
+                await asyncio.sleep(wait)
+        return await self.request(
+            "PUT",
+            f"{bridge._api_prefix}/groups/{group_id}/action",
+            {"scene": scene_id, "transitiontime": transition_time},
+        )
+
+    async def run_scene(
+        self, group_name: str, scene_name: str, transition_time: int = 4
+    ) -> bool:
+        """Async counterpart of Bridge.run_scene.
+
+        The group and scene lists are fetched at the same time.
+
+        Args:
+            group_name: The name of the group
+            scene_name: The name of the scene
+            transition_time: The duration of the transition in deciseconds
+
+        Returns:
+            True if a scene was run, False otherwise
+        """
+        groups, scenes = await asyncio.gather(
+            self.request("GET", f"{self.bridge._api_prefix}/groups/"),
+            self.get_scene(),
+        )
+        match = _match_scene(groups, scenes, group_name, scene_name)
+        if match is None:
+            return False
+        await self.activate_scene(match[0], match[1], transition_time)
+        return True
+
+    async def get_sensor(self) -> dict[str, Any]:
+        """Fetch every sensor in one request and refresh all Sensor caches.
+
+        Returns:
+            The full /sensors document, keyed by sensor id
+        """
+        sensors = await self.request("GET", f"{self.bridge._api_prefix}/sensors/")
+        self.bridge.prime_sensor_caches(sensors)
+        return sensors
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> AsyncBridge:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
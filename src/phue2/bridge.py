@@ -1,26 +1,277 @@
 """Bridge class for controlling Philips Hue bridges."""
 
+import functools
 import json
 import logging
 import os
 import platform
-from collections.abc import Hashable, Iterable
-from typing import TYPE_CHECKING, Any, Literal, cast, overload
+import queue
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 import httpx
 
+from phue2._internal.cache import TTLCache
+from phue2._internal.concurrency import fan_out
+from phue2._internal.jsonlib import JSON_HEADERS, dumps, loads
+from phue2._internal.rate_limit import TokenBucket
 from phue2.exceptions import (
     PhueException,
     PhueRegistrationException,
     PhueRequestTimeout,
 )
-from phue2.group import Group
-from phue2.light import Light
-from phue2.scene import Scene
+from phue2.light import Light, _light_value
 from phue2.sensor import Sensor
 
+if TYPE_CHECKING:
+    # Imported where used, since short scripts rarely touch groups or scenes
+    from phue2.group import Group
+    from phue2.scene import Scene
+
 logger = logging.getLogger("phue_modern")
 
+# Command budgets recommended by the Hue API documentation
+_LIGHTS_PER_SECOND = 10
+_GROUPS_PER_SECOND = 1
+
+# How long a light state read from the bridge is trusted to skip no-op writes
+_LIGHT_STATE_TTL = 5.0
+# Light state keys whose writes are skipped when they match the cached state
+_SKIPPABLE_STATE_KEYS = frozenset({"on", "bri"})
+# How long the light list behind get_light_objects is reused before refetching
+_LIGHT_OBJECTS_TTL = 30.0
+# HTTP methods the bridge API accepts besides GET (which request() handles
+# first, with its retry), split by whether they carry a JSON body
+_BODYLESS_METHODS = frozenset({"DELETE"})
+_BODY_METHODS = frozenset({"PUT", "POST"})
+# A bridge is a single small host, so a handful of pooled connections is plenty
+_POOL_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=4)
+# A single light or group id/name, as opposed to a list of them. Kept as a
+# tuple so isinstance checks don't build an `int | str` union on every call
+_SINGLE_ID = (int, str)
+# Connection attempts retried once, for a bridge briefly refusing connections.
+# This only covers connection setup, not a pooled connection dropped later.
+_CONNECT_RETRIES = 1
+# Errors from reusing a keep-alive connection the bridge has since closed;
+# GETs that fail with these are sent once more on a fresh connection
+_STALE_CONNECTION_ERRORS = (httpx.RemoteProtocolError, httpx.ReadError)
+# How long sensor data from a bulk /sensors fetch is reused by new Sensors
+_SENSORS_TTL = 2.0
+# Most requests sent at once by the parallel helpers, matching the pool size
+_PARALLEL_REQUESTS = 8
+# How long group memberships used to route multi-light commands are reused
+_GROUP_MEMBERS_TTL = 30.0
+# How long name -> id maps behind the *_id_by_name lookups are reused
+_NAME_IDS_TTL = 2.0
+# Window in which single-parameter get_light/get_group reads share one GET
+_READ_COALESCE_TTL = 0.2
+
+
+@functools.cache
+def _platform_home() -> tuple[str, bool]:
+    """Platform facts behind the default config path, looked up once.
+
+    Returns:
+        The environment variable holding the home directory, and whether
+        this is an iOS-like device that keeps files under Documents
+    """
+    # Define the home environment variable name based on platform
+    home_env_var = "USERPROFILE" if platform.system() == "Windows" else "HOME"
+    machine = platform.machine()
+    is_ios = "iPad" in machine or "iPhone" in machine or "iPod" in machine
+    return home_env_var, is_ios
+
+
+def _default_config_path() -> str:
+    """Work out where the config file lives when no path is given.
+
+    The home directory is read on every call, so changes to it (as in
+    tests) are honored; only the platform lookups are cached.
+    """
+    home_env_var, is_ios = _platform_home()
+
+    # Get the actual home path using the correct env var name
+    user_home_path = os.getenv(home_env_var)
+    if user_home_path is not None and os.access(user_home_path, os.W_OK):
+        # Use user home path if writable
+        return os.path.join(user_home_path, ".python_hue")
+    if is_ios and user_home_path is not None:
+        # Use Documents directory on iOS-like platforms
+        return os.path.join(user_home_path, "Documents", ".python_hue")
+    # Fallback to current working directory
+    return os.path.join(os.getcwd(), ".python_hue")
+
+
+_DISCOVERY_URL = "https://www.meethue.com/api/nupnp"
+# Shared by every Bridge so retried discovery reuses one TLS connection
+_discovery_client: httpx.Client | None = None
+_discovery_lock = threading.Lock()
+
+
+def _discover_bridges(timeout: float) -> list[dict[str, Any]]:
+    """Ask meethue.com which bridges are on the local network.
+
+    Args:
+        timeout: Request timeout in seconds
+
+    Returns:
+        The discovery documents, each with an "internalipaddress"
+    """
+    global _discovery_client
+    with _discovery_lock:
+        if _discovery_client is None:
+            _discovery_client = httpx.Client()
+        client = _discovery_client
+    response = client.get(_DISCOVERY_URL, timeout=timeout)
+    response.raise_for_status()
+    logger.info("Connected to meethue.com/api/nupnp")
+    return loads(response.content)
+
+
+def _request_error(method: str, url: str, exc: Exception) -> PhueException:
+    """Log a failed bridge request and translate it into a PhueException.
+
+    Must be called from the except block handling exc, so the traceback is
+    logged too.
+    """
+    if isinstance(exc, httpx.TimeoutException):
+        error = f"{method} Request to {url} timed out."
+        logger.exception(error)
+        return PhueRequestTimeout(-1, error)
+    if isinstance(exc, httpx.HTTPStatusError):
+        error = f"{method} Request to {url} failed with status code {exc.response.status_code}"
+        logger.exception(error)
+        return PhueException(exc.response.status_code, error)
+    error = f"{method} Request to {url} failed: {str(exc)}"
+    logger.exception(error)
+    return PhueException(-1, error)
+
+
+def _warn_on_error(response: Any, target: str) -> bool:
+    """Log the bridge's error if a command response starts with one.
+
+    Args:
+        response: The parsed response to a PUT or POST
+        target: What the command was for, e.g. "light 1"
+
+    Returns:
+        True if the response was an error
+    """
+    try:
+        description = response[0]["error"]["description"]
+    except (KeyError, IndexError, TypeError):
+        return False
+    logger.warning(f"ERROR: {description} for {target}")
+    return True
+
+
+def _confirmed_keys(response: Any) -> set[str]:
+    """Collect the attributes a command response reports as set.
+
+    Args:
+        response: The parsed response to a PUT, e.g.
+            [{"success": {"/lights/1/state/on": True}}]
+
+    Returns:
+        The last path segment of every success entry, e.g. {"on"}
+    """
+    keys: set[str] = set()
+    if isinstance(response, list):
+        for item in response:
+            success = item.get("success") if isinstance(item, dict) else None
+            if isinstance(success, dict):
+                keys.update(str(path).rsplit("/", 1)[-1] for path in success)
+    return keys
+
+
+def _command_data(
+    parameter: str | dict[str, Any], value: Any, transitiontime: int | None
+) -> dict[str, Any]:
+    """Build the body of a light or group command from set_* arguments."""
+    if isinstance(parameter, dict):
+        data = parameter
+    else:
+        data = {parameter: value}
+
+    if transitiontime is not None:
+        data["transitiontime"] = int(
+            round(transitiontime)
+        )  # must be int for request format
+    return data
+
+
+def _group_command_data(
+    parameter: str | dict[str, Any], value: Any, transitiontime: int | None
+) -> dict[str, Any]:
+    """Build the body of a group command; member lights are sent as strings."""
+    if parameter == "lights":
+        if isinstance(value, int):
+            value = [str(value)]
+        elif isinstance(value, list):
+            value = list(map(str, value))
+    return _command_data(parameter, value, transitiontime)
+
+
+def _match_scene(
+    groups: dict[str, Any], scenes: dict[str, Any], group_name: str, scene_name: str
+) -> tuple[int, str] | None:
+    """Find the group and scene run_scene should activate.
+
+    If several scenes share the name, the first one whose lights are exactly
+    the group's lights is used.
+
+    Args:
+        groups: The /groups document
+        scenes: The /scenes document
+        group_name: The name of the group
+        scene_name: The name of the scene
+
+    Returns:
+        The group ID and scene ID, or None (after logging why) if there is
+        no single match
+    """
+    named_groups = [
+        (int(key), group)
+        for key, group in groups.items()
+        if group.get("name") == group_name
+    ]
+    named_scenes = [
+        (key, scene) for key, scene in scenes.items() if scene.get("name") == scene_name
+    ]
+
+    if len(named_groups) != 1:
+        logger.warning(f"run_scene: More than 1 group found by name {group_name}")
+        return None
+
+    group_id, group = named_groups[0]
+
+    if len(named_scenes) == 0:
+        logger.warning(f"run_scene: No scene found {scene_name}")
+        return None
+
+    if len(named_scenes) == 1:
+        return group_id, named_scenes[0][0]
+
+    # otherwise, lets figure out if one of the named scenes uses
+    # all the lights of the group
+    # Scenes with a different number of lights are ruled out before building
+    # a set of their ids
+    group_lights = frozenset(map(int, group.get("lights", [])))
+    for scene_id, scene in named_scenes:
+        scene_lights = scene.get("lights", [])
+        if len(scene_lights) == len(group_lights) and group_lights == frozenset(
+            map(int, scene_lights)
+        ):
+            return group_id, scene_id
+
+    logger.warning(
+        f"run_scene: did not find a scene: {scene_name} "
+        f"that shared lights with group {group_name}"
+    )
+    return None
+
 
 class Bridge:
     """Interface to the Hue ZigBee bridge
@@ -47,6 +298,11 @@ class Bridge:
         config_file_path: str | None = None,
         timeout: int = 10,
         save_config: bool = True,
+        rate_limit: bool = False,
+        async_mode: bool = False,
+        prewarm: bool = False,
+        group_commands: bool = False,
+        skip_unchanged: bool = False,
     ):
         """Initialization function.
 
@@ -56,67 +312,134 @@ class Bridge:
             config_file_path: Optional path to the configuration file
             timeout: Request timeout in seconds (default: 10)
             save_config: If False, don't save the config file (default: True)
+            rate_limit: If True, throttle light and group commands to the
+                bridge's documented budget instead of letting it drop them
+                (default: False)
+            async_mode: If True, light and group commands are queued and sent
+                by a background thread so callers never wait on the network.
+                Call flush() to wait for queued commands (default: False)
+            prewarm: If True, open the pooled keep-alive connections in the
+                background after connecting, so the first real requests don't
+                pay for connection setup (default: False)
+            group_commands: If True, a set_light command for exactly the
+                lights of an existing group goes out as one group action,
+                and set_light returns the group's response instead of one
+                response per light. Group memberships are cached for
+                30 seconds (default: False)
+            skip_unchanged: If True, set_light skips "on"/"bri" commands that
+                match the state the bridge reported or was sent in the last
+                few seconds. Changes made elsewhere in that window (a switch,
+                another app) are not seen; pass force=True to set_light to
+                send anyway (default: False)
         """
         # Determine config file path
         if config_file_path is not None:
             self.config_file_path = config_file_path
         else:
-            # Define the home environment variable name based on platform
-            if platform.system() == "Windows":
-                user_home_env_var = "USERPROFILE"
-            else:
-                user_home_env_var = "HOME"
-
-            # Get the actual home path using the correct env var name
-            user_home_path = os.getenv(user_home_env_var)
-            if user_home_path is not None and os.access(user_home_path, os.W_OK):
-                # Use user home path if writable
-                self.config_file_path = os.path.join(user_home_path, ".python_hue")
-            elif (
-                (
-                    "iPad" in platform.machine()
-                    or "iPhone" in platform.machine()
-                    or "iPod" in platform.machine()
-                )
-                and user_home_path is not None  # Check user_home_path exists here too
-            ):
-                # Use Documents directory on iOS-like platforms
-                self.config_file_path = os.path.join(
-                    user_home_path, "Documents", ".python_hue"
-                )
-            else:
-                # Fallback to current working directory
-                self.config_file_path = os.path.join(os.getcwd(), ".python_hue")
+            self.config_file_path = _default_config_path()
 
         self.ip = ip
         self._username = username
         self.timeout = timeout
         self.save_config = save_config
+        self._group_commands = group_commands
+        self._skip_unchanged = skip_unchanged
         self.lights_by_id: dict[int, Light] = {}
         self.lights_by_name: dict[str, Light] = {}
+        self._light_objects_ts = 0.0
         self.sensors_by_id: dict[int, Sensor] = {}
         self.sensors_by_name: dict[str, Sensor] = {}
+        # Sensor documents from the last bulk fetch, by sensor id
+        self._sensors_cache: TTLCache[int, dict[str, Any]] = TTLCache(_SENSORS_TTL)
         self._name: str | None = None
+        self._lights_bucket: TokenBucket | None = None
+        self._groups_bucket: TokenBucket | None = None
+        if rate_limit:
+            self._lights_bucket = TokenBucket(_LIGHTS_PER_SECOND, _LIGHTS_PER_SECOND)
+            self._groups_bucket = TokenBucket(_GROUPS_PER_SECOND, _GROUPS_PER_SECOND)
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        # Last known "state" of each light by id, used to skip no-op writes
+        self._last_state: TTLCache[int, dict[str, Any]] = TTLCache(_LIGHT_STATE_TTL)
+        # Name -> id maps for "lights", "sensors" and "groups"
+        self._ids_by_name: TTLCache[str, dict[str, int]] = TTLCache(_NAME_IDS_TTL)
+        # Group id by exact set of member light ids, for set_light on a list
+        self._groups_by_members: TTLCache[str, dict[frozenset[int], int]] = TTLCache(
+            _GROUP_MEMBERS_TTL
+        )
+        # Recent single-light and single-group documents, by address
+        self._reads: TTLCache[str, Any] = TTLCache(_READ_COALESCE_TTL)
+        # Number of writes sent or queued, so Light objects can tell when
+        # the state they last saw may have changed
+        self._writes = 0
+        self._commands: (
+            queue.Queue[tuple[str, dict[str, Any], TokenBucket | None]] | None
+        ) = None
+        if async_mode:
+            self._commands = queue.Queue()
+            threading.Thread(
+                target=self._send_queued_commands, name="phue2-commands", daemon=True
+            ).start()
 
         self.connect()
 
+        if prewarm:
+            threading.Thread(
+                target=self._prewarm, name="phue2-prewarm", daemon=True
+            ).start()
+
     @property
     def username(self) -> str:
         assert self._username is not None
         return self._username
 
+    @property
+    def ip(self) -> str | None:
+        """The bridge's IP address"""
+        return self._ip
+
+    @ip.setter
+    def ip(self, value: str | None) -> None:
+        self._ip = value
+        # Scheme and host joined onto every request path, built once per ip
+        self._base_url = f"http://{value}"
+
+    @property
+    def _username(self) -> str | None:
+        return self._username_value
+
+    @_username.setter
+    def _username(self, value: str | None) -> None:
+        self._username_value = value
+        # Prefix of every authenticated API path, built once per username
+        self._api_prefix_value = None if value is None else f"/api/{value}"
+
+    @property
+    def _api_prefix(self) -> str:
+        """The "/api/<username>" prefix of authenticated API paths.
+
+        Raises:
+            PhueException: If no username has been set or registered yet
+        """
+        prefix = self._api_prefix_value
+        if prefix is None:
+            raise PhueException(-1, "No username set, register with the bridge first")
+        return prefix
+
     @property
     def name(self) -> str:
-        """Get or set the name of the bridge [string]"""
-        name = self.request("GET", "/api/" + self.username + "/config")["name"]
-        self._name = name
-        return name
+        """Get or set the name of the bridge [string]
+
+        The name is fetched once and reused until set or refresh() is called.
+        """
+        if self._name is None:
+            self._name = self.request("GET", f"{self._api_prefix}/config")["name"]
+        return self._name
 
     @name.setter
     def name(self, value: str) -> None:
+        self.request("PUT", f"{self._api_prefix}/config", {"name": value})
         self._name = value
-        data = {"name": self._name}
-        self.request("PUT", "/api/" + self.username + "/config", data)
 
     def request(
         self,
@@ -138,33 +461,159 @@ class Bridge:
             PhueRequestTimeout: If the request times out
             PhueException: If the request fails
         """
-        url = f"http://{self.ip}{address}"
+        url = self._base_url + address if address else self._base_url
+        client = self._get_client()
+
+        if method != "GET":
+            self._reads.clear()  # any write may change what was read
+            self._writes += 1
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                if method == "GET" or method == "DELETE":
+            if method == "GET":
+                try:
                     response = client.request(method, url)
-                elif method == "PUT" or method == "POST":
-                    response = client.request(method, url, json=data)
-                else:
-                    raise ValueError(f"Unsupported method: {method}")
-
-                logger.debug(f"{method} {address} {str(data)}")
-                response.raise_for_status()
-                return response.json()
-
-        except httpx.TimeoutException:
-            error = f"{method} Request to {url} timed out."
-            logger.exception(error)
-            raise PhueRequestTimeout(-1, error)
-        except httpx.HTTPStatusError as e:
-            error = f"{method} Request to {url} failed with status code {e.response.status_code}"
-            logger.exception(error)
-            raise PhueException(e.response.status_code, error)
+                except _STALE_CONNECTION_ERRORS as e:
+                    logger.debug("Retrying GET %s after %r", address, e)
+                    response = client.request(method, url)
+            elif method in _BODYLESS_METHODS:
+                response = client.request(method, url)
+            elif method in _BODY_METHODS:
+                response = client.request(
+                    method,
+                    url,
+                    content=None if data is None else dumps(data),
+                    headers=JSON_HEADERS,
+                )
+            else:
+                raise ValueError(f"Unsupported method: {method}")
+
+            logger.debug("%s %s %s", method, address, data)
+            response.raise_for_status()
+            return loads(response.content)
+
         except Exception as e:
-            error = f"{method} Request to {url} failed: {str(e)}"
-            logger.exception(error)
-            raise PhueException(-1, error)
+            raise _request_error(method, url, e)
+
+    def _get_coalesced(self, address: str) -> Any:
+        """GET address, reusing a response fetched a moment ago.
+
+        Lets reads of several parameters of the same light or group in a
+        row (e.g. "on" then "bri") share one request. Any write through
+        request() forgets these responses.
+
+        Args:
+            address: API endpoint address
+
+        Returns:
+            The parsed JSON response
+        """
+        response = self._reads.get(address)
+        if response is None:
+            response = self.request("GET", address)
+            self._reads.set(address, response)
+        return response
+
+    def _get_client(self) -> httpx.Client:
+        """Return the shared HTTP client, creating it on first use.
+
+        One client (and its keep-alive connections) is reused for every request.
+        """
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        timeout=self.timeout,
+                        transport=httpx.HTTPTransport(
+                            limits=_POOL_LIMITS, retries=_CONNECT_RETRIES
+                        ),
+                        headers={"Connection": "keep-alive"},
+                    )
+                client = self._client
+        return client
+
+    def _prewarm(self) -> None:
+        """Park idle keep-alive connections in the pool with cheap HEAD requests."""
+        client = self._get_client()
+        url = f"{self._base_url}/"
+
+        def head(_: int) -> None:
+            try:
+                client.head(url)
+            except httpx.HTTPError as e:
+                logger.debug(f"Connection prewarm to {url} failed: {e}")
+
+        # Concurrent requests are needed to open more than one connection
+        keepalive = _POOL_LIMITS.max_keepalive_connections or 1
+        fan_out(head, range(keepalive), _PARALLEL_REQUESTS)
+
+    def _command(
+        self, address: str, data: dict[str, Any], bucket: TokenBucket | None
+    ) -> Any:
+        """PUT a light or group command, or queue it in async mode.
+
+        Args:
+            address: API endpoint address
+            data: The command body
+            bucket: Rate limit bucket to take a token from before sending
+
+        Returns:
+            The parsed JSON response, or None if the command was queued
+        """
+        if self._commands is not None:
+            self._reads.clear()
+            self._writes += 1
+            self._commands.put((address, dict(data), bucket))
+            return None
+        if bucket is not None:
+            bucket.acquire()
+        return self.request("PUT", address, data)
+
+    def _send_queued_commands(self) -> None:
+        """Worker loop that sends queued commands in order (async mode)."""
+        assert self._commands is not None
+        while True:
+            address, data, bucket = self._commands.get()
+            try:
+                if bucket is not None:
+                    bucket.acquire()
+                self.request("PUT", address, data)
+            except PhueException:
+                pass  # request() has already logged the failure
+            finally:
+                self._commands.task_done()
+
+    def flush(self) -> None:
+        """Block until every command queued in async mode has been sent."""
+        if self._commands is not None:
+            self._commands.join()
+
+    def close(self) -> None:
+        """Send any queued commands and close the pooled HTTP connections.
+
+        The bridge can still be used afterwards; the next request opens a
+        new connection pool.
+        """
+        self.flush()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> "Bridge":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Release pooled sockets for bridges that are never closed. Queued
+        # commands are not flushed here: a finalizer must not block on I/O.
+        client = getattr(self, "_client", None)
+        if client is not None:
+            try:
+                client.close()
+            except Exception:
+                pass
 
     def get_ip_address(self, set_result: bool = False) -> str | None:
         """Get the bridge ip address from the meethue.com nupnp api.
@@ -176,26 +625,21 @@ class Bridge:
             The IP address if found, otherwise None
         """
         try:
-            with httpx.Client() as client:
-                response = client.get("https://www.meethue.com/api/nupnp")
-                response.raise_for_status()
-                data = response.json()
+            data = _discover_bridges(self.timeout)
 
-                logger.info("Connected to meethue.com/api/nupnp")
-
-                if not data:
-                    logger.warning(
-                        "No bridges found via meethue.com API. Your bridge may not be connected to the internet "
-                        "or registered with the Hue cloud service. Try specifying the IP address manually."
-                    )
-                    return None
+            if not data:
+                logger.warning(
+                    "No bridges found via meethue.com API. Your bridge may not be connected to the internet "
+                    "or registered with the Hue cloud service. Try specifying the IP address manually."
+                )
+                return None
 
-                ip = str(data[0]["internalipaddress"])
+            ip = str(data[0]["internalipaddress"])
 
-                if ip and set_result:
-                    self.ip = ip
+            if ip and set_result:
+                self.ip = ip
 
-                return ip
+            return ip
         except Exception as e:
             logger.error(
                 f"Error getting IP address: {str(e)}. "
@@ -239,7 +683,7 @@ class Bridge:
                     if self.save_config:
                         with open(self.config_file_path, "w") as f:
                             logger.info(
-                                "Writing configuration file to " + self.config_file_path
+                                f"Writing configuration file to {self.config_file_path}"
                             )
                             f.write(json.dumps({self.ip: line["success"]}))
                             logger.info("Reconnecting to the bridge")
@@ -266,24 +710,24 @@ class Bridge:
         logger.info("Attempting to connect to the bridge...")
         # If the ip and username were provided at class init
         if self.ip is not None and self._username is not None:
-            logger.info("Using ip: " + self.ip)
-            logger.info("Using username: " + self._username)
+            logger.info(f"Using ip: {self.ip}")
+            logger.info(f"Using username: {self._username}")
             return
 
         if self.ip is None or self._username is None:
             try:
-                with open(self.config_file_path) as f:
-                    config = json.loads(f.read())
+                with open(self.config_file_path, "rb") as f:
+                    config = loads(f.read())
                     if self.ip is None:
-                        self.ip = list(config.keys())[0]
-                        logger.info("Using ip from config: " + self.ip)
+                        self.ip = next(iter(config))
+                        logger.info(f"Using ip from config: {self.ip}")
                     else:
-                        logger.info("Using ip: " + self.ip)
+                        logger.info(f"Using ip: {self.ip}")
                     if self._username is None:
                         self._username = config[self.ip]["username"]
-                        logger.info("Using username from config: " + self._username)
+                        logger.info(f"Using username from config: {self._username}")
                     else:
-                        logger.info("Using username: " + self._username)
+                        logger.info(f"Using username: {self._username}")
             except FileNotFoundError:
                 logger.info("Config file not found, will attempt bridge registration")
                 if self.ip is None:
@@ -313,6 +757,33 @@ class Bridge:
                     raise PhueException(-1, error_msg)
                 self.register_app()
 
+    def _id_by_name(
+        self, kind: str, name: str, fetch_all: Callable[[], Any]
+    ) -> int | None:
+        """Look a name up in a briefly cached name -> id map.
+
+        The whole collection is fetched once to build the map, so resolving
+        several names in a row costs a single request.
+
+        Args:
+            kind: Which collection: "lights", "sensors" or "groups"
+            name: The name to look up (case-sensitive)
+            fetch_all: Fetches the whole collection, keyed by id
+
+        Returns:
+            The ID if found, otherwise None
+        """
+        ids = self._ids_by_name.get(kind)
+        if ids is None:
+            docs = fetch_all()
+            ids = {}
+            if isinstance(docs, dict):
+                for key, doc in docs.items():
+                    if isinstance(doc, dict) and "name" in doc:
+                        ids.setdefault(doc["name"], int(key))
+            self._ids_by_name.set(kind, ids)
+        return ids.get(name)
+
     def get_light_id_by_name(self, name: str) -> int | None:
         """Lookup a light id based on string name. Case-sensitive.
 
@@ -322,53 +793,121 @@ class Bridge:
         Returns:
             The light ID if found, otherwise None
         """
-        lights = self.get_light()
-        for light_id in lights:
-            if name == lights[light_id]["name"]:
-                return int(light_id)
-        return None
+        return self._id_by_name("lights", name, self.get_light)
 
     @overload
-    def get_light_objects(self) -> list[Light]: ...
+    def get_light_objects(self, *, refresh: bool = False) -> list[Light]: ...
     @overload
-    def get_light_objects(self, mode: Literal["id"]) -> dict[int, Light]: ...
+    def get_light_objects(
+        self, mode: Literal["id"], *, refresh: bool = False
+    ) -> dict[int, Light]: ...
 
     @overload
-    def get_light_objects(self, mode: Literal["name"]) -> dict[str, Light]: ...
+    def get_light_objects(
+        self, mode: Literal["name"], *, refresh: bool = False
+    ) -> dict[str, Light]: ...
 
     @overload
-    def get_light_objects(self, mode: Literal["list"]) -> list[Light]: ...
+    def get_light_objects(
+        self, mode: Literal["list"], *, refresh: bool = False
+    ) -> list[Light]: ...
 
     def get_light_objects(
-        self, mode: str = "list"
+        self, mode: str = "list", *, refresh: bool = False
     ) -> list[Light] | dict[int, Light] | dict[str, Light]:
         """Returns a collection containing the lights, either by name or id.
 
+        The light list is fetched once and reused for up to 30 seconds, so
+        lights added, removed or renamed on the bridge show up after that.
+
         Args:
             mode: The return format - 'list' (default), 'id', or 'name'
                 'list': return a list of Light objects in order by ID
                 'id': return a dict of Light objects by light ID
                 'name': return a dict of Light objects by light name
+            refresh: Always refetch the light list from the bridge
 
         Returns:
             A collection of Light objects in the requested format
         """
-        if not self.lights_by_id:
-            lights = self.request("GET", "/api/" + self.username + "/lights/")
-            for light in lights:
-                light_id = int(light)
-                self.lights_by_id[light_id] = Light(self, light_id)
-                self.lights_by_name[lights[light]["name"]] = self.lights_by_id[light_id]
+        if (
+            refresh
+            or not self.lights_by_id
+            or time.monotonic() - self._light_objects_ts > _LIGHT_OBJECTS_TTL
+        ):
+            self._load_light_objects()
 
         if mode == "id":
             return self.lights_by_id
         if mode == "name":
             return self.lights_by_name
         if mode == "list":
-            # return lights in sorted id order, dicts have no natural order
-            return [self.lights_by_id[id] for id in sorted(self.lights_by_id)]
+            # lights_by_id is filled in id order by _load_light_objects
+            return list(self.lights_by_id.values())
         raise ValueError(f"Invalid mode: {mode}")
 
+    def _load_light_objects(self) -> None:
+        """Refetch the light list, keeping existing Light objects by id."""
+        lights = self.request("GET", f"{self._api_prefix}/lights/")
+        by_id: dict[int, Light] = {}
+        by_name: dict[str, Light] = {}
+        # Insert in id order so "list" mode can return the values as they are
+        for light in sorted(lights, key=int):
+            light_id = int(light)
+            by_id[light_id] = self.lights_by_id.get(light_id) or Light(self, light_id)
+            by_name[lights[light]["name"]] = by_id[light_id]
+        self.lights_by_id = by_id
+        self.lights_by_name = by_name
+        self._ids_by_name.set(
+            "lights", {name: light.light_id for name, light in by_name.items()}
+        )
+        self._light_objects_ts = time.monotonic()
+        # The full list carries every light's state, so keep it around too
+        self.prime_light_caches(lights)
+
+    def get_all_lights(self) -> dict[str, Any]:
+        """Fetch every light in one request and prime the Light read caches.
+
+        Returns:
+            The full /lights document, keyed by light id
+        """
+        lights = self.get_light()
+        self.prime_light_caches(lights)
+        return lights
+
+    def prime_light_caches(self, lights: dict[str, Any]) -> None:
+        """Fill known Light objects' read caches from a /lights document.
+
+        Args:
+            lights: Light documents keyed by light id, as returned by get_light()
+        """
+        for key, light in lights.items():
+            self._remember_state(int(key), light)
+            light_obj = self.lights_by_id.get(int(key))
+            if light_obj is not None:
+                light_obj._populate_from_dict(light)
+
+    def set_lights_parallel(
+        self, updates: Iterable[tuple[int | str, dict[str, Any]]]
+    ) -> list[Any]:
+        """Send a different command to each of several lights concurrently.
+
+        Commands still go through set_light, so rate limiting, no-op
+        skipping and async mode all apply.
+
+        Args:
+            updates: Pairs of light ID/name and the state to set on it
+
+        Returns:
+            The API response for each update, in the order given
+        """
+        results = fan_out(
+            lambda update: self.set_light(update[0], update[1]),
+            updates,
+            _PARALLEL_REQUESTS,
+        )
+        return [response for result in results for response in result]
+
     def get_sensor_id_by_name(self, name: str) -> int | None:
         """Lookup a sensor id based on string name. Case-sensitive.
 
@@ -378,11 +917,34 @@ class Bridge:
         Returns:
             The sensor ID if found, otherwise None
         """
+        return self._id_by_name("sensors", name, self.get_sensor)
+
+    def get_all_sensors(self) -> dict[str, Any]:
+        """Fetch every sensor in one request and refresh all Sensor caches.
+
+        Returns:
+            The full /sensors document, keyed by sensor id
+        """
         sensors = self.get_sensor()
-        for sensor_id in sensors:
-            if name == sensors[sensor_id]["name"]:
-                return int(sensor_id)
-        return None
+        self.prime_sensor_caches(sensors)
+        return sensors
+
+    def prime_sensor_caches(self, sensors: dict[str, Any]) -> None:
+        """Fill known Sensor objects' caches from a /sensors document.
+
+        Sensors created later pick their data up from the same document
+        for a couple of seconds instead of fetching it again.
+
+        Args:
+            sensors: Sensor documents keyed by sensor id, as returned by get_sensor()
+        """
+        for key, data in sensors.items():
+            if not isinstance(data, dict):
+                continue
+            self._sensors_cache.set(int(key), data)
+            sensor = self.sensors_by_id.get(int(key))
+            if sensor is not None:
+                sensor._populate_from_dict(data)
 
     @overload
     def get_sensor_objects(self) -> list[Sensor]: ...
@@ -410,13 +972,16 @@ class Bridge:
             A collection of Sensor objects in the requested format
         """
         if not self.sensors_by_id:
-            sensors = self.request("GET", "/api/" + self.username + "/sensors/")
+            sensors = self.request("GET", f"{self._api_prefix}/sensors/")
             for sensor in sensors:
                 sensor_id = int(sensor)
                 self.sensors_by_id[sensor_id] = Sensor(self, sensor_id)
                 self.sensors_by_name[sensors[sensor]["name"]] = self.sensors_by_id[
                     sensor_id
                 ]
+            # The list already holds every sensor's data, so no sensor needs
+            # its own fetch on first access
+            self.prime_sensor_caches(sensors)
 
         if mode == "id":
             return self.sensors_by_id
@@ -438,8 +1003,7 @@ class Bridge:
         Raises:
             KeyError: If the key is not a valid light ID or name
         """
-        if not self.lights_by_id:
-            self.get_light_objects("id")
+        self.get_light_objects("id")
 
         try:
             if isinstance(key, int):
@@ -448,8 +1012,7 @@ class Bridge:
                 return self.lights_by_name[key]
         except KeyError:
             raise KeyError(
-                "Not a valid key (integer index starting with 1, or light name): "
-                + str(key)
+                f"Not a valid key (integer index starting with 1, or light name): {key}"
             )
 
     @property
@@ -459,7 +1022,7 @@ class Bridge:
 
     def get_api(self) -> dict[str, Any]:
         """Returns the full api dictionary"""
-        return self.request("GET", "/api/" + self.username)
+        return self.request("GET", self._api_prefix)
 
     def get_light(
         self, light_id: int | str | None = None, parameter: str | None = None
@@ -480,23 +1043,48 @@ class Bridge:
             light_id = self.get_light_id_by_name(light_id)
 
         if light_id is None:
-            return self.request("GET", "/api/" + self.username + "/lights/")
+            lights = self.request("GET", f"{self._api_prefix}/lights/")
+            if isinstance(lights, dict):
+                for key, light in lights.items():
+                    self._remember_state(int(key), light)
+            return lights
 
-        state = self.request(
-            "GET", "/api/" + self.username + "/lights/" + str(light_id)
-        )
+        address = f"{self._api_prefix}/lights/{light_id}"
+        if parameter is None:
+            state = self.request("GET", address)
+        else:
+            state = self._get_coalesced(address)
+        if isinstance(state, dict):
+            self._remember_state(int(light_id), state)
 
         if parameter is None:
             return state
-        if parameter in ["name", "type", "uniqueid", "swversion"]:
-            return state[parameter]
-        else:
-            try:
-                return state["state"][parameter]
-            except KeyError:
-                raise KeyError(
-                    f"Not a valid key, parameter {parameter} is not associated with light {light_id}"
-                )
+        return _light_value(state, parameter, light_id)
+
+    def _remember_state(self, light_id: int, light: dict[str, Any]) -> None:
+        """Cache the "state" object from a light document fetched from the bridge."""
+        if isinstance(light.get("state"), dict):
+            self._last_state.set(light_id, dict(light["state"]))
+
+    def _is_noop(self, light_id: int, data: dict[str, Any]) -> bool:
+        """Check whether a light command would not change the cached state."""
+        if not self._skip_unchanged:
+            return False
+        changes = {k: v for k, v in data.items() if k != "transitiontime"}
+        if not changes or not changes.keys() <= _SKIPPABLE_STATE_KEYS:
+            return False
+        state = self._last_state.get(light_id)
+        return state is not None and all(
+            k in state and state[k] == v for k, v in changes.items()
+        )
+
+    def refresh(self) -> None:
+        """Forget cached bridge state so the next access refetches it."""
+        self._last_state.clear()
+        self._name = None
+        self._ids_by_name.clear()
+        self._groups_by_members.clear()
+        self._light_objects_ts = 0.0
 
     def set_light(
         self,
@@ -504,6 +1092,7 @@ class Bridge:
         parameter: str | dict[str, Any],
         value: Any = None,
         transitiontime: int | None = None,
+        force: bool = False,
     ) -> list[dict[Hashable, Any]]:
         """Adjust properties of one or more lights.
 
@@ -514,69 +1103,201 @@ class Bridge:
             transitiontime: Time for this transition to take place (in deciseconds)
                             Note that transitiontime only applies to this light command,
                             it is not saved as a setting for future use.
+            force: Send the command even if skip_unchanged would skip it
 
         Returns:
-            A list of responses from the API
+            A list of responses from the API. Commands skipped as unchanged
+            have no response, and neither do commands queued in async mode
         """
-        if isinstance(parameter, dict):
-            data = parameter
-        else:
-            data = {parameter: value}
-
-        if transitiontime is not None:
-            data["transitiontime"] = int(
-                round(transitiontime)
-            )  # must be int for request format
+        data = _command_data(parameter, value, transitiontime)
 
-        light_id_array: list[Any] = []
-        if isinstance(light_id, int | str):
-            light_id_array = [light_id]
+        lights: list[int | str] = (
+            [light_id] if isinstance(light_id, _SINGLE_ID) else list(light_id)
+        )
+        converted: list[int | str | None]
+        if parameter == "name":
+            # Renames address lights by the key given; names are about to change
+            converted = list(lights)
+            self._ids_by_name.pop("lights")
         else:
-            light_id_array = light_id
+            converted = list(self._resolve_light_ids(lights))
+            if self._group_commands and len(lights) > 1:
+                grouped = self._set_lights_via_group(converted, data, force)
+                if grouped is not None:
+                    return grouped
 
         result: list[dict[Hashable, Any]] = []
-        for light in light_id_array:
-            logger.debug(str(data))
-            if parameter == "name":
-                result.append(
-                    self.request(
-                        "PUT",
-                        "/api/" + self.username + "/lights/" + str(light),
-                        data,
-                    )
-                )
-            else:
-                if isinstance(light, str) and not light.isdigit():
-                    converted_light = self.get_light_id_by_name(light)
-                    if converted_light is None:
-                        logger.warning(f"Could not find light with name: {light}")
-                        continue
-                else:
-                    converted_light = light
-                result.append(
-                    self.request(
-                        "PUT",
-                        "/api/"
-                        + self.username
-                        + "/lights/"
-                        + str(converted_light)
-                        + "/state",
-                        data,
-                    )
-                )
-            if (
-                result
-                and isinstance(result[-1], list)
-                and result[-1]
-                and "error" in result[-1][0]
-            ):
-                logger.warning(
-                    f"ERROR: {result[-1][0]['error']['description']} for light {light}"
-                )
+        for light, converted_light in zip(lights, converted):
+            logger.debug("%s", data)
+            if converted_light is None:
+                logger.warning(f"Could not find light with name: {light}")
+                continue
+            address, skip = self._light_command(converted_light, parameter, data, force)
+            if skip:
+                continue
+            response = self._command(address, data, self._lights_bucket)
+            if response is None:
+                # Queued for the async worker; the outcome is unknown until
+                # it runs, so the cached state can no longer skip commands
+                if parameter != "name":
+                    self._last_state.pop(int(converted_light))
+                continue
+            result.append(response)
+            self._record_light_response(
+                light, converted_light, parameter, data, response
+            )
 
         logger.debug(result)
         return result
 
+    def _resolve_light_ids(self, lights: list[int | str]) -> list[int | None]:
+        """Turn light IDs and names into numeric IDs.
+
+        Names are looked up in the cached name -> id map, so any number of
+        names costs at most one request.
+
+        Args:
+            lights: Light IDs or names
+
+        Returns:
+            The numeric ID of each light, or None for a name no light has
+        """
+        return [
+            int(light)
+            if isinstance(light, int) or light.isdigit()
+            else self.get_light_id_by_name(light)
+            for light in lights
+        ]
+
+    def _group_for_lights(self, light_ids: frozenset[int]) -> int | None:
+        """Find a group whose members are exactly the given lights.
+
+        Args:
+            light_ids: Numeric light IDs
+
+        Returns:
+            The group ID, or None if no group has exactly those members
+        """
+        groups_by_members = self._groups_by_members.get("groups")
+        if groups_by_members is None:
+            groups = self.get_group()
+            groups_by_members = {}
+            if isinstance(groups, dict):
+                for key, group in groups.items():
+                    members = group.get("lights") if isinstance(group, dict) else None
+                    if members:
+                        groups_by_members.setdefault(
+                            frozenset(int(light) for light in members), int(key)
+                        )
+            self._groups_by_members.set("groups", groups_by_members)
+        return groups_by_members.get(light_ids)
+
+    def _set_lights_via_group(
+        self,
+        resolved: list[int | str | None],
+        data: dict[str, Any],
+        force: bool = False,
+    ) -> list[dict[Hashable, Any]] | None:
+        """Send one command to several lights as a single group action.
+
+        Only applies when an existing group has exactly these lights as
+        members.
+
+        Args:
+            resolved: The numeric ID of each light, None for unknown names
+            data: The command body
+            force: Send the command even if it would not change the cached state
+
+        Returns:
+            A list holding the group's response, or None if the command
+            must be sent light by light instead
+        """
+        if None in resolved:
+            return None
+        light_ids = [int(light_id) for light_id in resolved if light_id is not None]
+        if len(set(light_ids)) != len(light_ids):
+            return None
+        if not force and all(self._is_noop(light_id, data) for light_id in light_ids):
+            return None  # the per-light path answers these without any request
+
+        group_id = self._group_for_lights(frozenset(light_ids))
+        if group_id is None:
+            return None
+
+        logger.debug("Sending command for lights %s to group %s", light_ids, group_id)
+        response = self._command(
+            f"{self._api_prefix}/groups/{group_id}/action", data, self._groups_bucket
+        )
+        # Like set_group: the group's members may have changed since they
+        # were cached, so any light's cached state may now be wrong
+        self._last_state.clear()
+        if response is None:
+            return []  # queued for the async worker
+        if not isinstance(response, list) or any("error" in r for r in response):
+            logger.debug(f"Group {group_id} command failed, sending per light")
+            self._groups_by_members.clear()
+            return None
+        return [response]
+
+    def _light_command(
+        self,
+        light_id: int | str,
+        parameter: str | dict[str, Any],
+        data: dict[str, Any],
+        force: bool = False,
+    ) -> tuple[str, bool]:
+        """Work out where a light command goes and whether it can be skipped.
+
+        Args:
+            light_id: Numeric light ID (or the raw key when renaming)
+            parameter: The parameter passed to set_light
+            data: The command body
+            force: Never skip the command
+
+        Returns:
+            The command's address, and whether the command would not change
+            the cached state and should not be sent
+        """
+        base = f"{self._api_prefix}/lights/{light_id}"
+        if parameter == "name":
+            return base, False
+        if not force and self._is_noop(int(light_id), data):
+            logger.debug("Skipping no-op command for light %s", light_id)
+            return f"{base}/state", True
+        return f"{base}/state", False
+
+    def _record_light_response(
+        self,
+        light: int | str,
+        light_id: int | str,
+        parameter: str | dict[str, Any],
+        data: dict[str, Any],
+        response: Any,
+    ) -> None:
+        """Log errors in a light command response and update the cached state.
+
+        Only attributes the bridge reports as set are cached; a rejected
+        value must not make a retry look like a no-op.
+
+        Args:
+            light: The light as the caller named it
+            light_id: Numeric light ID the command was sent to
+            parameter: The parameter passed to set_light
+            data: The command body that was sent
+            response: The bridge's response
+        """
+        _warn_on_error(response, f"light {light}")
+        if parameter == "name":
+            return
+        state = self._last_state.get(int(light_id))
+        if state is not None:
+            confirmed = _confirmed_keys(response)
+            state.update(
+                (k, v)
+                for k, v in data.items()
+                if k in confirmed and k != "transitiontime"
+            )
+
     # Sensors #####
     @property
     def sensors(self) -> list[Sensor]:
@@ -627,11 +1348,12 @@ class Bridge:
         if config:
             data["config"] = config
 
-        result = self.request("POST", "/api/" + self.username + "/sensors/", data)
+        result = self.request("POST", f"{self._api_prefix}/sensors/", data)
 
         if "success" in result[0]:
             new_id = int(result[0]["success"]["id"])
             logger.debug(f"Created sensor with ID {new_id}")
+            self._ids_by_name.pop("sensors")
             new_sensor = Sensor(self, new_id)
             self.sensors_by_id[new_id] = new_sensor
             self.sensors_by_name[name] = new_sensor
@@ -657,11 +1379,9 @@ class Bridge:
             sensor_id = self.get_sensor_id_by_name(sensor_id)
 
         if sensor_id is None:
-            return self.request("GET", "/api/" + self.username + "/sensors/")
+            return self.request("GET", f"{self._api_prefix}/sensors/")
 
-        data = self.request(
-            "GET", "/api/" + self.username + "/sensors/" + str(sensor_id)
-        )
+        data = self.request("GET", f"{self._api_prefix}/sensors/{sensor_id}")
 
         if isinstance(data, list):
             logger.debug(f"Unable to read sensor with ID {sensor_id}: {data}")
@@ -689,19 +1409,12 @@ class Bridge:
         else:
             data = {parameter: value}
 
-        logger.debug(str(data))
-        result = self.request(
-            "PUT", "/api/" + self.username + "/sensors/" + str(sensor_id), data
-        )
-
-        if isinstance(result, list) and result and "error" in result[0]:
-            logger.warning(
-                f"ERROR: {result[0]['error']['description']} for sensor {sensor_id}"
-            )
-
-        if TYPE_CHECKING:
-            result = cast(list[dict[str, Any]], result)
+        logger.debug("%s", data)
+        if "name" in data:
+            self._ids_by_name.pop("sensors")
+        result = self.request("PUT", f"{self._api_prefix}/sensors/{sensor_id}", data)
 
+        _warn_on_error(result, f"sensor {sensor_id}")
         logger.debug(result)
         return result
 
@@ -766,21 +1479,14 @@ class Bridge:
         if "lastupdated" in data:
             del data["lastupdated"]
 
-        logger.debug(str(data))
+        logger.debug("%s", data)
         result = self.request(
             "PUT",
-            "/api/" + self.username + "/sensors/" + str(sensor_id) + "/" + structure,
+            f"{self._api_prefix}/sensors/{sensor_id}/{structure}",
             data,
         )
 
-        if isinstance(result, list) and result and "error" in result[0]:
-            logger.warning(
-                f"ERROR: {result[0]['error']['description']} for sensor {sensor_id}"
-            )
-
-        if TYPE_CHECKING:
-            result = cast(list[dict[str, Any]], result)
-
+        _warn_on_error(result, f"sensor {sensor_id}")
         logger.debug(result)
         return result
 
@@ -797,17 +1503,18 @@ class Bridge:
             name = self.sensors_by_id[sensor_id].name
             del self.sensors_by_name[name]
             del self.sensors_by_id[sensor_id]
-            return self.request(
-                "DELETE", "/api/" + self.username + "/sensors/" + str(sensor_id)
-            )
+            self._ids_by_name.pop("sensors")
+            return self.request("DELETE", f"{self._api_prefix}/sensors/{sensor_id}")
         except KeyError:
             logger.debug(f"Unable to delete nonexistent sensor with ID {sensor_id}")
             return None
 
     # Groups of lights #####
     @property
-    def groups(self) -> list[Group]:
+    def groups(self) -> "list[Group]":
         """Access groups as a list"""
+        from phue2.group import Group
+
         return [Group(self, int(groupid)) for groupid in self.get_group().keys()]
 
     def get_group_id_by_name(self, name: str) -> int | None:
@@ -819,11 +1526,7 @@ class Bridge:
         Returns:
             The group ID if found, otherwise None
         """
-        groups = self.get_group()
-        for group_id in groups:
-            if name == groups[group_id]["name"]:
-                return int(group_id)
-        return None
+        return self._id_by_name("groups", name, self.get_group)
 
     def get_group(
         self, group_id: int | str | None = None, parameter: str | None = None
@@ -845,24 +1548,15 @@ class Bridge:
                 return None
 
         if group_id is None:
-            return self.request("GET", "/api/" + self.username + "/groups/")
+            return self.request("GET", f"{self._api_prefix}/groups/")
 
+        address = f"{self._api_prefix}/groups/{group_id}"
         if parameter is None:
-            return self.request(
-                "GET", "/api/" + self.username + "/groups/" + str(group_id)
-            )
-        elif parameter in ("name", "lights"):
-            return self.request(
-                "GET", "/api/" + self.username + "/groups/" + str(group_id)
-            )[parameter]
-        elif parameter in ("any_on", "all_on"):
-            return self.request(
-                "GET", "/api/" + self.username + "/groups/" + str(group_id)
-            )["state"][parameter]
-        else:
-            return self.request(
-                "GET", "/api/" + self.username + "/groups/" + str(group_id)
-            )["action"][parameter]
+            return self.request("GET", address)
+
+        from phue2.group import _group_value
+
+        return _group_value(self._get_coalesced(address), parameter)
 
     def set_group(
         self,
@@ -880,82 +1574,71 @@ class Bridge:
             transitiontime: Time for this transition to take place (in deciseconds)
 
         Returns:
-            A list of responses from the API
+            A list of responses from the API (empty in async mode, where
+            commands are queued instead of sent)
         """
-        data: dict[str, Any] = {}
-        username = self.username
-
-        if isinstance(parameter, dict):
-            data = parameter
-        elif parameter == "lights" and (
-            isinstance(value, list) or isinstance(value, int)
-        ):
-            if isinstance(value, int):
-                value = [value]
-
-            if TYPE_CHECKING:
-                value = cast(Iterable[int | str], value)
-
-            data = {parameter: [str(x) for x in value]}
-        else:
-            data = {parameter: value}
+        data = _group_command_data(parameter, value, transitiontime)
+        groups: list[int | str] = (
+            [group_id] if isinstance(group_id, _SINGLE_ID) else list(group_id)
+        )
 
-        if transitiontime is not None:
-            data["transitiontime"] = int(
-                round(transitiontime)
-            )  # must be int for request format
+        # Resolve every name before sending: renames and membership changes
+        # drop the cached name map, which would cost a GET per later name
+        converted = [
+            self.get_group_id_by_name(group)
+            if isinstance(group, str) and not group.isdigit()
+            else group
+            for group in groups
+        ]
 
-        group_id_array: list[int | str] = []
-        if isinstance(group_id, int | str):
-            group_id_array = [group_id]
-        else:
-            group_id_array = group_id
+        # Group commands change light state behind the per-light cache
+        self._last_state.clear()
 
         result: list[Any] = []
-        for group in group_id_array:
-            logger.debug(str(data))
-            if isinstance(group, str) and not group.isdigit():
-                converted_group = self.get_group_id_by_name(group)
-                if converted_group is None:
-                    logger.error("Group name does not exist")
-                    continue
-            else:
-                converted_group = group
-
-            if parameter in ("name", "lights"):
-                result.append(
-                    self.request(
-                        "PUT",
-                        "/api/" + username + "/groups/" + str(converted_group),
-                        data,
-                    )
-                )
-            else:
-                result.append(
-                    self.request(
-                        "PUT",
-                        "/api/"
-                        + username
-                        + "/groups/"
-                        + str(converted_group)
-                        + "/action",
-                        data,
-                    )
-                )
+        for group, converted_group in zip(groups, converted):
+            logger.debug("%s", data)
+            if converted_group is None:
+                logger.error("Group name does not exist")
+                continue
 
-            if (
-                result
-                and isinstance(result[-1], list)
-                and result[-1]
-                and "error" in result[-1][0]
-            ):
-                logger.warning(
-                    f"ERROR: {result[-1][0]['error']['description']} for group {group}"
-                )
+            response = self._command(
+                self._group_command(converted_group, parameter),
+                data,
+                self._groups_bucket,
+            )
+            if response is None:
+                continue  # queued for the async worker
+            result.append(response)
+            _warn_on_error(response, f"group {group}")
 
         logger.debug(result)
         return result
 
+    def _group_command(
+        self, group_id: int | str, parameter: str | dict[str, Any]
+    ) -> str:
+        """Work out where a group command goes.
+
+        Renaming a group or changing its members also forgets the cached
+        group lookups, which that command makes stale.
+
+        Args:
+            group_id: Numeric group ID
+            parameter: The parameter passed to set_group
+
+        Returns:
+            The command's address
+        """
+        if parameter in ("name", "lights"):
+            self._forget_groups()
+            return f"{self._api_prefix}/groups/{group_id}"
+        return f"{self._api_prefix}/groups/{group_id}/action"
+
+    def _forget_groups(self) -> None:
+        """Drop cached group names and memberships after groups change."""
+        self._ids_by_name.pop("groups")
+        self._groups_by_members.clear()
+
     def create_group(self, name: str, lights: list[int] | None = None) -> Any:
         """Create a group of lights
 
@@ -970,7 +1653,8 @@ class Bridge:
             lights = []
 
         data = {"lights": [str(x) for x in lights], "name": name}
-        return self.request("POST", "/api/" + self.username + "/groups/", data)
+        self._forget_groups()
+        return self.request("POST", f"{self._api_prefix}/groups/", data)
 
     def delete_group(self, group_id: int) -> Any:
         """Delete a group from the bridge.
@@ -981,15 +1665,16 @@ class Bridge:
         Returns:
             The response from the API
         """
-        return self.request(
-            "DELETE", "/api/" + self.username + "/groups/" + str(group_id)
-        )
+        self._forget_groups()
+        return self.request("DELETE", f"{self._api_prefix}/groups/{group_id}")
 
     # Scenes #####
     @property
-    def scenes(self) -> list[Scene]:
+    def scenes(self) -> "list[Scene]":
         """Access scenes as a list"""
-        return [Scene(k, **v) for k, v in self.get_scene().items()]
+        from phue2.scene import Scene
+
+        return [Scene.from_api(k, v) for k, v in self.get_scene().items()]
 
     def create_group_scene(self, name: str, group: str) -> Any:
         """Create a Group Scene
@@ -1010,7 +1695,7 @@ class Bridge:
             The response from the API
         """
         data = {"name": name, "group": group, "recycle": True, "type": "GroupScene"}
-        return self.request("POST", "/api/" + self.username + "/scenes", data)
+        return self.request("POST", f"{self._api_prefix}/scenes", data)
 
     def modify_scene(self, scene_id: str, data: dict[str, Any]) -> Any:
         """Modify a scene with the given data.
@@ -1022,9 +1707,7 @@ class Bridge:
         Returns:
             The response from the API
         """
-        return self.request(
-            "PUT", "/api/" + self.username + "/scenes/" + scene_id, data
-        )
+        return self.request("PUT", f"{self._api_prefix}/scenes/{scene_id}", data)
 
     def get_scene(self) -> dict[str, Any]:
         """Get all scenes from the bridge.
@@ -1032,7 +1715,7 @@ class Bridge:
         Returns:
             A dictionary of scenes
         """
-        return self.request("GET", "/api/" + self.username + "/scenes")
+        return self.request("GET", f"{self._api_prefix}/scenes")
 
     def activate_scene(
         self, group_id: int, scene_id: str, transition_time: int = 4
@@ -1045,12 +1728,36 @@ class Bridge:
             transition_time: Time for the transition to take place (in deciseconds)
 
         Returns:
-            The response from the API
+            The response from the API, or None if queued in async mode
         """
-        return self.request(
-            "PUT",
-            "/api/" + self.username + "/groups/" + str(group_id) + "/action",
+        self._last_state.clear()
+        return self._command(
+            f"{self._api_prefix}/groups/{group_id}/action",
             {"scene": scene_id, "transitiontime": transition_time},
+            self._groups_bucket,
+        )
+
+    def activate_scenes(
+        self, activations: Iterable[tuple[int, str]], transition_time: int = 4
+    ) -> list[Any]:
+        """Activate scenes on several groups concurrently.
+
+        Each activation still goes through activate_scene, so the group
+        rate limit and async mode apply.
+
+        Args:
+            activations: Pairs of group ID and the scene ID to activate on it
+            transition_time: Time for the transitions to take place (in deciseconds)
+
+        Returns:
+            The API response for each activation, in the order given
+        """
+        return fan_out(
+            lambda activation: self.activate_scene(
+                activation[0], activation[1], transition_time
+            ),
+            activations,
+            _PARALLEL_REQUESTS,
         )
 
     def run_scene(
@@ -1079,36 +1786,13 @@ class Bridge:
         Returns:
             True if a scene was run, False otherwise
         """
-        groups = [x for x in self.groups if x.name == group_name]
-        scenes = [x for x in self.scenes if x.name == scene_name]
-
-        if len(groups) != 1:
-            logger.warning(f"run_scene: More than 1 group found by name {group_name}")
-            return False
-
-        group = groups[0]
-
-        if len(scenes) == 0:
-            logger.warning(f"run_scene: No scene found {scene_name}")
+        # Match against the raw documents: one GET each for groups and scenes,
+        # and no Group or Scene objects for the entries that don't match
+        match = _match_scene(self.get_group(), self.get_scene(), group_name, scene_name)
+        if match is None:
             return False
-
-        if len(scenes) == 1:
-            self.activate_scene(group.group_id, scenes[0].scene_id, transition_time)
-            return True
-
-        # otherwise, lets figure out if one of the named scenes uses
-        # all the lights of the group
-        group_lights = sorted([x.light_id for x in group.lights])
-        for scene in scenes:
-            if group_lights == scene.lights:
-                self.activate_scene(group.group_id, scene.scene_id, transition_time)
-                return True
-
-        logger.warning(
-            f"run_scene: did not find a scene: {scene_name} "
-            f"that shared lights with group {group_name}"
-        )
-        return False
+        self.activate_scene(match[0], match[1], transition_time)
+        return True
 
     def delete_scene(self, scene_id: str) -> Any:
         """Delete a scene from the bridge.
@@ -1120,9 +1804,7 @@ class Bridge:
             The response from the API, or None if there was an error
         """
         try:
-            return self.request(
-                "DELETE", "/api/" + self.username + "/scenes/" + str(scene_id)
-            )
+            return self.request("DELETE", f"{self._api_prefix}/scenes/{scene_id}")
         except Exception as e:
             logger.debug(f"Unable to delete scene with ID {scene_id}: {str(e)}")
             return None
@@ -1141,14 +1823,11 @@ class Bridge:
             The requested parameter value, or a dict of all parameters if parameter is None
         """
         if schedule_id is None:
-            return self.request("GET", "/api/" + self.username + "/schedules")
+            return self.request("GET", f"{self._api_prefix}/schedules")
+        schedule = self.request("GET", f"{self._api_prefix}/schedules/{schedule_id}")
         if parameter is None:
-            return self.request(
-                "GET", "/api/" + self.username + "/schedules/" + str(schedule_id)
-            )
-        return self.request(
-            "GET", "/api/" + self.username + "/schedules/" + str(schedule_id)
-        )[parameter]
+            return schedule
+        return schedule[parameter]
 
     def create_schedule(
         self,
@@ -1176,13 +1855,11 @@ class Bridge:
             "description": description,
             "command": {
                 "method": "PUT",
-                "address": (
-                    "/api/" + self.username + "/lights/" + str(light_id) + "/state"
-                ),
+                "address": f"{self._api_prefix}/lights/{light_id}/state",
                 "body": data,
             },
         }
-        return self.request("POST", "/api/" + self.username + "/schedules", schedule)
+        return self.request("POST", f"{self._api_prefix}/schedules", schedule)
 
     def set_schedule_attributes(
         self, schedule_id: int, attributes: dict[str, Any]
@@ -1198,7 +1875,7 @@ class Bridge:
         """
         return self.request(
             "PUT",
-            "/api/" + self.username + "/schedules/" + str(schedule_id),
+            f"{self._api_prefix}/schedules/{schedule_id}",
             data=attributes,
         )
 
@@ -1228,13 +1905,11 @@ class Bridge:
             "description": description,
             "command": {
                 "method": "PUT",
-                "address": (
-                    "/api/" + self.username + "/groups/" + str(group_id) + "/action"
-                ),
+                "address": f"{self._api_prefix}/groups/{group_id}/action",
                 "body": data,
             },
         }
-        return self.request("POST", "/api/" + self.username + "/schedules", schedule)
+        return self.request("POST", f"{self._api_prefix}/schedules", schedule)
 
     def delete_schedule(self, schedule_id: int) -> Any:
         """Delete a schedule from the bridge.
@@ -1245,6 +1920,4 @@ class Bridge:
         Returns:
             The response from the API
         """
-        return self.request(
-            "DELETE", "/api/" + self.username + "/schedules/" + str(schedule_id)
-        )
+        return self.request("DELETE", f"{self._api_prefix}/schedules/{schedule_id}")
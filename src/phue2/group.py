@@ -10,6 +10,27 @@ logger = logging.getLogger("phue_modern")
 if TYPE_CHECKING:
     from phue2.bridge import Bridge
 
+# bridge.py imports this module, so Bridge is resolved on first use and kept
+_bridge_cls: "type[Bridge] | None" = None
+
+
+def _get_bridge_cls() -> "type[Bridge]":
+    global _bridge_cls
+    if _bridge_cls is None:
+        from phue2.bridge import Bridge
+
+        _bridge_cls = Bridge
+    return _bridge_cls
+
+
+def _group_value(group: dict[str, Any], parameter: str) -> Any:
+    """Look up a parameter in a group document fetched from the bridge."""
+    if parameter in ("name", "lights"):
+        return group[parameter]
+    if parameter in ("any_on", "all_on"):
+        return group["state"][parameter]
+    return group["action"][parameter]
+
 
 class Group(Light):
     """A group of Hue lights, tracked as a group on the bridge
@@ -25,6 +46,10 @@ class Group(Light):
         >>> # will raise a LookupError if the name doesn't match
     """
 
+    __slots__ = ("group_id", "_any_on", "_all_on")
+
+    _cache_ttl: float = 1.0
+
     def __init__(self, bridge: "Bridge", group_id: int | str):
         Light.__init__(self, bridge, 0)  # Light ID will be overridden
         self.light_id = None  # not relevant for a group
@@ -40,40 +65,37 @@ class Group(Light):
             for idnumber, info in groups.items():
                 if info["name"] == name:
                     self.group_id = int(idnumber)
+                    self._name = name
                     break
             else:
                 raise LookupError("Could not find a group by that name.")
 
-    # Wrapper functions for get/set through the bridge, adding support for
-    # remembering the transitiontime parameter if the user has set it
-    def _get(self, *args: Any, **kwargs: Any) -> Any:
-        return self.bridge.get_group(self.group_id, *args, **kwargs)
-
-    def _set(self, *args: Any, **kwargs: Any) -> Any:
-        # let's get basic group functionality working first before adding
-        # transition time...
-        if self.transitiontime is not None:
-            kwargs["transitiontime"] = self.transitiontime
-            logger.debug(
-                f"Setting with transitiontime = {self.transitiontime} ds = {float(self.transitiontime) / 10} s"
-            )
-
-            if (args[0] == "on" and args[1] is False) or (
-                kwargs.get("on", True) is False
-            ):
-                self._reset_bri_after_on = True
+    @property
+    def _repr_id(self) -> int:
+        return self.group_id
+
+    # Point the Light get/set machinery at the group endpoints
+    def _fetch(self) -> dict[str, Any]:
+        return self.bridge.get_group(self.group_id)
+
+    def _lookup(self, group: dict[str, Any], parameter: str) -> Any:
+        return _group_value(group, parameter)
+
+    def _send(self, *args: Any, **kwargs: Any) -> Any:
+        kwargs.pop("force", None)  # set_group never skips commands
         return self.bridge.set_group(self.group_id, *args, **kwargs)
 
     @property
     def name(self) -> str:
         """Get or set the name of the light group [string]"""
-        return self._get("name")
+        self._name = self._get("name")
+        return self._name
 
     @name.setter
     def name(self, value: str) -> None:
-        old_name = self.name
+        old_name = self._name if self._name is not None else self.name
         self._name = value
-        logger.debug(f"Renaming light group from '{old_name}' to '{value}'")
+        logger.debug("Renaming light group from '%s' to '%s'", old_name, value)
         self._set("name", self._name)
 
     @property
@@ -96,7 +118,7 @@ class Group(Light):
     @lights.setter
     def lights(self, value: list[int]) -> None:
         """Change the lights that are in this group"""
-        logger.debug(f"Setting lights in group {self.group_id} to {str(value)}")
+        logger.debug("Setting lights in group %s to %s", self.group_id, value)
         self._set("lights", value)
 
 
@@ -110,9 +132,9 @@ class AllLights(Group):
     ask for group 0.
     """
 
+    __slots__ = ()
+
     def __init__(self, bridge: "Bridge | None" = None):
         if bridge is None:
-            from .bridge import Bridge
-
-            bridge = Bridge()
+            bridge = _get_bridge_cls()()
         Group.__init__(self, bridge, 0)
@@ -1,6 +1,10 @@
 """Light class for controlling Philips Hue lights."""
 
 import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -8,13 +12,101 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("phue_modern")
 
+# Light attributes that sit at the top level of the light object, not in "state"
+_TOP_LEVEL_KEYS = ("name", "type", "uniqueid", "swversion")
+
+
+def _light_value(light: dict[str, Any], parameter: str, light_id: int | str) -> Any:
+    """Look up a parameter in a light document fetched from the bridge."""
+    if parameter in _TOP_LEVEL_KEYS:
+        return light[parameter]
+    try:
+        return light["state"][parameter]
+    except KeyError:
+        raise KeyError(
+            f"Not a valid key, parameter {parameter} is not associated with light {light_id}"
+        )
+
+
+# Color temperature range supported by Hue bulbs, in Kelvin
+_MIN_KELVIN, _MAX_KELVIN = 2000, 6500
+
+
+@lru_cache(maxsize=512)
+def _mired_kelvin(value: int) -> int:
+    """Convert between mireds and Kelvin; the conversion is its own inverse.
+
+    Bulbs only report a few hundred distinct mired values, so results are
+    memoized.
+    """
+    return int(round(1e6 / value))
+
+
+def _expect(value: Any, expected: type, what: str) -> Any:
+    """Return a value read from the bridge, raising TypeError if it has the wrong type.
+
+    The error message is only built on a mismatch, keeping getters cheap.
+    """
+    if not isinstance(value, expected):
+        raise TypeError(f"Expected {expected.__name__} for {what}, got {type(value)}")
+    return value
+
 
 class Light:
     """Hue Light object
 
     Light settings can be accessed or set via the properties of this object.
+    Several settings can be sent to the bridge as one command with batch():
+
+        >>> with light.batch():
+        ...     light.brightness = 200
+        ...     light.hue = 10000
+
+    Reads are served from a copy of the light fetched at most once per
+    `_cache_ttl` seconds; call refresh() to force the next read to refetch.
+
+    Setting a property to the value it was last read or set to sends
+    nothing, as long as that was less than `_known_ttl` seconds ago and
+    nothing else has written to the bridge since. Set `force = True` to
+    send every write regardless, e.g. after the light may have been
+    changed with a physical switch.
     """
 
+    __slots__ = (
+        "bridge",
+        "light_id",
+        "_name",
+        "_on",
+        "_brightness",
+        "_colormode",
+        "_hue",
+        "_saturation",
+        "_xy",
+        "_colortemp",
+        "_effect",
+        "_alert",
+        "transitiontime",
+        "force",
+        "_reset_bri_after_on",
+        "_reachable",
+        "_type",
+        "_pending",
+        "_cache",
+        "_cache_ts",
+        "_seen_writes",
+        "_seen_ts",
+    )
+
+    _cache_ttl: float = 0.5
+    # How long a value read or set is trusted for skipping unchanged writes
+    _known_ttl: float = 5.0
+    # Static part of __repr__, rebuilt for each subclass
+    _repr_prefix = f"<{__module__}.{__qualname__} object "
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._repr_prefix = f"<{cls.__module__}.{cls.__name__} object "
+
     def __init__(self, bridge: "Bridge", light_id: int):
         self.bridge = bridge
         self.light_id = light_id
@@ -30,65 +122,182 @@ class Light:
         self._effect: str | None = None
         self._alert: str | None = None
         self.transitiontime: int | None = None  # default
+        self.force = False
         self._reset_bri_after_on: bool | None = None
         self._reachable: bool | None = None
         self._type: str | None = None
+        self._pending: dict[str, Any] | None = None
+        self._cache: dict[str, Any] | None = None
+        self._cache_ts = 0.0
+        # The bridge's write count when this light's state was last learned
+        self._seen_writes = bridge._writes
+        self._seen_ts = 0.0
 
     def __repr__(self) -> str:
-        # like default python repr function, but add light name
-        return f'<{self.__class__.__module__}.{self.__class__.__name__} object "{self.name}" at {hex(id(self))}>'
+        # like default python repr function, but add the last known light name
+        # (reading self.name here would cost a request to the bridge)
+        name = self._name if self._name is not None else f"ID {self._repr_id}"
+        return f'{self._repr_prefix}"{name}" at {hex(id(self))}>'
+
+    @property
+    def _repr_id(self) -> int | None:
+        return self.light_id
 
     # Wrapper functions for get/set through the bridge, adding support for
     # remembering the transitiontime parameter if the user has set it
-    def _get(self, *args: Any, **kwargs: Any) -> Any:
-        return self.bridge.get_light(self.light_id, *args, **kwargs)
+    def _get(self, parameter: str) -> Any:
+        return self._lookup(self._cached_state(), parameter)
+
+    def _cached_state(self) -> dict[str, Any]:
+        """Return the full document for this light, refetching it once the cache expires."""
+        # Safe without a lock: readers work on a local reference, and a refetch
+        # swaps in a whole new document in one assignment
+        cache = self._cache
+        if (
+            cache is None
+            or time.monotonic() - self._cache_ts > self._cache_ttl
+            or self._seen_writes != self.bridge._writes
+        ):
+            cache = self._cache = self._fetch()
+            self._cache_ts = time.monotonic()
+            self._saw_state()
+        return cache
+
+    def _saw_state(self) -> None:
+        """Note that this light's state is known as of the bridge's latest write."""
+        self._seen_writes = self.bridge._writes
+        self._seen_ts = time.monotonic()
+
+    def _knows_state(self) -> bool:
+        """Check that values last read or set can still be trusted.
+
+        Any write through the bridge (set_light, set_group, scenes...) may
+        have changed this light, as may time passing.
+        """
+        return (
+            self._seen_writes == self.bridge._writes
+            and time.monotonic() - self._seen_ts < self._known_ttl
+        )
+
+    def _fetch(self) -> dict[str, Any]:
+        return self.bridge.get_light(self.light_id)
+
+    def _lookup(self, light: dict[str, Any], parameter: str) -> Any:
+        return _light_value(light, parameter, self.light_id)
+
+    def refresh(self) -> None:
+        """Drop the cached light document so the next read refetches it."""
+        self._cache = None
+        self._seen_ts = 0.0
+
+    def _populate_from_dict(self, light: dict[str, Any]) -> None:
+        """Fill the read cache from a light document fetched elsewhere."""
+        self._cache = light
+        self._cache_ts = time.monotonic()
+        self._saw_state()
 
     def _set(self, *args: Any, **kwargs: Any) -> Any:
+        # Inside batch() state changes are collected and sent together on exit.
+        # name and lights live outside the state object, so they go out now.
+        if (
+            self._pending is not None
+            and isinstance(args[0], str)
+            and args[0] not in ("name", "lights")
+        ):
+            self._pending[args[0]] = args[1]
+            return None
+
+        self._cache = None
         if self.transitiontime is not None:
             kwargs["transitiontime"] = self.transitiontime
             logger.debug(
-                f"Setting with transitiontime = {self.transitiontime} ds = {float(self.transitiontime) / 10} s"
+                "Setting with transitiontime = %s ds = %s s",
+                self.transitiontime,
+                self.transitiontime / 10,
             )
 
-            if (args[0] == "on" and args[1] is False) or (
-                kwargs.get("on", True) is False
-            ):
+            # A batch arrives here as one dict of settings
+            command = args[0] if isinstance(args[0], dict) else {args[0]: args[1]}
+            if command.get("on", True) is False:
                 self._reset_bri_after_on = True
+
+        # Our own write keeps what we know current, unless someone else
+        # wrote in between and what we know was already stale
+        current = self._seen_writes == self.bridge._writes
+        result = self._send(*args, **kwargs)
+        if current:
+            self._saw_state()
+        return result
+
+    def _send(self, *args: Any, **kwargs: Any) -> Any:
+        kwargs.setdefault("force", self.force)
         return self.bridge.set_light(self.light_id, *args, **kwargs)
 
+    def _unchanged(self, current: Any, value: Any) -> bool:
+        """Check whether a setter would write the value we already know about."""
+        return (
+            not self.force
+            and current is not None
+            and current == value
+            and self._knows_state()
+        )
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Collect settings made in a with block and send them as one command.
+
+        Settings are sent when the block exits, even if it raises. Nested
+        batches join the outermost one. Reads inside the block still come
+        from the bridge, so they don't reflect the pending settings yet.
+        """
+        if self._pending is not None:
+            yield
+            return
+
+        self._pending = {}
+        try:
+            yield
+        finally:
+            pending, self._pending = self._pending, None
+            if pending:
+                self._set(pending)
+
     @property
     def name(self) -> str:
         """Get or set the name of the light [string]"""
-        fetched_name = self._get("name")
-        assert isinstance(fetched_name, str), (
-            f"Expected str for name, got {type(fetched_name)}"
-        )
-        self._name = fetched_name
+        self._name = _expect(self._get("name"), str, "name")
         return self._name
 
     @name.setter
     def name(self, value: str) -> None:
-        old_name = self.name
+        # Only ask the bridge for the old name if we haven't seen it yet
+        old_name = self._name if self._name is not None else self.name
+        cache = self._cache
         self._name = value
         self._set("name", self._name)
 
-        logger.debug(f"Renaming light from '{old_name}' to '{value}'")
+        logger.debug("Renaming light from '%s' to '%s'", old_name, value)
 
-        self.bridge.lights_by_name[self.name] = self
-        del self.bridge.lights_by_name[old_name]
+        # Keep the cached document current rather than refetching it
+        if cache is not None:
+            cache["name"] = value
+            self._cache = cache
+            self._cache_ts = time.monotonic()
+
+        self.bridge.lights_by_name.pop(old_name, None)
+        self.bridge.lights_by_name[value] = self
 
     @property
     def on(self) -> bool:
         """Get or set the state of the light [True|False]"""
-        self._on = self._get("on")
-        assert self._on is not None, "Failed to get 'on' state from bridge."
-        assert isinstance(self._on, bool), (
-            f"Expected bool for 'on' state, got {type(self._on)}"
-        )
+        self._on = _expect(self._get("on"), bool, "on")
         return self._on
 
     @on.setter
     def on(self, value: bool) -> None:
+        if self._unchanged(self._on, value) and not self._reset_bri_after_on:
+            return
+
         # Some added code here to work around known bug where
         # turning off with transitiontime set makes it restart on brightness = 1
         if self._on and value is False:
@@ -107,7 +316,9 @@ class Light:
                     "Light was turned off with transitiontime specified, brightness needs to be reset now."
                 )
                 if self._brightness is not None:
-                    self.brightness = self._brightness
+                    # Sent directly: the value matches what we know, so the
+                    # brightness setter would skip it as unchanged
+                    self._set("bri", self._brightness, force=True)
                 else:
                     logger.warning(
                         "Cannot reset brightness, initial brightness value not available."
@@ -119,11 +330,7 @@ class Light:
     @property
     def colormode(self) -> str:
         """Get the color mode of the light [hs|xy|ct]"""
-        self._colormode = self._get("colormode")
-        assert self._colormode is not None, "Failed to get 'colormode' from bridge."
-        assert isinstance(self._colormode, str), (
-            f"Expected str for colormode, got {type(self._colormode)}"
-        )
+        self._colormode = _expect(self._get("colormode"), str, "colormode")
         return self._colormode
 
     @property
@@ -131,32 +338,26 @@ class Light:
         """Get or set the brightness of the light [0-254].
 
         0 is not off"""
-        self._brightness = self._get("bri")
-        assert self._brightness is not None, (
-            "Failed to get brightness ('bri') from bridge."
-        )
-        assert isinstance(self._brightness, int), (
-            f"Expected int for brightness, got {type(self._brightness)}"
-        )
+        self._brightness = _expect(self._get("bri"), int, "bri")
         return self._brightness
 
     @brightness.setter
     def brightness(self, value: int) -> None:
+        if self._unchanged(self._brightness, value):
+            return
         self._brightness = value
         self._set("bri", self._brightness)
 
     @property
     def hue(self) -> int:
         """Get or set the hue of the light [0-65535]"""
-        self._hue = self._get("hue")
-        assert self._hue is not None, "Failed to get hue from bridge."
-        assert isinstance(self._hue, int), (
-            f"Expected int for hue, got {type(self._hue)}"
-        )
+        self._hue = _expect(self._get("hue"), int, "hue")
         return self._hue
 
     @hue.setter
     def hue(self, value: int) -> None:
+        if self._unchanged(self._hue, int(value)):
+            return
         self._hue = int(value)
         self._set("hue", self._hue)
 
@@ -167,17 +368,13 @@ class Light:
         0 = white
         254 = most saturated
         """
-        self._saturation = self._get("sat")
-        assert self._saturation is not None, (
-            "Failed to get saturation ('sat') from bridge."
-        )
-        assert isinstance(self._saturation, int), (
-            f"Expected int for saturation, got {type(self._saturation)}"
-        )
+        self._saturation = _expect(self._get("sat"), int, "sat")
         return self._saturation
 
     @saturation.setter
     def saturation(self, value: int) -> None:
+        if self._unchanged(self._saturation, value):
+            return
         self._saturation = value
         self._set("sat", self._saturation)
 
@@ -187,37 +384,32 @@ class Light:
 
         This is in a color space similar to CIE 1931 (but not quite identical)
         """
-        self._xy = self._get("xy")
-        assert self._xy is not None, (
-            "Failed to get color coordinates ('xy') from bridge."
-        )
-        assert isinstance(self._xy, tuple | list) and len(self._xy) == 2, (
-            f"Expected tuple/list of 2 floats for xy, got {self._xy}"
-        )
-        try:
-            xy_tuple = (float(self._xy[0]), float(self._xy[1]))
-            self._xy = xy_tuple
-            return xy_tuple
-        except (ValueError, TypeError, IndexError):
-            raise AssertionError(
-                f"Could not parse xy coordinates as tuple[float, float]: {self._xy}"
-            )
+        # Malformed values raise from the unpacking or float() on their own
+        x, y = self._get("xy")
+        if isinstance(x, float) and isinstance(y, float):
+            self._xy = (x, y)
+        else:
+            self._xy = (float(x), float(y))
+        return self._xy
 
     @xy.setter
     def xy(self, value: tuple[float, float]) -> None:
+        # The bridge rounds coordinates to 4 decimals, so compare within that
+        if (
+            not self.force
+            and self._xy is not None
+            and self._knows_state()
+            and abs(self._xy[0] - value[0]) < 1e-4
+            and abs(self._xy[1] - value[1]) < 1e-4
+        ):
+            return
         self._xy = value
         self._set("xy", self._xy)
 
     @property
     def colortemp(self) -> int:
         """Get or set the color temperature of the light, in units of mireds [154-500]"""
-        self._colortemp = self._get("ct")
-        assert self._colortemp is not None, (
-            "Failed to get color temperature ('ct') from bridge."
-        )
-        assert isinstance(self._colortemp, int), (
-            f"Expected int for color temperature, got {type(self._colortemp)}"
-        )
+        self._colortemp = _expect(self._get("ct"), int, "ct")
         return self._colortemp
 
     @colortemp.setter
@@ -226,76 +418,71 @@ class Light:
             logger.warning("154 mireds is coolest allowed color temp")
         elif value > 500:
             logger.warning("500 mireds is warmest allowed color temp")
+        if self._unchanged(self._colortemp, value):
+            return
         self._colortemp = value
         self._set("ct", self._colortemp)
 
     @property
     def colortemp_k(self) -> int:
         """Get or set the color temperature of the light, in units of Kelvin [2000-6500]"""
-        ct_mired = self.colortemp
-        return int(round(1e6 / ct_mired))
+        return _mired_kelvin(self.colortemp)
 
     @colortemp_k.setter
     def colortemp_k(self, value: int) -> None:
-        if value > 6500:
-            logger.warning("6500 K is max allowed color temp")
-            value = 6500
-        elif value < 2000:
-            logger.warning("2000 K is min allowed color temp")
-            value = 2000
-
-        colortemp_mireds = int(round(1e6 / value))
-        logger.debug(f"{value:d} K is {colortemp_mireds} mireds")
+        clamped = min(_MAX_KELVIN, max(_MIN_KELVIN, value))
+        if clamped != value:
+            logger.warning(
+                "Color temp %d K is outside %d-%d K, using %d K",
+                value,
+                _MIN_KELVIN,
+                _MAX_KELVIN,
+                clamped,
+            )
+            value = clamped
+
+        colortemp_mireds = _mired_kelvin(value)
+        logger.debug("%d K is %s mireds", value, colortemp_mireds)
         self.colortemp = colortemp_mireds
 
     @property
     def effect(self) -> str:
         """Check the effect setting of the light. [none|colorloop]"""
-        self._effect = self._get("effect")
-        assert self._effect is not None, "Failed to get effect from bridge."
-        assert isinstance(self._effect, str), (
-            f"Expected str for effect, got {type(self._effect)}"
-        )
+        self._effect = _expect(self._get("effect"), str, "effect")
         return self._effect
 
     @effect.setter
     def effect(self, value: str) -> None:
+        if self._unchanged(self._effect, value):
+            return
         self._effect = value
         self._set("effect", self._effect)
 
     @property
     def alert(self) -> str:
         """Get or set the alert state of the light [select|lselect|none]"""
-        self._alert = self._get("alert")
-        assert self._alert is not None, "Failed to get alert state from bridge."
-        assert isinstance(self._alert, str), (
-            f"Expected str for alert state, got {type(self._alert)}"
-        )
+        self._alert = _expect(self._get("alert"), str, "alert")
         return self._alert
 
     @alert.setter
     def alert(self, value: str | None) -> None:
         if value is None:
             value = "none"
+        # No unchanged check here: "select" and "lselect" are one-shot
+        # actions that should flash the light again every time they are set
         self._alert = value
         self._set("alert", self._alert)
 
     @property
     def reachable(self) -> bool:
         """Get the reachable state of the light [boolean]"""
-        self._reachable = self._get("reachable")
-        assert self._reachable is not None, "Failed to get reachable state from bridge."
-        assert isinstance(self._reachable, bool), (
-            f"Expected bool for reachable state, got {type(self._reachable)}"
-        )
+        self._reachable = _expect(self._get("reachable"), bool, "reachable")
         return self._reachable
 
     @property
     def type(self) -> str:
         """Get the type of the light [string]"""
-        self._type = self._get("type")
-        assert self._type is not None, "Failed to get type from bridge."
-        assert isinstance(self._type, str), (
-            f"Expected str for type, got {type(self._type)}"
-        )
+        # The type of a bulb never changes, so it is only read once
+        if self._type is None:
+            self._type = _expect(self._get("type"), str, "type")
         return self._type
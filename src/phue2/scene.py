@@ -6,6 +6,23 @@ from typing import Any
 class Scene:
     """Container for Scene"""
 
+    # Bridges can hold dozens of scenes, and scenes/run_scene build them all
+    __slots__ = (
+        "scene_id",
+        "appdata",
+        "lastupdated",
+        "_lights",
+        "_raw_lights",
+        "locked",
+        "name",
+        "owner",
+        "picture",
+        "recycle",
+        "version",
+        "type",
+        "group",
+    )
+
     def __init__(
         self,
         sid: str,
@@ -42,10 +59,9 @@ class Scene:
         self.scene_id = sid
         self.appdata = appdata or {}
         self.lastupdated = lastupdated
-        if lights is not None:
-            self.lights = sorted([int(x) for x in lights])
-        else:
-            self.lights = []
+        # Converted and sorted on first access; most scenes are never compared
+        self._raw_lights = lights
+        self._lights: list[int] | None = None
         self.locked = locked
         self.name = name
         self.owner = owner
@@ -55,6 +71,46 @@ class Scene:
         self.type = type
         self.group = group
 
+    @classmethod
+    def from_api(cls, sid: str, data: dict[str, Any]) -> "Scene":
+        """Build a Scene from one entry of the bridge's /scenes document.
+
+        Args:
+            sid: Scene ID
+            data: The scene's document
+
+        Returns:
+            The Scene
+        """
+        scene = cls.__new__(cls)
+        scene.scene_id = sid
+        scene.appdata = data.get("appdata") or {}
+        scene.lastupdated = data.get("lastupdated")
+        scene._raw_lights = data.get("lights")
+        scene._lights = None
+        scene.locked = data.get("locked", False)
+        scene.name = data.get("name", "")
+        scene.owner = data.get("owner", "")
+        scene.picture = data.get("picture", "")
+        scene.recycle = data.get("recycle", False)
+        scene.version = data.get("version", 0)
+        scene.type = data.get("type", "")
+        scene.group = data.get("group", "")
+        return scene
+
+    @property
+    def lights(self) -> list[int]:
+        """IDs of the lights in the scene, sorted"""
+        if self._lights is None:
+            raw = self._raw_lights
+            self._lights = sorted(int(x) for x in raw) if raw else []
+        return self._lights
+
+    @lights.setter
+    def lights(self, value: list[int | str]) -> None:
+        self._raw_lights = value
+        self._lights = None
+
     def __repr__(self) -> str:
         # like default python repr function, but add scene name
         return f'<{self.__class__.__module__}.{self.__class__.__name__} id="{self.scene_id}" name="{self.name}" lights={self.lights}>'
@@ -1,9 +1,10 @@
 """Sensor classes for interacting with Philips Hue sensors."""
 
 import logging
-from collections import UserDict
+import threading
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, TypeAlias
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar
 
 if TYPE_CHECKING:
     from phue2 import Bridge
@@ -11,21 +12,51 @@ if TYPE_CHECKING:
 logger = logging.getLogger("phue_modern")
 
 SensorData: TypeAlias = dict[str, Any]
+T = TypeVar("T")
 
 
-class _SensorDataWrapper(UserDict[str, Any]):
+def _optional(raw: SensorData, key: str, convert: Callable[[Any], T]) -> T | None:
+    """Read an optional top-level sensor attribute, converting it if present."""
+    try:
+        value = raw[key]
+    except KeyError:
+        return None
+    return None if value is None else convert(value)
+
+
+class _SensorDataWrapper(dict[str, Any]):
     """
-    Base class for Sensor State/Config wrappers using UserDict.
+    Base class for Sensor State/Config wrappers.
     Updates the bridge when an item is set.
     Holds a cached view of the state/config.
+
+    Subclasses dict directly so reads (`state['temperature']` in polling
+    loops) use the C implementation. Only item assignment and update()
+    write to the bridge; other dict mutators just change the local cache.
+
+    Writes can be coalesced into one bridge call, either for the length of
+    a with block (`with sensor.config: ...`) or automatically by setting
+    `debounce` to a delay in seconds. Call flush() to send pending writes
+    early.
     """
 
-    # UserDict stores data in the 'data' attribute (which is a dict)
-    data: SensorData
+    __slots__ = (
+        "_bridge",
+        "_sensor_id",
+        "_update_bridge_method",
+        "_put",
+        "debounce",
+        "_pending",
+        "_flush_timer",
+        "_batch_depth",
+        "_lock",
+    )
 
     def __init__(
         self, bridge: "Bridge", sensor_id: int, initial_data: SensorData | None = None
     ):
+        # Seed the cache directly: going through update() would write the
+        # initial data back to the bridge
         super().__init__(initial_data or {})
         self._bridge = bridge
         self._sensor_id = sensor_id
@@ -33,6 +64,15 @@ class _SensorDataWrapper(UserDict[str, Any]):
         self._update_bridge_method: Callable[[int, SensorData], Any] = (
             self._get_bridge_update_method()
         )
+        # Bound once to this sensor so each write is a single-argument call
+        self._put: Callable[[SensorData], Any] = partial(
+            self._update_bridge_method, sensor_id
+        )
+        self.debounce: float | None = None
+        self._pending: SensorData = {}
+        self._flush_timer: threading.Timer | None = None
+        self._batch_depth = 0
+        self._lock = threading.Lock()
 
     def _get_bridge_update_method(self) -> Callable[[int, SensorData], Any]:
         # This method should be implemented by subclasses
@@ -41,9 +81,11 @@ class _SensorDataWrapper(UserDict[str, Any]):
     def __setitem__(self, key: str, value: Any) -> None:
         """Sets an item locally and updates the bridge."""
         # Optional: Check if the value is actually changing to avoid unnecessary API calls
-        if key in self.data and self.data[key] == value:
+        if key in self and self[key] == value:
             logger.debug(
-                f"Skipping bridge update for sensor {self._sensor_id}: key '{key}' value unchanged."
+                "Skipping bridge update for sensor %s: key '%s' value unchanged.",
+                self._sensor_id,
+                key,
             )
             return
 
@@ -54,12 +96,53 @@ class _SensorDataWrapper(UserDict[str, Any]):
         super().__setitem__(key, value)
 
         # Update the bridge with *only the changed key/value pair*
-        update_payload = {key: value}
+        self._queue({key: value})
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Updates the dictionary with multiple items.
+        All changed items are sent to the bridge in a single API call;
+        unchanged items are skipped as in __setitem__.
+        """
+        temp_dict = dict(*args, **kwargs)
+        update_payload = {
+            key: value
+            for key, value in temp_dict.items()
+            if key not in self or self[key] != value
+        }
+        if not update_payload:
+            logger.debug(
+                "Skipping bridge update for sensor %s: no values changed.",
+                self._sensor_id,
+            )
+            return
+
+        # Same policy as __setitem__: update the local cache first
+        dict.update(self, update_payload)
+        self._queue(update_payload)
+
+    def _queue(self, update_payload: SensorData) -> None:
+        """Send changed items now, or hold them while batching or debouncing."""
+        if not self._batch_depth and self.debounce is None:
+            self._send(update_payload)
+            return
+
+        with self._lock:
+            self._pending.update(update_payload)
+            if not self._batch_depth and self.debounce is not None:
+                # Restart the window so a burst of writes flushes once
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                self._flush_timer = threading.Timer(self.debounce, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _send(self, update_payload: SensorData) -> None:
         try:
             logger.debug(
-                f"Updating bridge for sensor {self._sensor_id}: {update_payload}"
+                "Updating bridge for sensor %s: %s", self._sensor_id, update_payload
             )
-            self._update_bridge_method(self._sensor_id, update_payload)
+            self._put(update_payload)
         except Exception as e:
             # Handle potential API errors (e.g., network issues, invalid key/value)
             logger.error(
@@ -67,33 +150,39 @@ class _SensorDataWrapper(UserDict[str, Any]):
             )
             # Optional: Revert local change if bridge update fails?
             # Depends on desired behavior. For now, keep local change.
-            # Consider raising the exception or providing feedback.
             # For simplicity here, we just log the error.
 
-    def update(self, *args: Any, **kwargs: Any) -> None:
-        """
-        Updates the dictionary with multiple items.
-        Calls the bridge update method for each changed item individually.
-        Note: This may result in multiple API calls. If the bridge API supports
-        updating multiple keys in one call, this could be optimized.
-        """
-        # UserDict.update handles merging args and kwargs into self.data
-        # We need to intercept this to call the bridge for each change.
-        temp_dict = dict(*args, **kwargs)
-        for key, value in temp_dict.items():
-            # This will call our overridden __setitem__, which handles bridge update
-            self[key] = value
+    def flush(self) -> None:
+        """Send any pending writes to the bridge in a single call."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            update_payload, self._pending = self._pending, {}
+        if update_payload:
+            self._send(update_payload)
+
+    def __enter__(self) -> "_SensorDataWrapper":
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
 
     def sync_from_bridge_data(self, data: SensorData) -> None:
         """
         Updates the local cache directly from data fetched from the bridge,
         bypassing the bridge update mechanism (__setitem__).
         """
-        # Use super().update to modify self.data directly without triggering __setitem__
-        self.data.clear()
-        self.data.update(data)
-        # Alternatively: super().update(data) if you want to merge instead of replace.
-        # Clearing first ensures the cache exactly matches the fetched data.
+        # Use dict.update to modify the cache directly without triggering __setitem__.
+        # Overwrite first and then drop keys the bridge no longer reports, so
+        # a reader on another thread never sees the cache empty mid-sync.
+        stale = self.keys() - data.keys()
+        dict.update(self, data)
+        for key in stale:
+            dict.pop(self, key, None)
 
 
 class SensorState(_SensorDataWrapper):
@@ -102,6 +191,8 @@ class SensorState(_SensorDataWrapper):
     Provides a dictionary-like interface to a cached view of the sensor state.
     """
 
+    __slots__ = ()
+
     def _get_bridge_update_method(self):
         return self._bridge.set_sensor_state
 
@@ -112,6 +203,8 @@ class SensorConfig(_SensorDataWrapper):
     Provides a dictionary-like interface to a cached view of the sensor config.
     """
 
+    __slots__ = ()
+
     def _get_bridge_update_method(self):
         return self._bridge.set_sensor_config
 
@@ -126,50 +219,69 @@ class Sensor:
     Call `sensor.refresh()` to update the local cache from the bridge.
     """
 
-    # Type hint for the bridge reference
-    bridge: "Bridge"
-    sensor_id: int
-
-    # Private attributes for caching
-    # Use Optional[T] and initialize to None to indicate they haven't been fetched yet.
-    _raw_data: SensorData | None = None
-    _state: SensorState
-    _config: SensorConfig
-    # Cache basic attributes to avoid repeated parsing/dict access
-    _name: str | None = None
-    _modelid: str | None = None
-    _swversion: str | None = None
-    _type: str | None = None
-    _uniqueid: str | None = None
-    _manufacturername: str | None = None
-    _recycle: bool | None = None
+    __slots__ = (
+        "bridge",
+        "sensor_id",
+        "_raw_data",
+        "_state",
+        "_config",
+        "_name",
+        "_modelid",
+        "_swversion",
+        "_type",
+        "_uniqueid",
+        "_manufacturername",
+        "_recycle",
+        "_loaded",
+        "_lock",
+    )
+
+    # Static part of __repr__, rebuilt for each subclass
+    _repr_prefix = f"<{__module__}.{__qualname__} object "
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._repr_prefix = f"<{cls.__module__}.{cls.__name__} object "
 
     def __init__(self, bridge: "Bridge", sensor_id: int):
         self.bridge = bridge
         self.sensor_id = sensor_id
 
+        # Private attributes for caching, None until fetched from the bridge
+        self._raw_data: SensorData | None = None
+        # Cache basic attributes to avoid repeated parsing/dict access
+        self._name: str | None = None
+        self._modelid: str | None = None
+        self._swversion: str | None = None
+        self._type: str | None = None
+        self._uniqueid: str | None = None
+        self._manufacturername: str | None = None
+        self._recycle: bool | None = None
+        # Set once the attributes above have been populated
+        self._loaded = False
+        # Serializes cache writers; readers only ever load single attributes
+        self._lock = threading.Lock()
+
         # Initialize state and config wrappers without initial data.
         # Data will be populated by refresh() or on first access.
-        self._state = SensorState(bridge, sensor_id)
-        self._config = SensorConfig(bridge, sensor_id)  # Use SensorConfig
+        self._state: SensorState = SensorState(bridge, sensor_id)
+        self._config: SensorConfig = SensorConfig(bridge, sensor_id)
 
     def __repr__(self) -> str:
-        # Fetch name for repr if not already cached. Handle potential errors.
-        try:
-            name = self.name  # Use the property to ensure data is loaded
-        except Exception:
-            name = f"ID {self.sensor_id}"  # Fallback if name fetch fails
-        return f'<{self.__class__.__module__}.{self.__class__.__name__} object "{name}" at {hex(id(self))}>'
+        # Use the cached name only: repr shouldn't trigger a bridge request
+        name = self._name if self._name is not None else f"ID {self.sensor_id}"
+        return f'{self._repr_prefix}"{name}" at {hex(id(self))}>'
 
     def refresh(self) -> None:
         """Fetches the latest data from the bridge and updates the local cache."""
-        logger.debug(f"Refreshing data for sensor {self.sensor_id}")
+        logger.debug("Refreshing data for sensor %s", self.sensor_id)
         try:
-            # Assume bridge.get_sensor(id) returns the full sensor dictionary
-            self._raw_data = self.bridge.get_sensor(self.sensor_id)
-            if not isinstance(self._raw_data, dict):
+            # Assume bridge.get_sensor(id) returns the full sensor dictionary.
+            # The request runs outside the lock; only the cache update holds it.
+            raw = self.bridge.get_sensor(self.sensor_id)
+            if not isinstance(raw, dict):
                 raise TypeError(
-                    f"Expected dict from bridge.get_sensor, got {type(self._raw_data)}"
+                    f"Expected dict from bridge.get_sensor, got {type(raw)}"
                 )
         except Exception as e:
             logger.error(f"Failed to refresh data for sensor {self.sensor_id}: {e}")
@@ -177,24 +289,47 @@ class Sensor:
             # self._raw_data = None # Option: clear cache on failure
             raise  # Re-raise the exception so the caller knows refresh failed
 
-        # Update cached attributes directly from raw data
-        self._name = self._raw_data.get("name")
-        self._modelid = self._raw_data.get("modelid")
-        self._swversion = self._raw_data.get("swversion")
-        self._type = self._raw_data.get("type")
-        self._uniqueid = self._raw_data.get("uniqueid")
-        self._manufacturername = self._raw_data.get("manufacturername")
-        self._recycle = self._raw_data.get("recycle")
-
-        # Update state and config caches using the sync method (avoids bridge writes)
-        self._state.sync_from_bridge_data(self._raw_data.get("state", {}))
-        self._config.sync_from_bridge_data(self._raw_data.get("config", {}))
-        logger.debug(f"Sensor {self.sensor_id} data refreshed successfully.")
+        self._populate_from_dict(raw)
+
+    def _populate_from_dict(self, raw: SensorData) -> None:
+        """Updates the local cache from a sensor dictionary fetched elsewhere."""
+        # Validate and convert everything once here, so the properties can
+        # return the cached attributes as they are
+        name = _optional(raw, "name", str)
+        modelid = _optional(raw, "modelid", str)
+        swversion = _optional(raw, "swversion", str)
+        sensor_type = _optional(raw, "type", str)
+        uniqueid = _optional(raw, "uniqueid", str)
+        manufacturername = _optional(raw, "manufacturername", str)
+        recycle = _optional(raw, "recycle", bool)
+
+        # Concurrent refreshes apply one after the other. Readers take no lock:
+        # each attribute is swapped in a single assignment.
+        with self._lock:
+            self._raw_data = raw
+            self._name = name
+            self._modelid = modelid
+            self._swversion = swversion
+            self._type = sensor_type
+            self._uniqueid = uniqueid
+            self._manufacturername = manufacturername
+            self._recycle = recycle
+
+            # Update state and config caches using the sync method (avoids bridge writes)
+            self._state.sync_from_bridge_data(raw.get("state", {}))
+            self._config.sync_from_bridge_data(raw.get("config", {}))
+            self._loaded = True
+        logger.debug("Sensor %s data refreshed successfully.", self.sensor_id)
 
     def _ensure_data(self) -> None:
         """Ensures sensor data has been fetched at least once, calling refresh() if needed."""
-        if self._raw_data is None:
-            logger.debug(f"Initial data fetch for sensor {self.sensor_id}")
+        if not self._loaded:
+            # A recent bulk /sensors fetch already has this sensor's data
+            cached = self.bridge._sensors_cache.get(self.sensor_id)
+            if cached is not None:
+                self._populate_from_dict(cached)
+                return
+            logger.debug("Initial data fetch for sensor %s", self.sensor_id)
             self.refresh()  # This will fetch and populate everything
 
     # --- Properties ---
@@ -202,22 +337,29 @@ class Sensor:
     @property
     def name(self) -> str:
         """Get or set the name of the sensor [string]. Fetches data on first access."""
-        self._ensure_data()
+        if not self._loaded:
+            self._ensure_data()
         # Provide a default/fallback if name is somehow missing after refresh
         return self._name or f"Sensor {self.sensor_id}"
 
     @name.setter
     def name(self, value: str) -> None:
-        if not isinstance(value, str):  # type: ignore[unnecessary-isinstance]
+        if not isinstance(value, str):  # pyright: ignore[reportUnnecessaryIsInstance]
             raise TypeError("Sensor name must be a string")
 
-        # Get the current name (ensures data is loaded if it wasn't already)
-        old_name = self.name
+        # Only load the sensor data if the current name isn't known yet
+        old_name = self._name
+        if old_name is None:
+            self._ensure_data()
+            old_name = self._name
         if old_name == value:
             return  # No change needed
 
         logger.debug(
-            f"Attempting to rename sensor {self.sensor_id} from '{old_name}' to '{value}'"
+            "Attempting to rename sensor %s from '%s' to '%s'",
+            self.sensor_id,
+            old_name,
+            value,
         )
         try:
             # Use bridge.set_sensor for top-level attributes like name
@@ -246,37 +388,43 @@ class Sensor:
     @property
     def modelid(self) -> str | None:
         """Get hardware model ID [string, read-only]. Fetches data on first access."""
-        self._ensure_data()
+        if not self._loaded:
+            self._ensure_data()
         return self._modelid
 
     @property
     def swversion(self) -> str | None:
         """Get firmware version [string, read-only]. Fetches data on first access."""
-        self._ensure_data()
+        if not self._loaded:
+            self._ensure_data()
         return self._swversion
 
     @property
     def type(self) -> str | None:
         """Get sensor type [string, read-only]. Fetches data on first access."""
-        self._ensure_data()
+        if not self._loaded:
+            self._ensure_data()
         return self._type
 
     @property
     def uniqueid(self) -> str | None:
         """Get unique device ID [string, read-only]. Fetches data on first access."""
-        self._ensure_data()
+        if not self._loaded:
+            self._ensure_data()
         return self._uniqueid
 
     @property
     def manufacturername(self) -> str | None:
         """Get manufacturer name [string, read-only]. Fetches data on first access."""
-        self._ensure_data()
+        if not self._loaded:
+            self._ensure_data()
         return self._manufacturername
 
     @property
     def recycle(self) -> bool | None:
         """Check if resource should be auto-removed [bool, read-only]. Fetches data on first access."""
-        self._ensure_data()
+        if not self._loaded:
+            self._ensure_data()
         return self._recycle
 
     # State and Config properties return the cached wrapper objects
@@ -288,7 +436,8 @@ class Sensor:
         Call `sensor.refresh()` to sync cache from the bridge.
         Fetches data on first access.
         """
-        self._ensure_data()
+        if not self._loaded:
+            self._ensure_data()
         return self._state
 
     # Removed state.setter - modifications happen via the returned object
@@ -301,7 +450,8 @@ class Sensor:
         Call `sensor.refresh()` to sync cache from the bridge.
         Fetches data on first access.
         """
-        self._ensure_data()
+        if not self._loaded:
+            self._ensure_data()
         return self._config
 
     # Removed config.setter - modifications happen via the returned object
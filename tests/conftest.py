@@ -0,0 +1,9 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def tmp_config_path(tmp_path: Path) -> str:
+    """Provide a temporary config file path for tests."""
+    return str(tmp_path / ".python_hue")
@@ -1,5 +1,9 @@
 from types import ModuleType
 
+import pytest
+
+pytestmark = pytest.mark.unit
+
 
 def test_import_works():
     import phue2
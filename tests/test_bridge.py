@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 import httpx
@@ -6,11 +7,7 @@ import respx
 
 import phue2
 
-
-@pytest.fixture
-def tmp_config_path(tmp_path: Path) -> str:
-    """Provide a temporary config file path for tests."""
-    return str(tmp_path / ".python_hue")
+pytestmark = pytest.mark.integration
 
 
 def test_bridge_discovery_and_registration(tmp_config_path: str) -> None:
@@ -117,3 +114,911 @@ def test_no_save_config(tmp_path: Path) -> None:
         # Verify that trying to connect again without IP fails (as config wasn't saved)
         with pytest.raises(phue2.PhueException):
             phue2.Bridge(config_file_path=str(config_file))
+
+
+def test_unregistered_bridge_fails_fast(tmp_config_path: str) -> None:
+    """Without a username, API calls raise instead of requesting /api/None."""
+    with respx.mock(assert_all_called=False) as mock:
+        route = mock.get(url__startswith="http://192.168.1.100/").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        bridge._username = None
+        with pytest.raises(phue2.PhueException):
+            bridge.get_light(1)
+        assert route.call_count == 0
+
+
+def test_async_mode_queues_commands(tmp_config_path: str) -> None:
+    """In async mode set_light returns immediately and flush() waits for the PUT."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.put(
+            "http://192.168.1.100/api/testuser/lights/1/state", name="set_state"
+        ).mock(
+            return_value=httpx.Response(
+                200, json=[{"success": {"/lights/1/state/on": True}}]
+            )
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100",
+            username="testuser",
+            config_file_path=tmp_config_path,
+            async_mode=True,
+        )
+        assert bridge.set_light(1, "on", True) == []
+        bridge.flush()
+        assert route.call_count == 1
+
+
+def test_async_mode_commands_invalidate_cached_state(tmp_config_path: str) -> None:
+    """A queued command stops the cached state from skipping the next one."""
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://192.168.1.100/api/testuser/lights/1", name="get_light").mock(
+            return_value=httpx.Response(
+                200, json={"name": "Test Light", "state": {"on": False, "bri": 100}}
+            )
+        )
+        route = mock.put(
+            "http://192.168.1.100/api/testuser/lights/1/state", name="set_state"
+        ).mock(
+            return_value=httpx.Response(
+                200, json=[{"success": {"/lights/1/state/on": True}}]
+            )
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100",
+            username="testuser",
+            config_file_path=tmp_config_path,
+            async_mode=True,
+            skip_unchanged=True,
+        )
+        assert bridge.get_light(1, "on") is False
+        bridge.set_light(1, "on", True)
+        bridge.flush()
+        assert bridge.set_light(1, "on", False) == []
+        bridge.flush()
+        assert route.call_count == 2
+
+
+def test_set_light_skips_noop_on_write(tmp_config_path: str) -> None:
+    """Turning on a light the bridge just reported as on sends no request."""
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://192.168.1.100/api/testuser/lights/1", name="get_light").mock(
+            return_value=httpx.Response(
+                200, json={"name": "Test Light", "state": {"on": True, "bri": 100}}
+            )
+        )
+        set_state = mock.put("http://192.168.1.100/api/testuser/lights/1/state")
+        set_state.mock(
+            return_value=httpx.Response(
+                200, json=[{"success": {"/lights/1/state/on": False}}]
+            )
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100",
+            username="testuser",
+            config_file_path=tmp_config_path,
+            skip_unchanged=True,
+        )
+        assert bridge.get_light(1, "on") is True
+
+        assert bridge.set_light(1, "on", True) == []
+        assert set_state.call_count == 0
+        bridge.set_light(1, "on", True, force=True)
+        assert set_state.call_count == 1
+
+        # A real change still goes out, and refresh() drops the cached state
+        bridge.set_light(1, "on", False)
+        assert set_state.call_count == 2
+        bridge.refresh()
+        bridge.set_light(1, "on", False)
+        assert set_state.call_count == 3
+
+        # Light.force passes through to the bridge
+        light = phue2.Light(bridge, 1)
+        light.force = True
+        light.on = False
+        assert set_state.call_count == 4
+
+        # Without opting in, every command is sent
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        assert bridge.get_light(1, "on") is True
+        bridge.set_light(1, "on", True)
+        assert set_state.call_count == 5
+
+
+def test_rejected_value_is_not_cached(tmp_config_path: str) -> None:
+    """Only attributes the bridge accepted count towards skipping unchanged writes."""
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://192.168.1.100/api/testuser/lights/1").mock(
+            return_value=httpx.Response(
+                200, json={"name": "Lamp", "state": {"on": False, "bri": 100}}
+            )
+        )
+        set_state = mock.put("http://192.168.1.100/api/testuser/lights/1/state").mock(
+            return_value=httpx.Response(
+                200,
+                json=[
+                    {"success": {"/lights/1/state/on": True}},
+                    {"error": {"type": 7, "description": "invalid value"}},
+                ],
+            )
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100",
+            username="testuser",
+            config_file_path=tmp_config_path,
+            skip_unchanged=True,
+        )
+        bridge.get_light(1)
+        bridge.set_light(1, {"on": True, "bri": 300})
+        bridge.set_light(1, "on", True)
+        assert set_state.call_count == 1
+        bridge.set_light(1, "bri", 300)
+        assert set_state.call_count == 2
+
+
+def test_group_reads_share_one_fetch(tmp_config_path: str) -> None:
+    """Reading several group properties costs a single GET until refresh()."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.get("http://192.168.1.100/api/testuser/groups/1").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "name": "Kitchen",
+                    "lights": ["1", "2"],
+                    "state": {"any_on": True, "all_on": False},
+                    "action": {"on": True, "bri": 200},
+                },
+            )
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        group = phue2.Group(bridge, 1)
+        assert group.name == "Kitchen"
+        assert group.any_on is True
+        assert group.all_on is False
+        assert group.brightness == 200
+        assert [light.light_id for light in group.lights] == [1, 2]
+        assert route.call_count == 1
+
+        group.refresh()
+        assert group.name == "Kitchen"
+        assert route.call_count == 2
+
+
+def test_light_objects_refresh(tmp_config_path: str) -> None:
+    """The light list is reused until refreshed, keeping Light objects by id."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.get("http://192.168.1.100/api/testuser/lights/").mock(
+            side_effect=[
+                httpx.Response(200, json={"1": {"name": "Lamp", "state": {}}}),
+                httpx.Response(200, json={"1": {"name": "Desk", "state": {}}}),
+                httpx.Response(200, json={"1": {"name": "Desk", "state": {}}}),
+            ]
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        lamp = bridge["Lamp"]
+        assert bridge.get_light_objects("id") == {1: lamp}
+        assert route.call_count == 1
+
+        assert bridge.get_light_objects("name", refresh=True) == {"Desk": lamp}
+        assert route.call_count == 2
+
+        bridge.refresh()
+        assert bridge[1] is lamp
+        assert route.call_count == 3
+
+
+def test_bridge_name_cached(tmp_config_path: str) -> None:
+    """The bridge name is fetched once and refetched only after refresh()."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.get("http://192.168.1.100/api/testuser/config").mock(
+            side_effect=[
+                httpx.Response(200, json={"name": "Hue"}),
+                httpx.Response(200, json={"name": "Attic"}),
+            ]
+        )
+        mock.put("http://192.168.1.100/api/testuser/config").mock(
+            return_value=httpx.Response(
+                200, json=[{"success": {"/config/name": "Den"}}]
+            )
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        assert bridge.name == "Hue"
+        assert bridge.name == "Hue"
+        assert route.call_count == 1
+
+        bridge.name = "Den"
+        assert bridge.name == "Den"
+        assert route.call_count == 1
+
+        bridge.refresh()
+        assert bridge.name == "Attic"
+        assert route.call_count == 2
+
+
+def test_run_scene_fetches_groups_and_scenes_once(tmp_config_path: str) -> None:
+    """run_scene matches on the raw documents and picks the scene by lights."""
+    with respx.mock(assert_all_called=True) as mock:
+        groups = mock.get("http://192.168.1.100/api/testuser/groups/").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "1": {"name": "Kitchen", "lights": ["2", "1"]},
+                    "2": {"name": "Hall", "lights": ["3"]},
+                },
+            )
+        )
+        scenes = mock.get("http://192.168.1.100/api/testuser/scenes").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "abc": {"name": "Bright", "lights": ["3"]},
+                    "def": {"name": "Bright", "lights": ["1", "2"]},
+                    "ghi": {"name": "Dim", "lights": ["1", "2"]},
+                },
+            )
+        )
+        action = mock.put("http://192.168.1.100/api/testuser/groups/1/action").mock(
+            return_value=httpx.Response(
+                200, json=[{"success": {"/groups/1/action/scene": "def"}}]
+            )
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        assert bridge.run_scene("Kitchen", "Bright") is True
+        assert (groups.call_count, scenes.call_count) == (1, 1)
+        assert json.loads(action.calls.last.request.content)["scene"] == "def"
+
+        # Later lookups fetch the scene list again, so new scenes show up
+        assert [scene.scene_id for scene in bridge.scenes] == ["abc", "def", "ghi"]
+        assert scenes.call_count == 2
+
+
+def test_activate_scenes_keeps_order(tmp_config_path: str) -> None:
+    """activate_scenes sends one action per group and returns them in order."""
+    with respx.mock(assert_all_called=True) as mock:
+        for group_id in (1, 2):
+            mock.put(
+                f"http://192.168.1.100/api/testuser/groups/{group_id}/action"
+            ).mock(
+                return_value=httpx.Response(
+                    200, json=[{"success": {f"/groups/{group_id}/action/scene": "x"}}]
+                )
+            )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        assert bridge.activate_scenes([(2, "evening"), (1, "evening")]) == [
+            [{"success": {"/groups/2/action/scene": "x"}}],
+            [{"success": {"/groups/1/action/scene": "x"}}],
+        ]
+
+
+def test_parameter_reads_share_one_get(tmp_config_path: str) -> None:
+    """Adjacent get_group parameter reads share a GET until something is written."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.get("http://192.168.1.100/api/testuser/groups/1").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "name": "Kitchen",
+                    "state": {"any_on": True},
+                    "action": {"bri": 9},
+                },
+            )
+        )
+        mock.put("http://192.168.1.100/api/testuser/groups/1/action").mock(
+            return_value=httpx.Response(
+                200, json=[{"success": {"/groups/1/action/bri": 9}}]
+            )
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        assert bridge.get_group(1, "any_on") is True
+        assert bridge.get_group(1, "bri") == 9
+        assert route.call_count == 1
+
+        bridge.set_group(1, "bri", 9)
+        assert bridge.get_group(1, "name") == "Kitchen"
+        assert route.call_count == 2
+
+
+def test_set_group_resolves_names_once(tmp_config_path: str) -> None:
+    """Renaming several groups by name resolves all the names with one GET."""
+    with respx.mock(assert_all_called=True) as mock:
+        groups = mock.get("http://192.168.1.100/api/testuser/groups/").mock(
+            return_value=httpx.Response(
+                200, json={"1": {"name": "Kitchen"}, "2": {"name": "Hall"}}
+            )
+        )
+        for group_id in (1, 2):
+            mock.put(f"http://192.168.1.100/api/testuser/groups/{group_id}").mock(
+                return_value=httpx.Response(
+                    200, json=[{"success": {f"/groups/{group_id}/name": "Den"}}]
+                )
+            )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        assert len(bridge.set_group(["Kitchen", "Hall"], "name", "Den")) == 2
+        assert groups.call_count == 1
+
+
+def test_request_body_is_compact_json(tmp_config_path: str) -> None:
+    """Command bodies go out as compact JSON with a JSON content type."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.put("http://192.168.1.100/api/testuser/lights/1/state").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        bridge.request("PUT", "/api/testuser/lights/1/state", {"on": True, "bri": 5})
+        request = route.calls.last.request
+        assert request.content == b'{"on":true,"bri":5}'
+        assert request.headers["Content-Type"] == "application/json"
+
+
+def test_lights_in_id_order(tmp_config_path: str) -> None:
+    """bridge.lights comes back in numeric id order, not the bridge's order."""
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://192.168.1.100/api/testuser/lights/").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "10": {"name": "Hall", "state": {}},
+                    "2": {"name": "Desk", "state": {}},
+                    "1": {"name": "Lamp", "state": {}},
+                },
+            )
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        assert [light.light_id for light in bridge.lights] == [1, 2, 10]
+
+
+def test_light_batch_sends_one_command(tmp_config_path: str) -> None:
+    """Settings made inside Light.batch() go out as a single state PUT."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.put("http://192.168.1.100/api/testuser/lights/1/state").mock(
+            return_value=httpx.Response(200, json=[{"success": {}}])
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        light = phue2.Light(bridge, 1)
+        light.transitiontime = 4
+        with light.batch():
+            light.brightness = 200
+            light.hue = 10000
+            assert route.call_count == 0
+
+        assert route.call_count == 1
+        assert json.loads(route.calls.last.request.content) == {
+            "bri": 200,
+            "hue": 10000,
+            "transitiontime": 4,
+        }
+
+
+def test_sensor_update_sends_one_command(tmp_config_path: str) -> None:
+    """SensorConfig.update() sends every changed key in one PUT."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.put("http://192.168.1.100/api/testuser/sensors/2/config").mock(
+            return_value=httpx.Response(200, json=[{"success": {}}])
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        config = phue2.SensorConfig(bridge, 2, {"on": True, "sensitivity": 1})
+        config.update({"on": True, "sensitivity": 2, "ledindication": False})
+
+        assert route.call_count == 1
+        assert json.loads(route.calls.last.request.content) == {
+            "sensitivity": 2,
+            "ledindication": False,
+        }
+
+
+def test_light_reads_share_one_fetch(tmp_config_path: str) -> None:
+    """Reading several light properties costs one GET; a write expires it."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.get("http://192.168.1.100/api/testuser/lights/1").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "name": "Lamp",
+                    "type": "Extended color light",
+                    "state": {"on": True, "bri": 100, "hue": 500, "reachable": True},
+                },
+            )
+        )
+        mock.put("http://192.168.1.100/api/testuser/lights/1/state").mock(
+            return_value=httpx.Response(200, json=[{"success": {}}])
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        light = phue2.Light(bridge, 1)
+        assert (light.name, light.on, light.brightness, light.hue) == (
+            "Lamp",
+            True,
+            100,
+            500,
+        )
+        assert light.reachable is True
+        assert route.call_count == 1
+
+        light.brightness = 50
+        assert light.type == "Extended color light"
+        assert route.call_count == 2
+
+
+def test_close_releases_client(tmp_config_path: str) -> None:
+    """Requests share one pooled client until the bridge is closed."""
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://192.168.1.100/api/testuser/config").mock(
+            return_value=httpx.Response(200, json={"name": "Bridge"})
+        )
+
+        with phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        ) as bridge:
+            bridge.request("GET", "/api/testuser/config")
+            client = bridge._client
+            bridge.request("GET", "/api/testuser/config")
+            assert bridge._client is client
+
+        assert client is not None and client.is_closed
+        assert bridge._client is None
+
+
+def test_bulk_light_helpers(tmp_config_path: str) -> None:
+    """One /lights GET primes every Light; parallel writes keep their order."""
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://192.168.1.100/api/testuser/lights/").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "1": {"name": "Lamp", "state": {"on": True, "bri": 10}},
+                    "2": {"name": "Desk", "state": {"on": False, "bri": 20}},
+                },
+            )
+        )
+        for light_id in (1, 2):
+            mock.put(f"http://192.168.1.100/api/testuser/lights/{light_id}/state").mock(
+                return_value=httpx.Response(
+                    200, json=[{"success": {f"/lights/{light_id}/state/bri": 1}}]
+                )
+            )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        lamp, desk = bridge.lights
+        bridge.get_all_lights()
+        assert (lamp.brightness, desk.on) == (10, False)
+
+        results = bridge.set_lights_parallel([(1, {"bri": 1}), (2, {"bri": 1})])
+        assert results == [
+            [{"success": {"/lights/1/state/bri": 1}}],
+            [{"success": {"/lights/2/state/bri": 1}}],
+        ]
+
+
+def test_set_light_uses_matching_group(tmp_config_path: str) -> None:
+    """A command for exactly a group's lights goes out as one group action."""
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://192.168.1.100/api/testuser/groups/").mock(
+            return_value=httpx.Response(
+                200, json={"3": {"name": "Office", "lights": ["1", "2"]}}
+            )
+        )
+        action = mock.put("http://192.168.1.100/api/testuser/groups/3/action").mock(
+            return_value=httpx.Response(
+                200, json=[{"success": {"/groups/3/action/bri": 100}}]
+            )
+        )
+        per_light = mock.put(
+            url__regex=r"http://192.168.1.100/api/testuser/lights/\d/state"
+        ).mock(return_value=httpx.Response(200, json=[{"success": {}}]))
+        mock.get("http://192.168.1.100/api/testuser/lights/3").mock(
+            return_value=httpx.Response(200, json={"state": {"on": True, "bri": 50}})
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100",
+            username="testuser",
+            config_file_path=tmp_config_path,
+            group_commands=True,
+        )
+        assert bridge.set_light([2, 1], "bri", 100) == [
+            [{"success": {"/groups/3/action/bri": 100}}]
+        ]
+        assert action.call_count == 1
+
+        # No group has exactly these lights, so each one gets its own command
+        bridge.set_light([1, 3], "bri", 100)
+        assert (action.call_count, per_light.call_count) == (1, 2)
+
+        # The group action may have changed lights outside the request too, as
+        # its members might have changed since they were cached
+        bridge = phue2.Bridge(
+            ip="192.168.1.100",
+            username="testuser",
+            config_file_path=tmp_config_path,
+            group_commands=True,
+            skip_unchanged=True,
+        )
+        assert bridge.get_light(3, "bri") == 50
+        bridge.set_light([2, 1], "bri", 100)
+        bridge.set_light(3, "bri", 50)
+        assert (action.call_count, per_light.call_count) == (2, 3)
+
+        # Without opting in, lists of lights are always sent light by light
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        bridge.set_light([2, 1], "bri", 50)
+        assert (action.call_count, per_light.call_count) == (2, 5)
+
+
+def test_light_names_resolve_with_one_fetch(tmp_config_path: str) -> None:
+    """Several named lights are resolved from a single /lights fetch."""
+    with respx.mock(assert_all_called=True) as mock:
+        lights = mock.get("http://192.168.1.100/api/testuser/lights/").mock(
+            return_value=httpx.Response(
+                200, json={"1": {"name": "Lamp"}, "2": {"name": "Desk"}}
+            )
+        )
+        puts = mock.put(
+            url__regex=r"http://192.168.1.100/api/testuser/lights/\d/state"
+        ).mock(return_value=httpx.Response(200, json=[{"success": {}}]))
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        bridge.set_light(["Lamp", "Desk"], "on", False)
+        assert bridge.get_light_id_by_name("Desk") == 2
+        assert bridge.get_light_id_by_name("Nope") is None
+        assert (lights.call_count, puts.call_count) == (1, 2)
+
+
+async def test_async_bridge_sends_light_commands_together(tmp_config_path: str) -> None:
+    """AsyncBridge resolves names once and sends every command concurrently."""
+    with respx.mock(assert_all_called=True) as mock:
+        lights = mock.get("http://192.168.1.100/api/testuser/lights/").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "1": {"name": "Lamp", "state": {"on": False}},
+                    "2": {"name": "Desk", "state": {"on": False}},
+                },
+            )
+        )
+        for light_id in (1, 2):
+            mock.put(f"http://192.168.1.100/api/testuser/lights/{light_id}/state").mock(
+                return_value=httpx.Response(
+                    200, json=[{"success": {f"/lights/{light_id}/state/on": True}}]
+                )
+            )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100",
+            username="testuser",
+            config_file_path=tmp_config_path,
+            skip_unchanged=True,
+        )
+        async with phue2.AsyncBridge(bridge) as ab:
+            results = await ab.set_light(["Desk", 1], "on", True)
+            assert results == [
+                [{"success": {"/lights/2/state/on": True}}],
+                [{"success": {"/lights/1/state/on": True}}],
+            ]
+            assert lights.call_count == 1
+
+            # The sent state was cached, so repeating the command is a no-op
+            assert await ab.set_light(2, "on", True) == []
+
+
+async def test_async_bridge_sends_group_commands_together(
+    tmp_config_path: str,
+) -> None:
+    """AsyncBridge.set_group resolves group names once and sends each action."""
+    with respx.mock(assert_all_called=True) as mock:
+        groups = mock.get("http://192.168.1.100/api/testuser/groups/").mock(
+            return_value=httpx.Response(
+                200, json={"1": {"name": "Kitchen"}, "2": {"name": "Hall"}}
+            )
+        )
+        for group_id in (1, 2):
+            mock.put(
+                f"http://192.168.1.100/api/testuser/groups/{group_id}/action"
+            ).mock(
+                return_value=httpx.Response(
+                    200, json=[{"success": {f"/groups/{group_id}/action/on": True}}]
+                )
+            )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        async with phue2.AsyncBridge(bridge) as ab:
+            results = await ab.set_group(["Hall", "Kitchen", "Nope"], "on", True)
+            assert results == [
+                [{"success": {"/groups/2/action/on": True}}],
+                [{"success": {"/groups/1/action/on": True}}],
+            ]
+            assert groups.call_count == 1
+
+
+async def test_async_bridge_run_scene(tmp_config_path: str) -> None:
+    """AsyncBridge.run_scene fetches groups and scenes together, then activates."""
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://192.168.1.100/api/testuser/groups/").mock(
+            return_value=httpx.Response(
+                200, json={"1": {"name": "Kitchen", "lights": ["1"]}}
+            )
+        )
+        mock.get("http://192.168.1.100/api/testuser/scenes").mock(
+            return_value=httpx.Response(200, json={"abc": {"name": "Bright"}})
+        )
+        action = mock.put("http://192.168.1.100/api/testuser/groups/1/action").mock(
+            return_value=httpx.Response(
+                200, json=[{"success": {"/groups/1/action/scene": "abc"}}]
+            )
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        async with phue2.AsyncBridge(bridge) as ab:
+            assert await ab.run_scene("Kitchen", "Bright") is True
+            assert await ab.run_scene("Kitchen", "Nope") is False
+        assert json.loads(action.calls.last.request.content) == {
+            "scene": "abc",
+            "transitiontime": 4,
+        }
+        assert action.call_count == 1
+
+
+def test_sensors_share_bulk_fetch(tmp_config_path: str) -> None:
+    """Sensors are populated from the /sensors list instead of one GET each."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.get("http://192.168.1.100/api/testuser/sensors/").mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    json={
+                        "1": {"name": "Daylight", "state": {"daylight": True}},
+                        "2": {"name": "Switch", "state": {"buttonevent": 1002}},
+                    },
+                ),
+                httpx.Response(
+                    200,
+                    json={
+                        "1": {"name": "Daylight", "state": {"daylight": False}},
+                        "2": {"name": "Switch", "state": {"buttonevent": 1002}},
+                    },
+                ),
+            ]
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        daylight, switch = bridge.get_sensor_objects()
+        assert (daylight.name, switch.name) == ("Daylight", "Switch")
+        assert daylight.state["daylight"] is True
+
+        bridge.get_all_sensors()
+        assert daylight.state["daylight"] is False
+        assert route.call_count == 2
+
+
+def test_light_setter_skips_unchanged_value(tmp_config_path: str) -> None:
+    """Re-setting a known value sends nothing unless force is set."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.put("http://192.168.1.100/api/testuser/lights/1/state").mock(
+            return_value=httpx.Response(200, json=[{"success": {}}])
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        light = phue2.Light(bridge, 1)
+        light.hue = 1000
+        light.hue = 1000
+        light.xy = (0.3, 0.4)
+        light.xy = (0.30001, 0.4)
+        assert route.call_count == 2
+
+        light.force = True
+        light.hue = 1000
+        assert route.call_count == 3
+
+
+def test_light_resets_brightness_after_transitioned_off(tmp_config_path: str) -> None:
+    """Turning on after a transitioned power-off sends the old brightness again."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.put("http://192.168.1.100/api/testuser/lights/1/state").mock(
+            return_value=httpx.Response(200, json=[{"success": {}}])
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        light = phue2.Light(bridge, 1)
+        light.brightness = 100
+        light.on = True
+        light.transitiontime = 4
+        light.on = False
+        light.on = True
+        assert json.loads(route.calls.last.request.content) == {
+            "bri": 100,
+            "transitiontime": 4,
+        }
+
+
+def test_light_batch_keeps_brightness_reset(tmp_config_path: str) -> None:
+    """A transitioned power-off inside batch() still restores brightness on power-on."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.put("http://192.168.1.100/api/testuser/lights/1/state").mock(
+            return_value=httpx.Response(200, json=[{"success": {}}])
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        light = phue2.Light(bridge, 1)
+        light.brightness = 100
+        light.transitiontime = 4
+        with light.batch():
+            light.on = False
+        light.on = True
+        assert json.loads(route.calls.last.request.content) == {
+            "bri": 100,
+            "transitiontime": 4,
+        }
+
+
+def test_light_setter_sends_after_bridge_write(tmp_config_path: str) -> None:
+    """A Bridge write between two Light setter calls stops the second being skipped."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.put("http://192.168.1.100/api/testuser/lights/1/state").mock(
+            return_value=httpx.Response(200, json=[{"success": {}}])
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        light = phue2.Light(bridge, 1)
+        light.on = False
+        bridge.set_light(1, "on", True)
+        light.on = False
+        assert route.call_count == 3
+        assert json.loads(route.calls.last.request.content) == {"on": False}
+
+
+def test_get_retries_dropped_connection(tmp_config_path: str) -> None:
+    """A GET on a connection the bridge closed is sent once more; writes are not."""
+    with respx.mock(assert_all_called=True) as mock:
+        get = mock.get("http://192.168.1.100/api/testuser/config").mock(
+            side_effect=[
+                httpx.RemoteProtocolError("Server disconnected"),
+                httpx.Response(200, json={"name": "Bridge"}),
+            ]
+        )
+        put = mock.put("http://192.168.1.100/api/testuser/lights/1/state").mock(
+            side_effect=httpx.ReadError("Connection reset")
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        assert bridge.name == "Bridge"
+        assert get.call_count == 2
+        with pytest.raises(phue2.PhueException):
+            bridge.set_light(1, "on", True)
+        assert put.call_count == 1
+
+
+def test_prewarm_opens_pooled_connections(tmp_config_path: str) -> None:
+    """Prewarming sends one HEAD per keep-alive slot and tolerates failures."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.head("http://192.168.1.100/").mock(
+            side_effect=[httpx.Response(200)] * 3 + [httpx.ConnectError("refused")]
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        bridge._prewarm()
+        assert route.call_count == 4
+
+
+def test_sensor_writes_coalesce(tmp_config_path: str) -> None:
+    """Writes inside a with block, or within the debounce window, send once."""
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.put("http://192.168.1.100/api/testuser/sensors/2/config").mock(
+            return_value=httpx.Response(200, json=[{"success": {}}])
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        config = phue2.SensorConfig(bridge, 2, {"on": False})
+        with config:
+            config["on"] = True
+            config["sensitivity"] = 2
+            assert route.call_count == 0
+        assert route.call_count == 1
+        assert json.loads(route.calls.last.request.content) == {
+            "on": True,
+            "sensitivity": 2,
+        }
+
+        config.debounce = 60.0
+        config["on"] = False
+        config["ledindication"] = True
+        assert route.call_count == 1
+        config.flush()
+        assert route.call_count == 2
+        assert json.loads(route.calls.last.request.content) == {
+            "on": False,
+            "ledindication": True,
+        }
+
+
+def test_light_rename_uses_known_name(tmp_config_path: str) -> None:
+    """Renaming a light whose name is known sends only the PUT."""
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://192.168.1.100/api/testuser/lights/").mock(
+            return_value=httpx.Response(200, json={"1": {"name": "Lamp", "state": {}}})
+        )
+        rename = mock.put("http://192.168.1.100/api/testuser/lights/1").mock(
+            return_value=httpx.Response(
+                200, json=[{"success": {"/lights/1/name": "Desk"}}]
+            )
+        )
+
+        bridge = phue2.Bridge(
+            ip="192.168.1.100", username="testuser", config_file_path=tmp_config_path
+        )
+        light = bridge["Lamp"]
+        assert light.name == "Lamp"
+        light.name = "Desk"
+
+        assert rename.call_count == 1
+        assert light.name == "Desk"
+        assert bridge.lights_by_name == {"Desk": light}
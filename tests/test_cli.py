@@ -1,5 +1,7 @@
 """Test the CLI functionality in the __main__ module."""
 
+import json
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -8,12 +10,22 @@ import pytest
 import respx
 
 from phue2 import Bridge
-from phue2.__main__ import main
+from phue2.__main__ import (
+    _build_parser,
+    _load_config,
+    configure_styling,
+    main,
+    parse_args,
+)
+
+pytestmark = pytest.mark.integration
 
 
 @pytest.fixture(autouse=True)
-def disable_styling(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("phue2.__main__.DISABLE_STYLING", True)
+def disable_styling() -> Iterator[None]:
+    configure_styling(True)
+    yield
+    configure_styling(False)
 
 
 def test_cli_help() -> None:
@@ -25,6 +37,25 @@ def test_cli_help() -> None:
     assert excinfo.value.code == 0
 
 
+def test_parse_args_builds_only_the_named_subparser() -> None:
+    """Only the command on the line gets a subparser; options are skipped over."""
+    argv = ["--host", "get", "set", "group", "Kitchen", "--on"]
+    args = parse_args(argv)
+    assert (args.host, args.command, args.resource, args.on) == (
+        "get",
+        "set",
+        "group",
+        True,
+    )
+    parser = _build_parser(argv)
+    subparsers = parser._subparsers._group_actions[0]  # type: ignore[union-attr]
+    assert list(subparsers.choices) == ["set"]
+
+    parser = _build_parser([])
+    subparsers = parser._subparsers._group_actions[0]  # type: ignore[union-attr]
+    assert list(subparsers.choices) == ["list", "ls", "get", "set"]
+
+
 def test_cli_missing_args() -> None:
     """Test that the CLI errors when no host or command is provided but no config exists."""
     with patch("phue2.__main__.get_bridge_from_config", return_value=None):
@@ -74,6 +105,7 @@ def test_cli_retry_on_registration_exception(tmp_path: Path) -> None:
 
     # Mock the input function to simulate pressing the button
     with (
+        patch("sys.stdin.isatty", return_value=True),
         patch("builtins.input", return_value=""),
         patch("phue2._internal.console.console.warning") as mock_warning,
         patch("phue2._internal.console.console.success") as mock_success,
@@ -89,6 +121,35 @@ def test_cli_retry_on_registration_exception(tmp_path: Path) -> None:
         mock_success.assert_called_with("Successfully connected to the bridge!")
 
 
+@respx.mock
+def test_cli_registration_gives_up_when_not_interactive(tmp_path: Path) -> None:
+    """Scripted runs back off between attempts and stop instead of prompting."""
+    respx.post("http://192.168.1.100/api").mock(
+        return_value=httpx.Response(
+            200,
+            json=[{"error": {"type": 101, "description": "link button not pressed"}}],
+        )
+    )
+
+    with (
+        patch("sys.stdin.isatty", return_value=False),
+        patch("builtins.input") as mock_input,
+        patch("time.sleep") as mock_sleep,
+        patch("phue2._internal.console.console.warning"),
+        patch("phue2._internal.console.console.error") as mock_error,
+    ):
+        result = main(
+            ["--host", "192.168.1.100", "--config-file-path", str(tmp_path / "c")]
+        )
+
+    assert result == 1
+    mock_input.assert_not_called()
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0, 4.0, 8.0]
+    mock_error.assert_called_once_with(
+        "Could not register with the bridge after 5 attempts"
+    )
+
+
 @pytest.mark.parametrize(
     "resource,attribute",
     [
@@ -97,7 +158,9 @@ def test_cli_retry_on_registration_exception(tmp_path: Path) -> None:
         ("scenes", "scenes"),
     ],
 )
-def test_cli_list_command(resource: str, attribute: str) -> None:
+def test_cli_list_command(
+    resource: str, attribute: str, capsys: pytest.CaptureFixture[str]
+) -> None:
     """Test that the list command shows the correct items."""
     # Create mock Bridge and items
     mock_bridge = MagicMock(spec=Bridge)
@@ -105,7 +168,7 @@ def test_cli_list_command(resource: str, attribute: str) -> None:
     setattr(mock_bridge, attribute, mock_items)
 
     with (
-        patch("phue2.__main__.Bridge", return_value=mock_bridge),
+        patch("phue2.Bridge", return_value=mock_bridge),
         patch("phue2.__main__.get_bridge_from_config", return_value=None),
         patch("phue2._internal.console.console.info") as mock_info,
     ):
@@ -114,6 +177,9 @@ def test_cli_list_command(resource: str, attribute: str) -> None:
         assert result == 0
         # Check that it reported the resource type
         mock_info.assert_any_call(f"{resource.upper()} ({len(mock_items)}):")
+        # Unstyled items are written straight to stdout, one line each
+        out = capsys.readouterr().out.splitlines()
+        assert len([line for line in out if line.startswith("  ")]) == len(mock_items)
 
 
 def test_cli_get_command() -> None:
@@ -133,7 +199,7 @@ def test_cli_get_command() -> None:
     mock_bridge.lights_by_id = {}
 
     with (
-        patch("phue2.__main__.Bridge", return_value=mock_bridge),
+        patch("phue2.Bridge", return_value=mock_bridge),
         patch("phue2.__main__.get_bridge_from_config", return_value=None),
         patch("phue2._internal.console.console.info") as mock_info,
     ):
@@ -154,7 +220,7 @@ def test_cli_set_command() -> None:
     mock_bridge.lights_by_name = {}
 
     with (
-        patch("phue2.__main__.Bridge", return_value=mock_bridge),
+        patch("phue2.Bridge", return_value=mock_bridge),
         patch("phue2.__main__.get_bridge_from_config", return_value=None),
         patch("phue2._internal.console.console.success") as mock_success,
     ):
@@ -166,3 +232,98 @@ def test_cli_set_command() -> None:
         mock_success.assert_called_with("Updated light 'Test Light'")
         assert mock_light.on is True
         assert mock_light.brightness == 200
+
+
+def test_load_config_reads_current_file(tmp_path: Path) -> None:
+    """Each read returns what is on disk now, or None for a missing file."""
+    config_path = tmp_path / ".python_hue"
+    config_path.write_text(json.dumps({"192.168.1.100": {"username": "a"}}))
+    assert _load_config(str(config_path)) == {"192.168.1.100": {"username": "a"}}
+
+    config_path.write_text(json.dumps({"192.168.1.100": {"username": "bb"}}))
+    assert _load_config(str(config_path)) == {"192.168.1.100": {"username": "bb"}}
+    assert _load_config(str(tmp_path / "missing")) is None
+
+
+@respx.mock
+def test_cli_get_light_loads_lights_from_bridge(tmp_path: Path) -> None:
+    """Looking up a light loads the bridge's lights when none are known yet."""
+    respx.post("http://192.168.1.100/api").mock(
+        return_value=httpx.Response(200, json=[{"success": {"username": "testuser"}}])
+    )
+    respx.get("http://192.168.1.100/api/testuser/lights/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "1": {
+                    "name": "Desk",
+                    "type": "Extended color light",
+                    "state": {
+                        "on": True,
+                        "bri": 254,
+                        "hue": 10000,
+                        "sat": 200,
+                        "reachable": True,
+                    },
+                }
+            },
+        )
+    )
+
+    with patch("phue2._internal.console.console.info") as mock_info:
+        result = main(
+            [
+                "--host",
+                "192.168.1.100",
+                "--config-file-path",
+                str(tmp_path / ".python_hue"),
+                "get",
+                "light",
+                "1",
+            ]
+        )
+
+    assert result == 0
+    mock_info.assert_any_call("LIGHT: Desk")
+
+
+@respx.mock
+def test_cli_set_light_sends_one_command(tmp_path: Path) -> None:
+    """All requested changes to a light go out in a single PUT."""
+    respx.post("http://192.168.1.100/api").mock(
+        return_value=httpx.Response(200, json=[{"success": {"username": "testuser"}}])
+    )
+    respx.get("http://192.168.1.100/api/testuser/lights/").mock(
+        return_value=httpx.Response(
+            200,
+            json={"1": {"name": "Desk", "state": {"on": False, "bri": 1, "hue": 0}}},
+        )
+    )
+    put = respx.put("http://192.168.1.100/api/testuser/lights/1/state").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+
+    result = main(
+        [
+            "--host",
+            "192.168.1.100",
+            "--config-file-path",
+            str(tmp_path / ".python_hue"),
+            "set",
+            "light",
+            "1",
+            "--on",
+            "--bri",
+            "200",
+            "--hue",
+            "5000",
+        ]
+    )
+
+    assert result == 0
+    assert put.call_count == 1
+    assert json.loads(put.calls.last.request.content) == {
+        "on": True,
+        "bri": 200,
+        "hue": 5000,
+    }
@@ -0,0 +1,17 @@
+import pytest
+
+from phue2._internal import jsonlib
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_dumps_matches_across_backends(
+    backend: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Both backends encode the same compact JSON, including non-str keys."""
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(jsonlib, "_dumps", jsonlib._stdlib_dumps)
+    assert jsonlib.dumps({1: True, "bri": [1, 2]}) == b'{"1":true,"bri":[1,2]}'
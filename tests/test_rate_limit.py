@@ -0,0 +1,41 @@
+"""Test the client-side rate limiter."""
+
+from unittest import mock
+
+import pytest
+
+import phue2
+from phue2._internal.rate_limit import TokenBucket
+
+
+@pytest.mark.unit
+def test_token_bucket_allows_burst_then_waits():
+    """A full bucket hands out its capacity without waiting, then throttles."""
+    bucket = TokenBucket(capacity=2, rate=1)
+    with mock.patch("phue2._internal.rate_limit.time.sleep") as sleep:
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == pytest.approx(1, abs=0.05)
+        sleep.assert_called_once()
+
+
+@pytest.mark.unit
+def test_token_bucket_reserve_does_not_sleep():
+    """reserve() takes the token and reports the wait instead of sleeping."""
+    bucket = TokenBucket(capacity=1, rate=2)
+    with mock.patch("phue2._internal.rate_limit.time.sleep") as sleep:
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.5, abs=0.05)
+        sleep.assert_not_called()
+
+
+@pytest.mark.integration
+def test_bridge_rate_limit_acquires_per_light():
+    """Each light command takes a token when rate limiting is enabled."""
+    with mock.patch("phue2.Bridge.request") as req:
+        req.return_value = [{"success": {}}]
+        bridge = phue2.Bridge(ip="10.0.0.0", username="username", rate_limit=True)
+        assert bridge._lights_bucket is not None
+        with mock.patch.object(bridge._lights_bucket, "acquire") as acquire:
+            bridge.set_light([1, 2, 3], "on", True)
+            assert acquire.call_count == 3
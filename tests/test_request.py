@@ -3,8 +3,6 @@
 # This is a basic test file which just tests that things import, which
 # means that this is even vaguely python code.
 
-import os
-from collections.abc import Generator
 from pathlib import Path
 from typing import Any
 from unittest import mock
@@ -13,29 +11,35 @@ import pytest
 
 import phue2
 
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(scope="module")
+def patched_request(request: pytest.FixtureRequest) -> mock.MagicMock:
+    """Patch Bridge.request once for the whole module."""
+    patcher = mock.patch("phue2.Bridge.request")
+    request.addfinalizer(patcher.stop)
+    return patcher.start()
 
-@pytest.fixture
-def temp_home(tmp_path: Path) -> Generator[Path, None, None]:
-    """Fixture that provides a temporary home directory."""
-    old_home = os.environ.get("HOME")
-    os.environ["HOME"] = str(tmp_path)
-    yield tmp_path
-    if old_home is not None:
-        os.environ["HOME"] = old_home
 
+@pytest.fixture(autouse=True)
+def _fresh_request(patched_request: mock.MagicMock) -> None:
+    """Give every test an unconfigured Bridge.request mock."""
+    patched_request.reset_mock(return_value=True, side_effect=True)
 
-def test_register(temp_home: Path):
+
+def test_register(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, patched_request: mock.MagicMock
+):
     """test that registration happens automatically during setup."""
-    confname = os.path.join(temp_home, ".python_hue")
-    with mock.patch("phue2.Bridge.request") as req:
-        req.return_value = [{"success": {"username": "fooo"}}]
-        bridge = phue2.Bridge(ip="10.0.0.0")
-        assert bridge.config_file_path == confname
+    monkeypatch.setenv("HOME", str(tmp_path))
+    confname = tmp_path / ".python_hue"
+    patched_request.return_value = [{"success": {"username": "fooo"}}]
+    bridge = phue2.Bridge(ip="10.0.0.0")
+    assert bridge.config_file_path == str(confname)
 
     # check contents of file
-    with open(confname) as f:
-        contents = f.read()
-        assert contents == '{"10.0.0.0": {"username": "fooo"}}'
+    assert confname.read_text() == '{"10.0.0.0": {"username": "fooo"}}'
 
     # make sure we can open under a different file
     bridge2 = phue2.Bridge(ip="10.0.0.0")
@@ -47,54 +51,61 @@ def test_register(temp_home: Path):
     assert bridge3.ip == "10.0.0.0"
 
 
-def test_register_fail():
-    """Test that registration fails in the expected way for timeout"""
-    with mock.patch("phue2.Bridge.request") as req:
-        req.return_value = [{"error": {"type": 101}}]
-        with pytest.raises(phue2.PhueRegistrationException):
-            phue2.Bridge(ip="10.0.0.0")
-
-
-def test_register_unknown_user():
-    """Test that registration for unknown user works."""
-    with mock.patch("phue2.Bridge.request") as req:
-        req.return_value = [{"error": {"type": 7}}]
-        with pytest.raises(phue2.PhueException):
-            phue2.Bridge(ip="10.0.0.0")
+@pytest.mark.parametrize(
+    ("error_type", "exception"),
+    [
+        (101, phue2.PhueRegistrationException),  # link button not pressed
+        (7, phue2.PhueException),  # unknown user
+    ],
+    ids=["link-button-not-pressed", "unknown-user"],
+)
+def test_register_error(
+    patched_request: mock.MagicMock, error_type: int, exception: type[Exception]
+):
+    """Test that registration errors from the bridge raise the expected exception."""
+    patched_request.return_value = [{"error": {"type": error_type}}]
+    with pytest.raises(exception):
+        phue2.Bridge(ip="10.0.0.0")
+
+
+# Shared by both fake endpoints and every call, so it must not be mutated
+_LIVING_ROOM_BULB = {
+    "name": "Living Room Bulb",
+    "state": {"on": True, "bri": 254, "hue": 10000, "sat": 254},
+    "type": "Extended color light",
+    "modelid": "LCT001",
+}
+
+# Responses of a bridge with a single light, by address
+_LIGHTS_API_RESPONSES: dict[str, dict[str, Any]] = {
+    "/api/username/lights/": {"1": _LIVING_ROOM_BULB},
+    "/api/username/lights/1": _LIVING_ROOM_BULB,
+}
+
+
+def _lights_api(
+    method: str, address: str, data: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Answer requests for a bridge with a single light."""
+    try:
+        return _LIGHTS_API_RESPONSES[address]
+    except KeyError:
+        raise ValueError(f"Unexpected API call: {method} {address} {data}") from None
+
+
+@pytest.fixture(scope="module")
+def _lights_bridge(patched_request: mock.MagicMock) -> phue2.Bridge:
+    # Built once per module, since the tests using it only read from it
+    return phue2.Bridge(ip="10.0.0.0", username="username")
 
 
 @pytest.fixture
-def mock_bridge():
+def mock_bridge(
+    _lights_bridge: phue2.Bridge, patched_request: mock.MagicMock
+) -> phue2.Bridge:
     """Fixture that provides a bridge with mocked request method."""
-    with mock.patch("phue2.Bridge.request") as mock_request:
-        # Mock the lights collection endpoint
-
-        def mock_request_side_effect(
-            method: str, address: str, data: dict[str, Any] | None = None
-        ) -> dict[str, Any]:
-            if address == "/api/username/lights/":
-                return {
-                    "1": {
-                        "name": "Living Room Bulb",
-                        "state": {"on": True, "bri": 254, "hue": 10000, "sat": 254},
-                        "type": "Extended color light",
-                        "modelid": "LCT001",
-                    }
-                }
-            elif address == "/api/username/lights/1":
-                return {
-                    "name": "Living Room Bulb",
-                    "state": {"on": True, "bri": 254, "hue": 10000, "sat": 254},
-                    "type": "Extended color light",
-                    "modelid": "LCT001",
-                }
-            else:
-                raise ValueError(f"Unexpected API call: {method} {address} {data}")
-
-        mock_request.side_effect = mock_request_side_effect
-
-        bridge = phue2.Bridge(ip="10.0.0.0", username="username")
-        yield bridge
+    patched_request.side_effect = _lights_api
+    return _lights_bridge
 
 
 def test_get_lights(mock_bridge: phue2.Bridge):
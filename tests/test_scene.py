@@ -1,11 +1,16 @@
 """Test the Scene class."""
 
+import pytest
+
 from phue2.scene import Scene
 
+pytestmark = pytest.mark.unit
 
-def test_scene_creation():
-    """Test creating a Scene object with standard parameters."""
-    scene = Scene(
+
+@pytest.fixture(scope="module")
+def basic_scene() -> Scene:
+    """A scene with standard parameters, shared by tests that only read it."""
+    return Scene(
         sid="1",
         name="Test Scene",
         lights=["1", "2", "3"],
@@ -13,11 +18,18 @@ def test_scene_creation():
         type="GroupScene",
     )
 
-    assert scene.scene_id == "1"
-    assert scene.name == "Test Scene"
-    assert scene.lights == [1, 2, 3]
-    assert scene.group == "0"
-    assert scene.type == "GroupScene"
+
+def test_scene_creation(basic_scene: Scene):
+    """Test creating a Scene object with standard parameters."""
+    scene = basic_scene
+
+    assert (scene.scene_id, scene.name, scene.lights, scene.group, scene.type) == (
+        "1",
+        "Test Scene",
+        [1, 2, 3],
+        "0",
+        "GroupScene",
+    )
 
 
 def test_scene_with_additional_parameters():
@@ -38,16 +50,10 @@ def test_scene_with_additional_parameters():
     # The point is just to verify that the constructor doesn't raise an exception
 
 
-def test_scene_repr():
+def test_scene_repr(basic_scene: Scene):
     """Test the string representation of a Scene object."""
-    scene = Scene(
-        sid="1",
-        name="Test Scene",
-        lights=["1", "2", "3"],
-    )
-
     # Check that the repr includes the scene_id, name, and lights
-    repr_str = repr(scene)
+    repr_str = repr(basic_scene)
     assert 'id="1"' in repr_str
     assert 'name="Test Scene"' in repr_str
     assert "lights=[1, 2, 3]" in repr_str
@@ -63,3 +69,17 @@ def test_scene_empty_lights():
     assert scene.scene_id == "1"
     assert scene.name == "Test Scene"
     assert scene.lights == []
+
+
+def test_scene_from_api():
+    """Test building a Scene from a /scenes document entry."""
+    scene = Scene.from_api(
+        "abc",
+        {"name": "Evening", "lights": ["10", "2"], "type": "GroupScene", "image": "x"},
+    )
+
+    assert scene.scene_id == "abc"
+    assert scene.name == "Evening"
+    assert scene.lights == [2, 10]
+    assert scene.type == "GroupScene"
+    assert scene.appdata == {}